@@ -0,0 +1,256 @@
+"""
+gee-toolbox command line interface.
+
+    gee-toolbox ls projects/my-project/assets/folder --recursive
+    gee-toolbox du projects/my-project/assets/folder --json
+    gee-toolbox prune projects/my-project/assets/tmp --recursive --expand-image-collections --yes --workers 16
+    gee-toolbox cp projects/a/assets/src projects/b/assets/dst --qps 20
+
+Only argparse is imported at startup, the asset modules are imported by the commands that need them and Earth Engine
+by the first Earth Engine call, so --help, argument errors and listings served from --cache return immediately.
+"""
+import argparse
+import json
+import sys
+from contextlib import redirect_stdout
+from typing import Any, Dict, List
+
+
+def _initialize(args: argparse.Namespace) -> None:
+    # Configure the shared governor from the global options. Earth Engine is imported and initialized by the first
+    # Earth Engine call, so commands served from the listing cache skip it
+    from gee_toolbox.gee import governor
+
+    def _initialize_ee() -> None:
+        import ee
+
+        ee.Initialize(project=args.project)
+
+    governor.set_initializer(_initialize_ee)
+    if args.qps is not None:
+        governor.set_governor(governor.RequestGovernor(qps=args.qps))
+
+
+def _cache(args: argparse.Namespace) -> Any:
+    if args.cache is None:
+        return None
+    from gee_toolbox.gee.cache import AssetCache
+
+    return AssetCache(args.cache) if args.cache else AssetCache()
+
+
+def _ls(args: argparse.Namespace) -> int:
+    from gee_toolbox.gee import assets
+
+    records = assets.iter_assets(
+        args.parent,
+        asset_types=args.types or [],
+        recursive=args.recursive,
+        inclusive=args.inclusive,
+        expand_image_collections=args.expand_image_collections,
+        workers=args.workers,
+        cache=_cache(args),
+        full_records=args.json,
+    )
+    # Streamed, one line per asset: JSON lines with --json, "TYPE name" otherwise
+    for record in records:
+        if args.json:
+            _out(json.dumps(record))
+        else:
+            _out(f"{record['type']:<16} {record['name']}")
+    return 0
+
+
+def _du(args: argparse.Namespace) -> int:
+    from gee_toolbox.gee import assets, usage
+
+    report = usage.usage_report(
+        args.parent,
+        recursive=args.recursive,
+        workers=args.workers,
+        cache=_cache(args),
+        path=args.output,
+    )
+    if args.json:
+        _out(json.dumps(report))
+    else:
+        for container, container_usage in report.items():
+            _out(f"{assets._format_bytes(container_usage['bytes']):>12} {container_usage['assets']:>10} {container}")
+    return 0
+
+
+def _prune(args: argparse.Namespace) -> int:
+    from gee_toolbox.gee import assets
+
+    if not (args.yes or args.dry_run) and not sys.stdin.isatty():
+        _err("Refusing to delete without confirmation in a non-interactive session, pass --yes or --dry-run")
+        return 2
+    results = assets.prune(
+        args.asset,
+        asset_types=args.types or [],
+        recursive=args.recursive,
+        expand_image_collections=args.expand_image_collections,
+        inclusive=not args.exclusive,
+        silent=args.yes,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        journal=args.journal,
+        resume=args.resume,
+        cache=_cache(args),
+        progress=args.progress,
+    )
+    return _report(args, results)
+
+
+def _cp(args: argparse.Namespace) -> int:
+    from gee_toolbox.gee import transfer
+
+    copy = transfer.move_tree if args.command == "mv" else transfer.copy_tree
+    results = copy(
+        args.src,
+        args.dst,
+        overwrite=args.overwrite,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        cache=_cache(args),
+    )
+    return _report(args, results)
+
+
+def _report(args: argparse.Namespace, results: Dict[str, List[str]]) -> int:
+    # Results dict as JSON with --json, the commands print their own summary otherwise. Exit status 1 if any failed
+    if args.json:
+        _out(json.dumps(results))
+    return 1 if results["failed"] else 0
+
+
+# Output streams, set by main. Command summaries printed by the library go to stderr so stdout only holds results
+_stdout = sys.stdout
+
+
+def _out(line: str) -> None:
+    _stdout.write(line + "\n")
+
+
+def _err(line: str) -> None:
+    sys.stderr.write(line + "\n")
+
+
+def _global_options(parser: argparse.ArgumentParser, suppress: bool = False) -> None:
+    # Options accepted before and after the command. Sub-commands suppress the defaults so they do not reset values
+    # given before the command
+    def _default(value: Any) -> Any:
+        return argparse.SUPPRESS if suppress else value
+
+    parser.add_argument(
+        "--project", default=_default(None), help="Google Cloud project used to initialize Earth Engine"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_default(8),
+        help="Maximum number of concurrent Earth Engine calls (default: 8)",
+    )
+    parser.add_argument(
+        "--qps", type=float, default=_default(None), help="Maximum Earth Engine requests per second (default: 50)"
+    )
+    parser.add_argument(
+        "--json", action="store_true", default=_default(False), help="Machine readable JSON output on stdout"
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        default=_default(None),
+        help="Use the listing cache, at the given path or ~/.cache/gee_toolbox/assets.sqlite",
+    )
+    parser.add_argument("--progress", action="store_true", default=_default(False), help="Show progress on stderr")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser of the gee-toolbox command."""
+    parser = argparse.ArgumentParser(
+        prog="gee-toolbox", description="Manage Google Earth Engine assets in bulk."
+    )
+    _global_options(parser)
+    common = argparse.ArgumentParser(add_help=False)
+    _global_options(common, suppress=True)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def _listing_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument(
+            "--types", nargs="+", metavar="TYPE", help="Asset types: IMAGE TABLE FOLDER IMAGE_COLLECTION"
+        )
+        command.add_argument("-r", "--recursive", action="store_true", help="Include sub-folders")
+        command.add_argument(
+            "-e", "--expand-image-collections", action="store_true", help="Include images in image collections"
+        )
+
+    ls = commands.add_parser("ls", parents=[common], help="List assets (JSON lines with --json)")
+    ls.add_argument("parent", help="Folder or image collection")
+    _listing_options(ls)
+    ls.add_argument("--inclusive", action="store_true", help="Include the parent itself")
+    ls.set_defaults(run=_ls)
+
+    du = commands.add_parser("du", parents=[common], help="Storage usage per container")
+    du.add_argument("parent", help="Folder or image collection")
+    du.add_argument("--no-recursive", dest="recursive", action="store_false", help="Only the parent's own assets")
+    du.add_argument("-o", "--output", help="Also write the report to a .csv or .parquet file")
+    du.set_defaults(run=_du)
+
+    prune = commands.add_parser("prune", parents=[common], help="Delete assets, deepest first")
+    prune.add_argument("asset", help="Asset, folder or image collection")
+    _listing_options(prune)
+    prune.add_argument("--exclusive", action="store_true", help="Keep the top folder or image collection")
+    prune.add_argument("-n", "--dry-run", action="store_true", help="List what would be deleted")
+    prune.add_argument("-y", "--yes", action="store_true", help="Do not ask for confirmation")
+    prune.add_argument("--journal", help="Journal file recording the deletion, required by --resume")
+    prune.add_argument("--resume", action="store_true", help="Resume an interrupted run from --journal")
+    prune.set_defaults(run=_prune)
+
+    for name, help in [("cp", "Copy an asset tree"), ("mv", "Move an asset tree")]:
+        command = commands.add_parser(name, parents=[common], help=help)
+        command.add_argument("src", help="Source asset, folder or image collection")
+        command.add_argument("dst", help="Destination path, its parent must exist")
+        command.add_argument("--overwrite", action="store_true", help="Replace existing images and tables")
+        command.add_argument("-n", "--dry-run", action="store_true", help="List what would be copied")
+        command.set_defaults(run=_cp)
+
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    """Entry point of the gee-toolbox command. Returns the exit status: 0 on success, 1 if any asset failed."""
+    global _stdout
+    args = build_parser().parse_args(argv)
+    if getattr(args, "resume", False) and not args.journal:
+        _err("--resume requires --journal")
+        return 2
+
+    _stdout = sys.stdout
+    try:
+        with redirect_stdout(sys.stderr):
+            _initialize(args)
+            return args.run(args)
+    except (ValueError, ImportError) as e:
+        _err(f"gee-toolbox: error: {e}")
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        # Earth Engine errors left after retries (permissions, quota...) are reported without a traceback. ee is only
+        # imported if a call was made
+        ee = sys.modules.get("ee")
+        if ee is None or not isinstance(e, ee.EEException):
+            raise
+        _err(f"gee-toolbox: error: {e}")
+        return 1
+    finally:
+        from gee_toolbox.gee import governor
+
+        # Not initialized if the command made no Earth Engine call, do not leave it to whoever calls next
+        governor.set_initializer(None)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, List
+
+from gee_toolbox.gee import assets, governor
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.lazy import LazyModule
+
+# Imported on first use, importing ee takes a noticeable part of a second
+ee = LazyModule("ee")
+
+# Member lists of an Earth Engine asset ACL, e.g. {"readers": ["group:team@example.com"]}
+ACL_ROLES = ["owners", "writers", "readers"]
+
+ACL_MODES = ["merge", "replace"]
+
+
+def _check_acl(acl: Dict[str, Any], mode: str) -> None:
+    if mode not in ACL_MODES:
+        raise ValueError(f"Invalid mode {mode}. Allowed modes are {ACL_MODES}")
+    unknown = [key for key in acl if key not in ACL_ROLES + ["all_users_can_read"]]
+    if unknown:
+        raise ValueError(f"Unknown ACL keys {unknown}. Allowed keys are {ACL_ROLES + ['all_users_can_read']}")
+
+
+def _apply_acl(current: Dict[str, Any], acl: Dict[str, Any], mode: str) -> Dict[str, Any]:
+    # New ACL of an asset. merge adds the members of acl to each role, replace sets the roles given in acl.
+    # Roles not given in acl are kept as they are in both modes, so owners are never dropped by omission
+    new = {role: list(current.get(role, [])) for role in ACL_ROLES}
+    for role in ACL_ROLES:
+        if role not in acl:
+            continue
+        if mode == "replace":
+            new[role] = list(acl[role])
+        else:
+            new[role] += [member for member in acl[role] if member not in new[role]]
+    new["all_users_can_read"] = acl.get(
+        "all_users_can_read", current.get("all_users_can_read", False)
+    )
+    return new
+
+
+def _same_acl(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    return all(set(a.get(role, [])) == set(b.get(role, [])) for role in ACL_ROLES) and bool(
+        a.get("all_users_can_read")
+    ) == bool(b.get("all_users_can_read"))
+
+
+def _get_acl(asset: str) -> Dict[str, Any] | None:
+    try:
+        return governor.call(ee.data.getAssetAcl, asset)
+    except Exception as e:
+        logging.warning(e)
+        return None
+
+
+def _set_acl(asset: str, acl: Dict[str, Any]) -> bool:
+    # setAssetAcl replaces the whole ACL, so retrying it is safe
+    try:
+        governor.call(ee.data.setAssetAcl, asset, acl)
+        return True
+    except Exception as e:
+        logging.warning(e)
+        return False
+
+
+def set_acl_tree(
+    parent: str,
+    acl: Dict[str, Any],
+    mode: str = "merge",
+    asset_types: str | List[str] = [],
+    expand_image_collections: bool = False,
+    dry_run: bool = False,
+    workers: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Sets the ACL of a folder or image collection and of every asset below it.
+
+    The tree is walked with iter_assets and processed in batches: the current ACLs of a batch are read concurrently,
+    the new ACL of each asset is computed, and only assets whose ACL actually changes are updated, concurrently. Every
+    call goes through the shared rate limiter and transient errors are retried.
+
+    Args:
+        parent: Path of the folder or image collection. It is included.
+        acl: ACL to apply, with any of "owners", "writers", "readers" (lists of members such as "user:a@example.com"
+            or "group:team@example.com") and "all_users_can_read" (bool).
+        mode: "merge" adds the members of acl to the existing ones. "replace" sets the roles given in acl, dropping
+            other members of those roles. Roles not given in acl are left as they are in both modes.
+        asset_types: Asset types to update. If empty, all asset types are updated.
+        expand_image_collections: Also update the images inside image collections. By default image collections are
+            updated as a whole.
+        dry_run: Compute the changes without applying them.
+        workers: Maximum number of concurrent Earth Engine calls.
+        cache: Optional AssetCache used to list the tree.
+
+    Returns:
+        Dict with the assets "updated", "unchanged" (ACL already as requested), "failed" (ACL could not be read or
+        set) and "skipped" (would be updated, on a dry run).
+
+    Raises:
+        ValueError: If mode or acl keys are invalid, or parent is not a Folder or Image Collection.
+    """
+
+    _check_acl(acl, mode)
+    records = assets.iter_assets(
+        parent,
+        asset_types=asset_types,
+        recursive=True,
+        inclusive=True,
+        expand_image_collections=expand_image_collections,
+        workers=workers,
+        cache=cache,
+    )
+    results = {"updated": [], "unchanged": [], "failed": [], "skipped": []}
+
+    def _update(item: tuple) -> bool:
+        return _set_acl(*item)
+
+    batch_size = max(1, workers) * 100
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while True:
+            names = assets.get_asset_names(islice(records, batch_size))
+            if not names:
+                break
+
+            changes = []
+            for name, current in zip(names, executor.map(_get_acl, names)):
+                if current is None:
+                    results["failed"].append(name)
+                    continue
+                new = _apply_acl(current, acl, mode)
+                if _same_acl(current, new):
+                    results["unchanged"].append(name)
+                else:
+                    changes.append((name, new))
+
+            if dry_run:
+                results["skipped"] += [name for name, _ in changes]
+                continue
+            for (name, _), updated in zip(changes, executor.map(_update, changes)):
+                results["updated" if updated else "failed"].append(name)
+
+    if dry_run:
+        print(f"Dry run, ACL of {len(results['skipped'])} items would be updated in {parent}")
+    else:
+        print(
+            f"Updated ACL of {len(results['updated'])} items, {len(results['unchanged'])} items unchanged, "
+            f"{len(results['failed'])} items failed"
+        )
+    return results
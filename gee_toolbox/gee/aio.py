@@ -0,0 +1,381 @@
+"""
+asyncio equivalents of the asset functions in gee_toolbox.gee.assets.
+
+The Earth Engine client is synchronous, so every call runs in a worker thread (asyncio.to_thread) while a semaphore
+bounds the number of calls in flight. Filtering, ordering and option validation are the ones of the sync functions.
+Cancelling a task stops the traversal or the deletion at the next call: calls already running in a thread finish,
+their result is discarded.
+"""
+import asyncio
+import logging
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+from gee_toolbox.gee import assets, where as _where
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.inventory import AssetIndex
+
+
+class _AsyncLister:
+    # asyncio counterpart of assets._ConcurrentLister: lists sub-containers ahead of the consumer in breadth-first
+    # order, at most `concurrency` calls in flight and `lookahead` listings held. Runs on a single event loop, no locks
+
+    def __init__(
+        self,
+        page_size: int,
+        concurrency: int,
+        expands: Callable[[str], bool],
+        cache: AssetCache | None = None,
+        lookahead: int | None = None,
+        image_filter: str | None = None,
+    ):
+        self._page_size = page_size
+        self._expands = expands
+        self._cache = cache
+        self._image_filter = image_filter
+        self._lookahead = lookahead or concurrency * 4
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._queued: Dict[str, str] = {}
+        self._listings: Dict[str, asyncio.Task] = {}
+
+    def _submit_queued(self) -> None:
+        while self._queued and len(self._listings) < self._lookahead:
+            container = next(iter(self._queued))
+            container_type = self._queued.pop(container)
+            self._listings[container] = asyncio.ensure_future(self._list(container, container_type))
+
+    async def _list(self, container: str, container_type: str) -> List[Dict[str, Any]]:
+        async with self._semaphore:
+            children = await asyncio.to_thread(
+                lambda: list(
+                    assets._iter_container(
+                        container, container_type, self._page_size, self._cache, self._image_filter
+                    )
+                )
+            )
+        for child_asset in children:
+            if self._expands(child_asset["type"]):
+                self._queued[child_asset["name"]] = child_asset["type"]
+        self._submit_queued()
+        return children
+
+    async def children(self, container: str, container_type: str) -> List[Dict[str, Any]]:
+        if container not in self._listings:
+            self._queued.pop(container, None)
+            self._listings[container] = asyncio.ensure_future(self._list(container, container_type))
+        try:
+            return await self._listings[container]
+        finally:
+            del self._listings[container]
+            self._submit_queued()
+
+    async def aclose(self) -> None:
+        # Cancel listings still pending, e.g. when the consumer stops or is cancelled
+        self._queued.clear()
+        pending = list(self._listings.values())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def aiter_assets(
+    parent: str,
+    asset_types: str | list = [],
+    recursive: bool = False,
+    inclusive: bool = False,
+    expand_image_collections: bool = False,
+    image_collections_exclusively: bool = False,
+    page_size: int = assets.DEFAULT_PAGE_SIZE,
+    concurrency: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async iterator over assets from an assets folder or Image Collection in GEE. Same arguments, output and order as
+    assets.iter_assets.
+
+    Args:
+        parent: path to the parent folder of the assets
+        asset_types: asset types to list. ['IMAGE', 'TABLE', 'FOLDER', 'IMAGE_COLLECTION']. If empty, all asset types are listed
+        recursive: Recursively search for assets in sub-folders
+        inclusive: Include the parent folder in the list
+        expand_image_collections: Include images inside Image Collections
+        image_collections_exclusively: Only include images that are inside an Image Collection
+        page_size: Number of assets requested per listAssets call
+        concurrency: Maximum number of listAssets calls in flight
+        cache: Optional AssetCache consulted before calling listAssets
+        full_records: Yield the complete listAssets records instead of {"name", "type"}
+        filter, start_time, end_time, region: Server side filters on the images of image collections, see
+            assets.iter_assets
+    """
+
+    asset_types = assets._check_asset_types(asset_types)
+    parent = assets._asset_id(parent)
+    parent_record = await asyncio.to_thread(
+        assets._get_container, parent, cache, full_records
+    )
+    async for item in _aiter_assets(
+        parent,
+        parent_record["type"],
+        asset_types,
+        recursive,
+        inclusive,
+        expand_image_collections,
+        image_collections_exclusively,
+        page_size,
+        concurrency,
+        cache,
+        full_records=full_records,
+        parent_record=parent_record,
+        image_filter=assets._image_filter(filter, start_time, end_time, region),
+    ):
+        yield item
+
+
+async def _aiter_assets(
+    parent: str,
+    parent_type: str,
+    asset_types: List[str],
+    recursive: bool,
+    inclusive: bool,
+    expand_image_collections: bool,
+    image_collections_exclusively: bool,
+    page_size: int = assets.DEFAULT_PAGE_SIZE,
+    concurrency: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    parent_record: Dict[str, Any] | None = None,
+    image_filter: str | None = None,
+    index: AssetIndex | None = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    # aiter_assets for callers that already validated asset_types and know the parent type, like assets._iter_assets.
+    # With an index, containers are read from it instead of being listed
+    if image_filter:
+        image_collections_exclusively = True
+
+    parent_item = assets._inclusive_record(
+        parent, parent_type, asset_types, inclusive, full_records, parent_record
+    )
+    if parent_item is not None:
+        yield parent_item
+
+    expands = assets._expands_predicate(parent_type, recursive, expand_image_collections)
+    lister = _AsyncLister(page_size, concurrency, expands, cache=cache, image_filter=image_filter)
+    steps = assets._walk_steps(
+        parent, parent_type, asset_types, image_collections_exclusively, expands, full_records
+    )
+    try:
+        reply = None
+        while True:
+            try:
+                kind, value = steps.send(reply)
+            except StopIteration:
+                return
+            if kind == "children":
+                reply = index.children(value[0]) if index is not None else await lister.children(*value)
+            else:
+                reply = None
+                yield value
+    finally:
+        await lister.aclose()
+
+
+async def alist_assets(
+    parent: str,
+    asset_types: str | list = [],
+    recursive: bool = False,
+    inclusive: bool = False,
+    expand_image_collections: bool = False,
+    image_collections_exclusively: bool = False,
+    page_size: int = assets.DEFAULT_PAGE_SIZE,
+    concurrency: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+) -> List[Dict[str, Any]]:
+    """
+    Lists assets from an assets folder or Image Collection in GEE. Async equivalent of assets.list_assets, see
+    aiter_assets for the arguments.
+    """
+    return [
+        item
+        async for item in aiter_assets(
+            parent,
+            asset_types=asset_types,
+            recursive=recursive,
+            inclusive=inclusive,
+            expand_image_collections=expand_image_collections,
+            image_collections_exclusively=image_collections_exclusively,
+            page_size=page_size,
+            concurrency=concurrency,
+            cache=cache,
+            full_records=full_records,
+            filter=filter,
+            start_time=start_time,
+            end_time=end_time,
+            region=region,
+        )
+    ]
+
+
+async def _aiter_matching(
+    records: AsyncIterator[Dict[str, Any]], where: _where.Where, concurrency: int
+) -> AsyncIterator[Dict[str, Any]]:
+    # Async counterpart of where.iter_matching: records are selected as they are listed, the metadata of each batch
+    # is fetched in a worker thread
+    selection = _where._Selection(where)
+    batch_size = max(1, concurrency) * 50
+
+    async def _flush(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        completed = await asyncio.to_thread(_where._complete, batch, where, concurrency)
+        return [selected for record in completed for selected in selection.add(record)]
+
+    batch: List[Dict[str, Any]] = []
+    async for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            for selected in await _flush(batch):
+                yield selected
+            batch = []
+    if batch:
+        for selected in await _flush(batch):
+            yield selected
+    for selected in selection.close():
+        yield selected
+
+
+async def _aiter_records(records: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    for record in records:
+        yield record
+
+
+async def _adelete_level(names: List[str], concurrency: int, missing_ok: bool = False) -> List[bool]:
+    # Delete one hierarchy level with at most `concurrency` deletes in flight. Outcomes are returned in input order
+    outcomes = [False] * len(names)
+    pending = iter(enumerate(names))
+
+    async def _worker() -> None:
+        for i, name in pending:
+            outcomes[i] = await asyncio.to_thread(assets._delete_asset, name, missing_ok)
+
+    await asyncio.gather(*[_worker() for _ in range(min(concurrency, len(names)))])
+    return outcomes
+
+
+async def aprune(
+    asset: str,
+    asset_types: str | List[str] = [],
+    recursive: bool = False,
+    expand_image_collections: bool = False,
+    inclusive: bool = True,
+    dry_run: bool = False,
+    concurrency: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+    where: _where.Where | None = None,
+    index: AssetIndex | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Deletes Google Earth Engine assets. Async equivalent of assets.prune, with the same options, validation,
+    planning, deepest-first ordering and results.
+
+    There is no confirmation prompt: the deletion warning is logged and assets are deleted right away, use dry_run=True
+    to check the plan first. If the task is cancelled, no new deletion starts and CancelledError is raised once the
+    deletions already running have finished.
+
+    Args:
+        asset: The path to the asset.
+        asset_types: One or more asset types to delete. An empty list [] deletes all asset types.
+        recursive: Whether to include sub-folders recursively. Required if deleting folders.
+        expand_image_collections: Whether to include images in image collections.
+            Required if deleting folders or image collections.
+        inclusive: Whether to include the top asset if asset is a folder or image collection.
+        dry_run: List all assets to delete without deleting them.
+        concurrency: Maximum number of concurrent Earth Engine calls, for listing and deleting.
+        cache: Optional AssetCache used to list the assets. Deleted assets are invalidated in it.
+        filter, start_time, end_time, region: Only delete the matching images of image collections, see assets.prune.
+            Require asset_types='IMAGE'.
+        where: Only delete the assets selected by this function or spec, evaluated while the tree is listed, see
+            assets.prune.
+        index: AssetIndex of an earlier listing of the tree to select the assets from, see assets.prune.
+
+    Returns:
+        Dict with "deleted", "failed" and "skipped" lists, like assets.prune.
+    """
+
+    root = assets._asset_id(asset)
+    results = {"deleted": [], "failed": [], "skipped": []}
+
+    if where is not None:
+        _where.check_where(where)
+    if index is not None and root in index:
+        root_type = index.type(root)
+    else:
+        root_type = await asyncio.to_thread(assets._get_asset_type, root, cache)
+    asset_types, image_collections_exclusively, image_filter = assets._check_prune_plan(
+        asset_types,
+        root_type,
+        recursive,
+        expand_image_collections,
+        filter,
+        start_time,
+        end_time,
+        region,
+        where,
+        index,
+    )
+    is_container = assets._is_project(root) or root_type in ["FOLDER", "IMAGE_COLLECTION"]
+    index_plan = assets._index_prune_plan(root, inclusive, asset_types, where, index) if is_container else None
+
+    if index_plan is not None:
+        asset_list, assets_ordered, size_bytes = index_plan
+    else:
+        if is_container:
+            records = _aiter_assets(
+                root,
+                root_type,
+                asset_types,
+                recursive=recursive,
+                inclusive=inclusive,
+                expand_image_collections=expand_image_collections,
+                image_collections_exclusively=image_collections_exclusively,
+                concurrency=concurrency,
+                cache=cache,
+                full_records=True,
+                image_filter=image_filter,
+                index=index,
+            )
+        else:
+            records = _aiter_records([{"name": root, "type": root_type}])
+        if where is not None:
+            records = _aiter_matching(records, where, concurrency)
+        listed = assets._PrunePlan(root)
+        async for record in records:
+            listed.add(record)
+        asset_list, size_bytes = listed.asset_list, listed.size_bytes
+        assets_ordered = assets._order_by_level(assets.get_asset_names(asset_list))
+
+    logging.info(assets._make_del_warning(root, assets.get_asset_types(asset_list), size_bytes))
+
+    if dry_run:
+        results["skipped"] = assets.get_asset_names(asset_list)
+        return results
+
+    # delete all items starting from the more nested ones, one level at a time. An index may be older than the tree
+    for names in assets_ordered.values():
+        for name, deleted in zip(names, await _adelete_level(names, concurrency, missing_ok=index is not None)):
+            results["deleted" if deleted else "failed"].append(name)
+            if cache is not None and deleted:
+                cache.invalidate(name)
+
+    return results
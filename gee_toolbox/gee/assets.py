@@ -1,7 +1,44 @@
-import ee
-from geetools.Asset import Asset
+import json
 import logging
-from typing import List, Dict, Any
+import os
+import threading
+from datetime import date, datetime, timezone
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import PurePosixPath
+from typing import List, Dict, Any, Callable, Generator, Iterable, Iterator, Tuple
+
+from gee_toolbox.gee import governor
+from gee_toolbox.gee import progress as _progress
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.inventory import AssetIndex, AssetInventory
+from gee_toolbox.gee.journal import PruneJournal
+from gee_toolbox.gee.lazy import LazyModule
+
+# Imported on first use, importing ee takes a noticeable part of a second
+ee = LazyModule("ee")
+
+
+def __getattr__(name: str) -> Any:
+    # geetools Asset used to be imported here, keep assets.Asset working without importing geetools at startup
+    if name == "Asset":
+        from geetools.Asset import Asset
+
+        return Asset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _asset_id(path: str) -> str:
+    # Normalized asset path, same as geetools Asset(path).as_posix(): no leading, trailing or duplicate slashes
+    return PurePosixPath(str(path)).as_posix().lstrip("/")
+
+
+def _is_project(path: str) -> bool:
+    # Project root, e.g. projects/my-project/assets, same as geetools Asset(path).is_project()
+    parts = _asset_id(path).split("/")
+    return len(parts) == 3 and parts[0] == "projects" and parts[2] == "assets"
 
 
 def _request_del_confirmation() -> bool:
@@ -17,7 +54,15 @@ def _request_del_confirmation() -> bool:
     return delete_confirmation == "y"
 
 
-def _make_del_warning(asset: str, objects_list: list) -> str:
+def _format_bytes(size: float) -> str:
+    # Human readable size, e.g. 1.5 GiB
+    for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
+        if size < 1024 or unit == "TiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+
+
+def _make_del_warning(asset: str, objects_list: list, size_bytes: int | None = None) -> str:
     # count items in asset_types that are equal to type 'IMAGE_COLLECTION'
     image_collections = len(
         [type for type in objects_list if type == "IMAGE_COLLECTION"]
@@ -34,8 +79,10 @@ def _make_del_warning(asset: str, objects_list: list) -> str:
         f"-Image Collections: {image_collections}\n"
         f"-Tables: {tables}\n"
         f"-Folders: {folders}\n"
-        f"Target: {asset}\n"
     )
+    if size_bytes is not None:
+        warn_text += f"-Storage to be freed: {_format_bytes(size_bytes)}\n"
+    warn_text += f"Target: {asset}\n"
     return warn_text
 
 
@@ -67,6 +114,460 @@ def get_asset_types(asset_list: list) -> List:
     return [asset["type"] for asset in asset_list]
 
 
+# Default number of records requested per listAssets call. Keeps memory bounded on very large image collections
+DEFAULT_PAGE_SIZE = 1000
+
+# Default number of concurrent Earth Engine calls used by list_assets and prune
+DEFAULT_WORKERS = 8
+
+
+def _iter_pages(
+    parent: str, page_size: int = DEFAULT_PAGE_SIZE, filter: str | None = None
+) -> Iterator[List[Dict[str, Any]]]:
+    # Yield the direct children of a container one page at a time, following nextPageToken until exhausted.
+    # filter is evaluated by Earth Engine, only on image collections
+    params = {"parent": parent, "pageSize": page_size}
+    if filter:
+        params["filter"] = filter
+    # ee.data.listAssets modifies params in place (e.g. project roots lose their /assets suffix),
+    # send a fresh copy on every attempt so retries request the same path
+    @governor.endpoint("listAssets")
+    def _list_page() -> Dict[str, Any]:
+        return ee.data.listAssets(dict(params))
+
+    while True:
+        try:
+            response = governor.call(_list_page)
+        except ee.EEException as e:
+            logging.warning(e)
+            raise e
+
+        yield response.get("assets", [])
+
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+        params["pageToken"] = page_token
+
+
+def _iter_children(
+    parent: str, page_size: int = DEFAULT_PAGE_SIZE, cache: AssetCache | None = None
+) -> Iterator[Dict[str, Any]]:
+    # Yield the direct children of a container, from the cache if it holds a fresh listing of it
+    if cache is None:
+        for page in _iter_pages(parent, page_size):
+            yield from page
+    elif cache.has_children(parent):
+        yield from cache.iter_children(parent, page_size)
+    else:
+        yield from cache.store_children(parent, _iter_pages(parent, page_size))
+
+
+def _iter_container(
+    container: str,
+    container_type: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cache: AssetCache | None = None,
+    image_filter: str | None = None,
+) -> Iterator[Dict[str, Any]]:
+    # Yield the children of a container, applying image_filter server side to image collections.
+    # Filtered listings are partial, they are neither read from nor stored in the cache
+    if image_filter and container_type == "IMAGE_COLLECTION":
+        for page in _iter_pages(container, page_size, image_filter):
+            yield from page
+    else:
+        yield from _iter_children(container, page_size, cache)
+
+
+def _format_time(value: str | date | datetime) -> str:
+    # RFC 3339 timestamp for a listAssets filter. Naive datetimes and dates are taken as UTC
+    if isinstance(value, str):
+        return value
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="milliseconds") + "Z"
+
+
+def _format_region(region: Any) -> str:
+    # GeoJSON string of a region given as GeoJSON dict / string or a client side ee.Geometry
+    if isinstance(region, str):
+        return region
+    if hasattr(region, "toGeoJSON"):
+        region = region.toGeoJSON()
+    return json.dumps(region, separators=(",", ":"))
+
+
+def _image_filter(
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+) -> str | None:
+    # Combine the image filter options into one listAssets filter expression (https://google.aip.dev/160),
+    # None if there is nothing to filter
+    terms = []
+    if filter:
+        terms.append(f"({filter})")
+    if start_time is not None:
+        terms.append(f'startTime >= "{_format_time(start_time)}"')
+    if end_time is not None:
+        terms.append(f'startTime < "{_format_time(end_time)}"')
+    if region is not None:
+        terms.append(f"intersects({json.dumps(_format_region(region))})")
+    return " AND ".join(terms) or None
+
+
+def _get_asset(asset: str) -> Dict[str, Any]:
+    # Fetch asset metadata. Raise ValueError like geetools Asset.exists if it does not exist or cannot be accessed
+    try:
+        return governor.call(ee.data.getAsset, asset)
+    except ee.EEException as e:
+        if governor.is_retryable_error(e):
+            raise e
+        raise ValueError(f"Asset {asset} does not exist or you don't have access") from e
+
+
+def _get_asset_type(asset: str, cache: AssetCache | None = None) -> str:
+    # Return the type of an asset, from the cache if it is known there
+    if cache is None:
+        return _get_asset(asset)["type"]
+    asset_type = cache.get_type(asset)
+    if asset_type is None:
+        asset_type = _get_asset(asset)["type"]
+        cache.put_type(asset, asset_type)
+    return asset_type
+
+
+def _get_container(
+    parent: str, cache: AssetCache | None = None, full_record: bool = False
+) -> Dict[str, Any]:
+    # Return the {"name", "type"} record of parent, or its full metadata if full_record=True.
+    # Raise an error if it is not a Folder or Image Collection
+    try:
+        if full_record:
+            record = _get_asset(parent)
+        else:
+            record = {"name": parent, "type": _get_asset_type(parent, cache)}
+        if record["type"] not in ["FOLDER", "IMAGE_COLLECTION"]:
+            raise ValueError("Path provided is not a Folder or Image Collection")
+    except (ValueError, ee.EEException) as e:
+        logging.error(e)
+        raise e
+    return record
+
+
+class _ConcurrentLister:
+    # Lists containers through a bounded pool of workers in breadth-first order.
+    # Sub-containers found in a listing are queued and listed ahead of the consumer, but at most `lookahead` listings
+    # are held (in flight or done and not yet consumed) at any time. Each held listing is a container's full list of
+    # children, so memory is bounded by lookahead x the largest container, not by the size of the tree.
+    # Use as a context manager, pending listings are cancelled on exit.
+
+    def __init__(
+        self,
+        page_size: int,
+        workers: int,
+        expands: Callable[[str], bool],
+        lookahead: int | None = None,
+        cache: AssetCache | None = None,
+        image_filter: str | None = None,
+    ):
+        self._page_size = page_size
+        self._cache = cache
+        self._image_filter = image_filter
+        self._expands = expands
+        self._lookahead = lookahead or workers * 4
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # Discovered containers (name -> type) waiting for a free slot, in discovery (breadth-first) order
+        self._queued: Dict[str, str] = {}
+        # Submitted listings not yet consumed
+        self._listings: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "_ConcurrentLister":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_queued(self) -> None:
+        # Submit queued containers while there are free slots. Call with the lock held
+        while self._queued and len(self._listings) < self._lookahead:
+            container = next(iter(self._queued))
+            container_type = self._queued.pop(container)
+            self._listings[container] = self._executor.submit(self._list, container, container_type)
+
+    def _list(self, container: str, container_type: str) -> List[Dict[str, Any]]:
+        children = list(
+            _iter_container(container, container_type, self._page_size, self._cache, self._image_filter)
+        )
+        # Queue sub-containers before the listing is marked done, so the consumer never requests one that is not
+        # known yet and no container is listed twice
+        with self._lock:
+            for child_asset in children:
+                if self._expands(child_asset["type"]):
+                    self._queued[child_asset["name"]] = child_asset["type"]
+            try:
+                self._submit_queued()
+            except RuntimeError:
+                # Executor was shut down, the walk has been abandoned
+                pass
+        return children
+
+    def children(self, container: str, container_type: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            if container not in self._listings:
+                # The consumer is waiting on it, list it even if the look-ahead is full
+                self._queued.pop(container, None)
+                self._listings[container] = self._executor.submit(self._list, container, container_type)
+            future = self._listings[container]
+        try:
+            return future.result()
+        finally:
+            # Free the slot and start the next queued listing
+            with self._lock:
+                del self._listings[container]
+                self._submit_queued()
+
+
+def _expands_predicate(
+    parent_type: str, recursive: bool, expand_image_collections: bool
+) -> Callable[[str], bool]:
+    # Return a function telling whether the walk goes down into a child container of the given type
+
+    # If parent is an image collection, expand_image_collections is forced to True
+    if parent_type == "IMAGE_COLLECTION":
+        expand_image_collections = True
+
+    def _expands(asset_type: str) -> bool:
+        return (recursive and asset_type == "FOLDER") or (
+            expand_image_collections and asset_type == "IMAGE_COLLECTION"
+        )
+
+    return _expands
+
+
+def _inclusive_record(
+    parent: str,
+    parent_type: str,
+    asset_types: List[str],
+    inclusive: bool,
+    full_records: bool = False,
+    parent_record: Dict[str, Any] | None = None,
+) -> Dict[str, Any] | None:
+    # Record of the parent container if it is part of the output (inclusive=True), else None
+    if not inclusive or parent_type not in asset_types:
+        return None
+    if full_records and parent_record is not None:
+        return parent_record
+    return {"name": parent, "type": parent_type}
+
+
+def _walk_steps(
+    parent: str,
+    parent_type: str,
+    asset_types: List[str],
+    image_collections_exclusively: bool,
+    expands: Callable[[str], bool],
+    full_records: bool = False,
+) -> Generator[Tuple[str, Any], List[Dict[str, Any]] | None, None]:
+    # Depth-first walk written without I/O so the sync and async APIs share the filtering and ordering logic.
+    # Yields ("children", (container, container_type)) and expects the children of that container to be sent back,
+    # and ("asset", record) for every asset in the output. Only the open containers are held in memory
+    children = yield ("children", (parent, parent_type))
+    stack = [(parent_type, iter(children))]
+    while stack:
+        container_type, children = stack[-1]
+        child_asset = next(children, None)
+        if child_asset is None:
+            stack.pop()
+            continue
+
+        child_type = child_asset["type"]
+
+        # if not image_collections_exclusively, include everything
+        if (
+            not image_collections_exclusively
+            or child_type != "IMAGE"
+            or container_type == "IMAGE_COLLECTION"
+        ) and child_type in asset_types:
+            if full_records:
+                yield ("asset", child_asset)
+            else:
+                yield ("asset", {"name": child_asset["name"], "type": child_type})
+
+        # Go down into sub-folders and image collections before moving to the next sibling
+        if expands(child_type):
+            children = yield ("children", (child_asset["name"], child_type))
+            stack.append((child_type, iter(children)))
+
+
+def _walk_assets(
+    parent: str,
+    parent_type: str,
+    asset_types: List[str],
+    image_collections_exclusively: bool,
+    expands: Callable[[str], bool],
+    children_of: Callable[[str, str], Iterable[Dict[str, Any]]],
+    full_records: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    # Drive _walk_steps, listing containers with children_of
+    steps = _walk_steps(
+        parent, parent_type, asset_types, image_collections_exclusively, expands, full_records
+    )
+    reply = None
+    while True:
+        try:
+            kind, value = steps.send(reply)
+        except StopIteration:
+            return
+        if kind == "children":
+            reply = children_of(*value)
+        else:
+            reply = None
+            yield value
+
+
+def iter_assets(
+    parent: str,
+    asset_types: str | list = [],
+    recursive: bool = False,
+    inclusive: bool = False,
+    expand_image_collections: bool = False,
+    image_collections_exclusively: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = 1,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over assets from an assets folder or Image Collection in GEE. Same arguments and output as list_assets,
+    but assets are yielded as soon as each page of results arrives instead of being collected into a list.
+
+    Args:
+        parent: path to the parent folder of the assets
+        asset_type: asset types to list. ['IMAGE', 'TABLE', 'FOLDER', 'IMAGE_COLLECTION']. If empty, all asset types are listed
+        recursive: Recursively search for assets in sub-folders
+        inclusive: Include the parent folder in the list
+        expand_image_collections: Include images inside Image Collections
+        image_collections_exclusively: Only include images that are inside an Image Collection
+        page_size: Number of assets requested per listAssets call
+        workers: Maximum number of listAssets calls in flight. With workers=1 containers are listed lazily one page
+            at a time (constant memory). With more workers, sub-folders and image collections are listed concurrently
+            ahead of the iteration and output order is the same, but memory is not constant: up to 4 x workers
+            complete container listings are held at once. Use workers=1 to stream huge image collections.
+        cache: Listing cache. Containers with a fresh cached listing are read from it, others are listed and stored.
+        full_records: Yield the complete listAssets records (updateTime, sizeBytes, properties, ...) instead of
+            {"name", "type"}. Records read from the cache only hold name, type and updateTime.
+        filter: Filter expression evaluated by Earth Engine on the images of image collections, e.g.
+            'properties.cloud_cover < 10' (syntax: https://google.aip.dev/160). Only matching images are transferred
+        start_time: Only list images of image collections starting at or after this time (str, date or datetime, UTC)
+        end_time: Only list images of image collections starting before this time (str, date or datetime, UTC)
+        region: Only list images of image collections intersecting this region (GeoJSON dict or ee.Geometry)
+        Images stored directly in folders cannot be filtered by Earth Engine: when any of filter, start_time, end_time
+            or region is set they are left out, as with image_collections_exclusively=True
+
+    Raises:
+        ValueError: If parent is not a Folder or Image Collection. Raised on call, not on first iteration.
+    """
+
+    asset_types = _check_asset_types(asset_types)
+    parent = _asset_id(parent)
+    parent_record = _get_container(parent, cache, full_record=full_records)
+    image_filter = _image_filter(filter, start_time, end_time, region)
+
+    return _iter_assets(
+        parent,
+        parent_record["type"],
+        asset_types,
+        recursive,
+        inclusive,
+        expand_image_collections,
+        image_collections_exclusively,
+        page_size,
+        workers,
+        cache,
+        full_records=full_records,
+        parent_record=parent_record,
+        image_filter=image_filter,
+    )
+
+
+def _iter_assets(
+    parent: str,
+    parent_type: str,
+    asset_types: List[str],
+    recursive: bool,
+    inclusive: bool,
+    expand_image_collections: bool,
+    image_collections_exclusively: bool,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = 1,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    parent_record: Dict[str, Any] | None = None,
+    image_filter: str | None = None,
+    index: AssetIndex | None = None,
+) -> Iterator[Dict[str, Any]]:
+    # iter_assets for callers that already validated asset_types and know the parent type.
+    # image_filter is a listAssets filter expression built with _image_filter. With an index, containers are read
+    # from it instead of being listed
+    _expands = _expands_predicate(parent_type, recursive, expand_image_collections)
+
+    # Images outside image collections cannot be filtered server side, leave them out
+    if image_filter:
+        image_collections_exclusively = True
+
+    # if Inclusive is True add container info first
+    parent_item = _inclusive_record(
+        parent, parent_type, asset_types, inclusive, full_records, parent_record
+    )
+    if parent_item is not None:
+        yield parent_item
+
+    if index is not None:
+        yield from _walk_assets(
+            parent,
+            parent_type,
+            asset_types,
+            image_collections_exclusively,
+            _expands,
+            lambda container, container_type: index.children(container),
+            full_records,
+        )
+    elif workers > 1:
+        with _ConcurrentLister(
+            page_size, workers, _expands, cache=cache, image_filter=image_filter
+        ) as lister:
+            yield from _walk_assets(
+                parent,
+                parent_type,
+                asset_types,
+                image_collections_exclusively,
+                _expands,
+                lister.children,
+                full_records,
+            )
+    else:
+        yield from _walk_assets(
+            parent,
+            parent_type,
+            asset_types,
+            image_collections_exclusively,
+            _expands,
+            lambda container, container_type: _iter_container(
+                container, container_type, page_size, cache, image_filter
+            ),
+            full_records,
+        )
+
+
 # Creating alternative function to list assets to include filtering by asset type and inclusion/exclusion of parent folder
 def list_assets(
     parent: str,
@@ -75,7 +576,17 @@ def list_assets(
     inclusive: bool = False,
     expand_image_collections: bool = False,
     image_collections_exclusively: bool = False,
-) -> List:
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+    full_records: bool = False,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+    progress: bool | _progress.ProgressCallback | None = None,
+    as_inventory: bool = False,
+) -> List | AssetInventory:
     """
     lists assets from an assets folder or Image Collection in GEE. User can specify what type of assets to list.
 
@@ -84,84 +595,325 @@ def list_assets(
         asset_type: asset types to list. ['IMAGE', 'TABLE', 'FOLDER', 'IMAGE_COLLECTION']. If empty, all asset types are listed
         recursive: Recursively search for assets in sub-folders
         inclusive: Include the parent folder in the list
+        page_size: Number of assets requested per listAssets call. All pages are always listed
+        workers: Maximum number of concurrent listAssets calls when listing sub-folders and image collections.
+            The result is a list anyway, use iter_assets(workers=1) for constant-memory traversal
+        cache: Optional AssetCache consulted before calling listAssets
+        full_records: Keep the complete listAssets records instead of reducing them to {"name", "type"}
+        filter, start_time, end_time, region: Server side filters on the images of image collections, see iter_assets
+        progress: Report listing progress: True renders it on stderr, or a callback receiving progress events
+            (see progress.Progress)
+        as_inventory: Return a compact AssetInventory instead of a list of dicts, for listings of millions of assets.
+            It keeps name, type, depth and sizeBytes (with full_records=True)
 
     reference: https://github.com/spatialthoughts/projects/blob/master/ee-python/list_all_assets.py
     """
 
     # TODO - IF parent is image collection, should expand_image_collections be forced to true?
-    # TODO - Add handler for when results are paginated
     # TODO - IF list is empty should this fail??
 
-    asset_types = _check_asset_types(asset_types)
+    records = iter_assets(
+        parent,
+        asset_types=asset_types,
+        recursive=recursive,
+        inclusive=inclusive,
+        expand_image_collections=expand_image_collections,
+        image_collections_exclusively=image_collections_exclusively,
+        page_size=page_size,
+        workers=workers,
+        cache=cache,
+        full_records=full_records,
+        filter=filter,
+        start_time=start_time,
+        end_time=end_time,
+        region=region,
+    )
+    asset_list = AssetInventory() if as_inventory else []
+    listing = _progress.stage("list", _progress.resolve(progress))
+    if listing is None:
+        asset_list.extend(records)
+        return asset_list
+    with listing:
+        for record in records:
+            asset_list.append(record)
+            listing.update()
+    return asset_list
 
-    # If Asset is not a folder or image collection raise error
-    try:
-        _parent = Asset(parent)
-        parent_type = _parent.type
-        if parent_type not in ["FOLDER", "IMAGE_COLLECTION"]:
-            raise ValueError("Path provided is not a Folder or Image Collection")
-    except (ValueError, ee.EEException) as e:
-        logging.error(e)
-        raise e
 
-    # If parent is an image collection, expand_image_collections is forced to True
-    if parent_type == "IMAGE_COLLECTION":
-        expand_image_collections = True
+# Default number of asset metadata records kept in memory by get_assets_metadata
+DEFAULT_METADATA_CACHE_SIZE = 100_000
+
+
+class _LRUCache:
+    # Thread safe least recently used cache
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+_metadata_cache = _LRUCache(DEFAULT_METADATA_CACHE_SIZE)
+
+
+def get_assets_metadata(
+    names: Iterable[str],
+    workers: int = DEFAULT_WORKERS,
+    use_cache: bool = True,
+) -> Dict[str, Dict[str, Any] | None]:
+    """
+    Fetches the full metadata (size, updateTime, bands, properties, ...) of many assets with concurrent
+    ee.data.getAsset calls.
+
+    Names are deduplicated, calls go through the shared rate limiter and results are kept in an in-memory LRU cache
+    (DEFAULT_METADATA_CACHE_SIZE records), so repeated lookups of the same asset are free. Assets deleted by prune
+    are evicted from the cache.
+
+    Args:
+        names: asset paths. Duplicates are fetched once
+        workers: Maximum number of concurrent getAsset calls
+        use_cache: Read from and store into the in-memory metadata cache
+
+    Returns:
+        Dict mapping every asset name, in input order, to its metadata or to None if the asset does not exist or
+        cannot be accessed.
+    """
+
+    # Deduplicate, keeping input order
+    results: Dict[str, Dict[str, Any] | None] = dict.fromkeys(names)
+    missing = []
+    for name in results:
+        cached = _metadata_cache.get(name) if use_cache else None
+        if cached is not None:
+            results[name] = cached
+        else:
+            missing.append(name)
+
+    def _fetch(name: str) -> Dict[str, Any] | None:
+        try:
+            return _get_asset(name)
+        except ValueError:
+            return None
+
+    # Submit in chunks so a million names do not become a million pending futures
+    chunk_size = max(1, workers) * 100
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start : start + chunk_size]
+            for name, metadata in zip(chunk, executor.map(_fetch, chunk)):
+                results[name] = metadata
+                if use_cache and metadata is not None:
+                    _metadata_cache.put(name, metadata)
+
+    return results
+
+
+def _asset_depth(name: str) -> int:
+    # Number of parts of an asset path, same as len(Asset(name).parts) without building a PurePosixPath
+    return name.strip("/").count("/") + 1
+
+
+def _order_by_level(names: Iterable[str]) -> Dict[int, List[str]]:
+    # Group asset names per level of hierarchy, deepest level first
+    assets_ordered: Dict[int, List[str]] = {}
+    for name in names:
+        assets_ordered.setdefault(_asset_depth(name), []).append(name)
+    return dict(sorted(assets_ordered.items(), reverse=True))
+
+
+def _delete_asset(asset: str, missing_ok: bool = False) -> bool:
+    # Delete a single asset, return False instead of raising if it still fails after retrying transient errors.
+    # With missing_ok=True an asset that no longer exists counts as deleted
+    attempts = 0
+
+    @governor.endpoint("deleteAsset")
+    def _delete() -> None:
+        nonlocal attempts
+        attempts += 1
+        try:
+            ee.data.deleteAsset(asset)
+        except ee.EEException as e:
+            # deleteAsset is not idempotent: an attempt that timed out may have deleted the asset on the server,
+            # in which case the retry finds nothing to delete
+            if (missing_ok or attempts > 1) and governor.is_not_found_error(e):
+                return
+            raise e
 
-    # List assets in the parent folder
     try:
-        child_assets = ee.data.listAssets({"parent": _parent.as_posix()})["assets"]
-    except ee.EEException as e:
+        governor.call(_delete)
+        _metadata_cache.pop(asset)
+        return True
+    except Exception as e:
         logging.warning(e)
-        raise e
+        return False
 
-    asset_list = []
 
-    # if Inclusive is True add container info to the list
-    if inclusive:
-        asset_list.append({"name": _parent.as_posix(), "type": parent_type})
+def _delete_ordered(
+    assets_ordered: Dict[int, List[str]],
+    results: Dict[str, List[str]],
+    workers: int = 1,
+    on_result: Callable[[str, bool], None] | None = None,
+    missing_ok: bool = False,
+) -> None:
+    # Delete assets level by level, in the order of assets_ordered (deepest first).
+    # Assets within a level are deleted concurrently. executor.map only returns once every asset of the level has been
+    # processed, which acts as a barrier between levels, and yields results in input order so results are appended
+    # from this thread in the same order as a serial run. on_result is called from this thread as well.
+    delete = partial(_delete_asset, missing_ok=missing_ok)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for lvl in assets_ordered:
+            level_assets = assets_ordered[lvl]
+            for asset, deleted in zip(level_assets, executor.map(delete, level_assets)):
+                results["deleted" if deleted else "failed"].append(asset)
+                if on_result is not None:
+                    on_result(asset, deleted)
 
-    # Iterate over child assets.
-    for child_asset in child_assets:
-        # if not image_collections_exclusively, include everything
-        if (
-            not image_collections_exclusively
-            or child_asset["type"] != "IMAGE"
-            or parent_type == "IMAGE_COLLECTION"
-        ):
-            asset_list.append(
-                {"name": child_asset["name"], "type": child_asset["type"]}
-            )
 
-        # Recursively call the function to get child assets
-        if recursive and child_asset["type"] == "FOLDER":
-            asset_list.extend(
-                list_assets(
-                    child_asset["name"],
-                    asset_types=[],  # Bring all, filter at the end
-                    recursive=True,  # Implicit from IF
-                    inclusive=False,  # False because parents are included above
-                    expand_image_collections=expand_image_collections,
-                    image_collections_exclusively=image_collections_exclusively,
-                )
-            )
-        if expand_image_collections and child_asset["type"] == "IMAGE_COLLECTION":
-            # Recursively call the function to get child assets
-            asset_list.extend(
-                list_assets(
-                    child_asset["name"],
-                    asset_types=[],  # Bring all, filter at the end
-                    recursive=True,  # Indiferente, image collections are not recursive
-                    inclusive=False,  # False because parents are included above
-                    expand_image_collections=True,  # Implicit from IF
-                    image_collections_exclusively=False,
+def _check_prune_options(
+    asset_types: List[str], root_type: str, recursive: bool, expand_image_collections: bool
+) -> Tuple[List[str], bool]:
+    # Validate prune options against the asset types to delete.
+    # Return the asset types to list and whether images must be inside an image collection
+    asset_types = list(asset_types)
+
+    # if asset_types includes FOLDER, asset_types should also include all other asset types or raise error
+    if any([asset_type == "FOLDER" for asset_type in asset_types]):
+        if not all(
+            [allowed_type in asset_types for allowed_type in ALLOWED_ASSET_TYPES]
+        ):
+            raise ValueError(
+                (
+                    "asset_types includes 'FOLDER' but omits other required asset types. "
+                    "Prefer asset_types=[] to delete folders and all their contents."
                 )
             )
 
-    # Filter assets not in asset_types
-    asset_list = [asset for asset in asset_list if asset["type"] in asset_types]
+    # IF deleting folders, recursive and expand_image_collections need to be True
+    if (
+        "FOLDER" in asset_types
+        and root_type != "IMAGE_COLLECTION"
+        and (not recursive or not expand_image_collections)
+    ):
+        raise ValueError(
+            "Deleting a folder requires recursive=True and expand_image_collections=True"
+        )
 
-    return asset_list
+    # If Deleting image collections, expand_image_collections needs to be True
+    if "IMAGE_COLLECTION" in asset_types and not expand_image_collections:
+        raise ValueError(
+            "Deleting an image collection requires expand_image_collections=True"
+        )
+
+    # if deleting image collections  and not images (explicitly)
+    # add 'IMAGE' to asset_types and set image_collection_exclusively=True
+    image_collections_exclusively = False
+    if "IMAGE_COLLECTION" in asset_types and not "IMAGE" in asset_types:
+        image_collections_exclusively = True
+        asset_types.append("IMAGE")
+
+    return asset_types, image_collections_exclusively
+
+
+def _check_prune_plan(
+    asset_types: str | List[str],
+    root_type: str,
+    recursive: bool,
+    expand_image_collections: bool,
+    filter: str | None,
+    start_time: str | date | datetime | None,
+    end_time: str | date | datetime | None,
+    region: Any,
+    where: Any,
+    index: AssetIndex | None,
+) -> Tuple[List[str], bool, str | None]:
+    # Validate the options of prune and aio.aprune. Return the asset types to list, whether images must be inside an
+    # image collection and the listAssets filter of the images, with what Earth Engine can evaluate of where
+    from gee_toolbox.gee import where as _where
+
+    asset_types, image_collections_exclusively = _check_prune_options(
+        _check_asset_types(asset_types), root_type, recursive, expand_image_collections
+    )
+
+    # Containers holding images that do not match the filter cannot be deleted
+    image_filter = _image_filter(filter, start_time, end_time, region)
+    if image_filter and asset_types != ["IMAGE"]:
+        raise ValueError("filter, start_time, end_time and region require asset_types='IMAGE'")
+    if image_filter and index is not None:
+        raise ValueError("filter, start_time, end_time and region are evaluated by Earth Engine, not with an index")
+
+    # Listing is already restricted to images of image collections, let Earth Engine evaluate what it can of where
+    if image_filter and where is not None and _where.server_filter(where):
+        image_filter = f"{image_filter} AND ({_where.server_filter(where)})"
+
+    return asset_types, image_collections_exclusively, image_filter
+
+
+def _has_size(record: Dict[str, Any]) -> bool:
+    # Whether a record gives the storage it uses, i.e. is not an image or table lacking sizeBytes
+    from gee_toolbox.gee.usage import SIZED_ASSET_TYPES
+
+    return record["type"] not in SIZED_ASSET_TYPES or "sizeBytes" in record
+
+
+def _index_prune_plan(
+    root: str, inclusive: bool, asset_types: List[str], where: Any, index: AssetIndex | None
+) -> Tuple[List[Dict[str, Any]], Dict[int, List[str]], int | None] | None:
+    # Plan of a prune of the whole tree of a container from an index: asset list, assets per level and storage freed
+    # (None if unknown). All asset types, which _check_prune_options only allows with recursive and
+    # expand_image_collections, are read from the index directly, already sorted per level. None if the prune must
+    # walk the tree
+    if index is None or where is not None or set(asset_types) != set(ALLOWED_ASSET_TYPES):
+        return None
+    asset_list = index.subtree(root, inclusive=inclusive)
+    size_bytes = None
+    if all(_has_size(record) for record in asset_list):
+        size_bytes = sum(int(record.get("sizeBytes") or 0) for record in asset_list)
+    asset_list = [{"name": record["name"], "type": record["type"]} for record in asset_list]
+    return asset_list, index.levels(root, inclusive=inclusive), size_bytes
+
+
+class _PrunePlan:
+    # Assets to delete, added as they are listed: name and type of each, and the storage freed while the listing
+    # provides sizeBytes of every image and table. Cached listings, the BASIC view and index records may not
+
+    def __init__(self, root: str):
+        # usage imports this module
+        from gee_toolbox.gee.usage import UsageAggregator
+
+        self.asset_list: List[Dict[str, Any]] = []
+        self._usage = UsageAggregator(root)
+        self._sizes_known = True
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self._usage.add(record)
+        self._sizes_known = self._sizes_known and _has_size(record)
+        self.asset_list.append({"name": record["name"], "type": record["type"]})
+
+    @property
+    def size_bytes(self) -> int | None:
+        return self._usage.total["bytes"] if self._sizes_known else None
 
 
 def prune(
@@ -172,6 +924,17 @@ def prune(
     inclusive: bool = True,
     silent: bool = False,
     dry_run: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    journal: str | os.PathLike | None = None,
+    resume: bool = False,
+    cache: AssetCache | None = None,
+    filter: str | None = None,
+    start_time: str | date | datetime | None = None,
+    end_time: str | date | datetime | None = None,
+    region: Any = None,
+    where: Dict[str, Any] | Callable[[Dict[str, Any]], bool] | None = None,
+    progress: bool | _progress.ProgressCallback | None = None,
+    index: AssetIndex | None = None,
 ) -> Dict[str, List[str]]:
     """
     Deletes Google Earth Engine assets in google projects.
@@ -197,6 +960,37 @@ def prune(
         silent (bool, optional): Whether to skip the confirmation prompt. Defaults to False.
             Use with caution, will delete all assets without requesting confirmation.
         dry_run (bool, optional): List all assets to delete without deleting them. Defaults to False.
+        workers (int, optional): Maximum number of concurrent Earth Engine calls, used both to list the assets and to
+            delete all the assets of a hierarchy level at once. Defaults to DEFAULT_WORKERS. workers=1 deletes serially.
+        journal (str | PathLike, optional): Path of a JSON lines journal recording the deletion plan and every
+            deleted/failed asset. Defaults to None (no journal).
+        resume (bool, optional): Resume an interrupted run from journal instead of listing the assets again.
+            Assets already deleted are not deleted again and are reported as deleted, failed ones are retried.
+            Starts a new run if the journal does not exist yet. Defaults to False.
+        cache (AssetCache, optional): Listing cache used to list the assets. Deleted assets are invalidated in it.
+            Defaults to None (no cache).
+        filter (str, optional): Only delete images of image collections matching this Earth Engine filter expression,
+            e.g. 'properties.cloud_cover > 50'. Evaluated server side, see iter_assets. Defaults to None.
+        start_time (str | date | datetime, optional): Only delete images of image collections starting at or after
+            this time. Defaults to None.
+        end_time (str | date | datetime, optional): Only delete images of image collections starting before this
+            time, e.g. end_time="2020-01-01" deletes images older than 2020. Defaults to None.
+        region (dict | ee.Geometry, optional): Only delete images of image collections intersecting this region.
+            Defaults to None.
+        where (dict | Callable, optional): Only delete the assets selected by this predicate, evaluated while the
+            tree is listed. Either a function taking an asset record and returning True to delete it, or a spec dict
+            with any of "name" (glob on the path), "regex", "updated_before" (datetime, date, RFC 3339 string or
+            timedelta age), "properties" (dict of values) and "min_bytes", see where.predicate. A folder or image
+            collection is only deleted if it is selected along with all its listed contents. Metadata missing from the listing is fetched in
+            batches. Property equality is also evaluated by Earth Engine when filter, start_time, end_time or region
+            is set. Defaults to None (no selection).
+        progress (bool | Callable, optional): Report progress of the listing and deletion stages (items done, rate,
+            ETA, in-flight calls, retries). True renders a status line on stderr, a callable receives every progress
+            event dict, e.g. progress.JsonLinesEmitter("prune.jsonl"). Defaults to None (no progress).
+        index (AssetIndex, optional): Index of an earlier listing of the tree. The assets to delete are selected from
+            it instead of listing the tree again, so several prunes can be planned against the same listing. Assets
+            of the index that no longer exist count as deleted. Cannot be combined with filter, start_time, end_time
+            or region. Defaults to None (list the tree).
     Returns:
         Dict: A dictionary containing the results of the deletion operation. The dictionary has the following keys:
             - "deleted": List of assets successfully deleted.
@@ -206,77 +1000,103 @@ def prune(
         ValueError: If asset_types includes 'FOLDER' but omits any other required asset types.
         ValueError: If deleting a folder but recursive=False or expand_image_collections=False.
         ValueError: If deleting an image collection but expand_image_collections=False.
+        ValueError: If resume=True without a journal, or the journal belongs to another asset.
+        ValueError: If filter, start_time, end_time or region is set and asset_types is not 'IMAGE'.
+        ValueError: If where is not a function or a spec with known keys.
+        ValueError: If index is combined with filter, start_time, end_time or region.
     """
 
-    _asset = Asset(asset)
-    results = {"deleted": [], "failed": [], "skipped": []}
+    # where imports this module, import it here to avoid a circular import
+    from gee_toolbox.gee import where as _where
 
-    _asset.exists(raised=True)
-    asset_types = _check_asset_types(asset_types)
+    if where is not None:
+        _where.check_where(where)
 
-    # if asset_types includes FOLDER, asset_types should also include all other asset types or raise error
-    if any([asset_type == "FOLDER" for asset_type in asset_types]):
-        if not all(
-            [allowed_type in asset_types for allowed_type in ALLOWED_ASSET_TYPES]
-        ):
-            raise ValueError(
-                (
-                    "asset_types includes 'FOLDER' but omits other required asset types. "
-                    "Prefer asset_types=[] to delete folders and all their contents."
-                )
-            )
+    root = _asset_id(asset)
+    results = {"deleted": [], "failed": [], "skipped": []}
+    progress = _progress.resolve(progress)
 
-    # IF deleting folders, recursive and expand_image_collections need to be True
-    if (
-        "FOLDER" in asset_types
-        and not _asset.is_image_collection()
-        and (not recursive or not expand_image_collections)
-    ):
-        raise ValueError(
-            "Deleting a folder requires recursive=True and expand_image_collections=True"
-        )
+    # Load the plan of an interrupted run
+    plan = None
+    if resume:
+        if journal is None:
+            raise ValueError("resume=True requires a journal")
+        plan = PruneJournal(journal).load()
+        if plan is not None and plan["asset"] != root:
+            raise ValueError(f"Journal {journal} belongs to a prune of {plan['asset']}")
 
-    # If Deleting image collections, expand_image_collections needs to be True
-    if "IMAGE_COLLECTION" in asset_types and not expand_image_collections:
-        raise ValueError(
-            "Deleting an image collection requires expand_image_collections=True"
-        )
-
-    # if deleting image collections  and not images (explicitly)
-    # add 'IMAGE' to asset_types and set image_collection_exclusively=True
-    image_collections_exclusively = False
-    if "IMAGE_COLLECTION" in asset_types and not "IMAGE" in asset_types:
-        image_collections_exclusively = True
-        asset_types.append("IMAGE")
+    # Fetch root metadata once, through the governor, so quota errors are retried instead of read as "does not exist".
+    # A resumed run already knows it (and the root may be gone already)
+    if plan is not None:
+        root_type = plan["type"]
+    elif index is not None and root in index:
+        root_type = index.type(root)
+    else:
+        root_type = _get_asset_type(root, cache)
 
-    is_container = (
-        _asset.is_project() or _asset.is_folder() or _asset.is_image_collection()
+    asset_types, image_collections_exclusively, image_filter = _check_prune_plan(
+        asset_types,
+        root_type,
+        recursive,
+        expand_image_collections,
+        filter,
+        start_time,
+        end_time,
+        region,
+        where,
+        index,
     )
+    is_container = _is_project(root) or root_type in ["FOLDER", "IMAGE_COLLECTION"]
+    index_plan = _index_prune_plan(root, inclusive, asset_types, where, index) if is_container else None
+    assets_ordered = None
 
-    # list objects (images, tables, folders, imageCollections, etc) in folder and sub folders
-    if is_container:
-        asset_list = list_assets(
-            parent=_asset.as_posix(),
-            asset_types=asset_types,
-            recursive=recursive,
-            inclusive=inclusive,
-            expand_image_collections=expand_image_collections,
-            image_collections_exclusively=image_collections_exclusively,
-        )
+    # Resumed run, only keep assets not deleted yet
+    if plan is not None:
+        asset_list = [item for item in plan["assets"] if item["name"] not in plan["deleted"]]
+        results["deleted"] = [item["name"] for item in plan["assets"] if item["name"] in plan["deleted"]]
+        size_bytes = None
 
-        # Split and sort per level of hierarchy. Recursive deleting will fail If not deleted in reverse order
-        assets_ordered: dict = {}
-        for _target_asset in asset_list:
-            _target_asset = Asset(_target_asset["name"])
-            lvl = len(_target_asset.parts)
-            assets_ordered.setdefault(lvl, [])
-            assets_ordered[lvl].append(_target_asset)
-        assets_ordered = dict(sorted(assets_ordered.items(), reverse=True))
+    elif index_plan is not None:
+        asset_list, assets_ordered, size_bytes = index_plan
 
+    # list objects (images, tables, folders, imageCollections, etc) in folder and sub folders
     else:
-        asset_list = [{"name": _asset.as_posix(), "type": _asset.type}]
+        if is_container:
+            # Root type is already known, no need to fetch it again through list_assets.
+            # Full records are read to add up sizeBytes, but only name and type are kept
+            records = _iter_assets(
+                root,
+                root_type,
+                asset_types,
+                recursive=recursive,
+                inclusive=inclusive,
+                expand_image_collections=expand_image_collections,
+                image_collections_exclusively=image_collections_exclusively,
+                workers=workers,
+                cache=cache,
+                full_records=True,
+                image_filter=image_filter,
+                index=index,
+            )
+        else:
+            records = iter([{"name": root, "type": root_type}])
+        if where is not None:
+            records = _where.iter_matching(records, where, workers)
+        listed = _PrunePlan(root)
+        listing = _progress.stage("list", progress) if is_container else None
+        for record in records:
+            listed.add(record)
+            if listing is not None:
+                listing.update()
+        if listing is not None:
+            listing.close()
+        asset_list, size_bytes = listed.asset_list, listed.size_bytes
+
+    # Split and sort per level of hierarchy. Recursive deleting will fail If not deleted in reverse order
+    if assets_ordered is None:
+        assets_ordered = _order_by_level(get_asset_names(asset_list))
 
-    print(_make_del_warning(_asset.as_posix(), get_asset_types(asset_list)))
+    print(_make_del_warning(root, get_asset_types(asset_list), size_bytes))
 
     # End if Dry Run
     if dry_run:
@@ -293,26 +1113,194 @@ def prune(
     # Proceed to delete
     # Not using Asset.delete() method. Need to be able to delete specific asset types only
     if delete_confirmation:
+        print(f"Deleting {len(asset_list)} items from {root}")
 
-        def _delete(asset: Asset) -> None:
-            try:
-                ee.data.deleteAsset(str(asset))
-                results["deleted"].append(str(asset))
-            except Exception as e:
-                results["failed"].append(str(asset))
+        # delete all items starting from the more nested ones, recording progress in the journal
+        deleting = _progress.stage("delete", progress, total=len(asset_list))
+        with (
+            PruneJournal(journal) if journal is not None else nullcontext()
+        ) as _journal, deleting or nullcontext():
+            if _journal is not None:
+                if plan is not None:
+                    _journal.resume()
+                else:
+                    _journal.start(root, root_type, asset_list)
 
-        print(f"Deleting {len(asset_list)} items from {_asset.as_posix()}")
+            def _on_result(name: str, deleted: bool) -> None:
+                if _journal is not None:
+                    _journal.record(name, deleted)
+                if cache is not None and deleted:
+                    cache.invalidate(name)
+                if deleting is not None:
+                    deleting.update(failed=0 if deleted else 1)
 
-        # delete all items starting from the more nested ones
-        for lvl in assets_ordered:
-            [_delete(asset) for asset in assets_ordered[lvl]]
+            _delete_ordered(
+                assets_ordered,
+                results,
+                workers,
+                on_result=_on_result,
+                # Deletions of the interrupted run may have completed without being recorded, and an index may be
+                # older than the tree
+                missing_ok=plan is not None or index is not None,
+            )
 
         print(
             f"Deleted {len(results['deleted'])} items, {len(results['failed'])} items failed to delete"
         )
     else:
         results["skipped"] = get_asset_names(asset_list)
-        print(f"No items deleted from {_asset.as_posix()}")
+        print(f"No items deleted from {root}")
+    return results
+
+
+# Number of manifest names prune_names holds before deleting the deepest of them
+DEFAULT_MANIFEST_BUFFER = 10_000
+
+
+def _iter_manifest(names: Iterable[str | Dict[str, Any]] | str | os.PathLike) -> Iterator[str]:
+    # Asset names of a manifest: an iterable of names or records, a text file with one name per line, or the name
+    # column of a Parquet file (e.g. a snapshot), read one batch at a time
+    if isinstance(names, (str, os.PathLike)):
+        if str(names).endswith(".parquet"):
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError(
+                    "Reading Parquet requires pyarrow. Install it with pip install gee-toolbox[parquet]"
+                ) from e
+            for batch in pq.ParquetFile(names).iter_batches(columns=["name"]):
+                yield from map(_asset_id, batch.column(0).to_pylist())
+        else:
+            with open(names, encoding="utf-8") as f:
+                yield from (_asset_id(line.strip()) for line in f if line.strip())
+    else:
+        for name in names:
+            yield _asset_id(name["name"] if isinstance(name, dict) else name)
+
+
+def prune_names(
+    names: Iterable[str | Dict[str, Any]] | str | os.PathLike,
+    silent: bool = False,
+    dry_run: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    journal: str | os.PathLike | None = None,
+    resume: bool = False,
+    cache: AssetCache | None = None,
+    progress: bool | _progress.ProgressCallback | None = None,
+    buffer_size: int = DEFAULT_MANIFEST_BUFFER,
+) -> Dict[str, List[str]]:
+    """
+    Deletes the assets of a manifest, e.g. names selected from a snapshot or given by another system, without listing
+    any container.
+
+    Names are streamed from the manifest into a buffer grouped per level of hierarchy. When the buffer holds
+    buffer_size names, its deepest levels are deleted, concurrently within a level, until it is half empty, so memory
+    stays bounded and children listed before their parent are deleted first. A container that cannot be deleted yet
+    because some of its children come later in the manifest is retried at the end, with the rest of the buffer,
+    deepest level first. Sort the manifest deepest first, or children first, to avoid those retries.
+
+    Args:
+        names: Iterable of asset names (or records with a "name"), or the path of a text file with one name per line
+            or of a Parquet file with a name column, e.g. a snapshot. Every listed asset is deleted, including folders
+            and image collections, which must be empty once their listed children are deleted.
+        silent: Whether to skip the confirmation prompt. Defaults to False.
+        dry_run: Read the manifest without deleting anything, every name is returned as skipped. Defaults to False.
+        workers: Maximum number of concurrent deleteAsset calls. Defaults to DEFAULT_WORKERS.
+        journal: Path of a JSON lines journal recording every deleted/failed asset, like prune. Defaults to None.
+        resume: Skip the assets recorded as deleted in journal by an interrupted run, they are reported as deleted.
+            Starts a new run if the journal does not exist yet. Defaults to False.
+        cache: Listing cache in which deleted assets are invalidated. Defaults to None.
+        progress: Report progress of the deletion, see prune. Defaults to None.
+        buffer_size: Maximum number of names held before deleting. Defaults to DEFAULT_MANIFEST_BUFFER.
+
+    Returns:
+        Dict with "deleted", "failed" and "skipped" lists, like prune. Assets of the manifest that no longer exist
+        count as deleted.
+
+    Raises:
+        ValueError: If resume=True without a journal, or the journal belongs to a prune of a container.
+    """
+
+    source = str(names) if isinstance(names, (str, os.PathLike)) else "manifest"
+    results = {"deleted": [], "failed": [], "skipped": []}
+
+    # Names deleted by an interrupted run
+    plan = None
+    if resume:
+        if journal is None:
+            raise ValueError("resume=True requires a journal")
+        plan = PruneJournal(journal).load()
+        if plan is not None and plan["type"] != "MANIFEST":
+            raise ValueError(f"Journal {journal} belongs to a prune of {plan['asset']}")
+    done = plan["deleted"] if plan is not None else set()
+
+    if dry_run:
+        results["skipped"] = [name for name in _iter_manifest(names) if name not in done]
+        print(f"Dry run, {len(results['skipped'])} items of {source} would be deleted")
+        return results
+
+    if not silent:
+        print(f"You are about to delete every asset listed in {source}")
+        if not _request_del_confirmation():
+            results["skipped"] = list(_iter_manifest(names))
+            print(f"No items deleted from {source}")
+            return results
+
+    deleting = _progress.stage("delete", _progress.resolve(progress))
+    buffer: Dict[int, List[str]] = {}
+    buffered = 0
+    # Containers that failed while some of their children were still to come, retried at the end
+    deferred: List[str] = []
+
+    with (
+        PruneJournal(journal) if journal is not None else nullcontext()
+    ) as _journal, deleting or nullcontext():
+        if _journal is not None:
+            if plan is not None:
+                _journal.resume()
+            else:
+                _journal.start(source, "MANIFEST", [])
+
+        def _on_result(name: str, deleted: bool) -> None:
+            if _journal is not None:
+                _journal.record(name, deleted)
+            if cache is not None and deleted:
+                cache.invalidate(name)
+            if deleting is not None:
+                deleting.update(failed=0 if deleted else 1)
+
+        def _delete_levels(levels: Dict[int, List[str]], final: bool) -> None:
+            # Before the end of the manifest a failure is deferred instead of reported
+            outcome = {"deleted": [], "failed": []}
+
+            def _on_outcome(name: str, deleted: bool) -> None:
+                if deleted or final:
+                    _on_result(name, deleted)
+
+            _delete_ordered(levels, outcome, workers, on_result=_on_outcome, missing_ok=True)
+            results["deleted"] += outcome["deleted"]
+            if final:
+                results["failed"] += outcome["failed"]
+            else:
+                deferred.extend(outcome["failed"])
+
+        for name in _iter_manifest(names):
+            if name in done:
+                results["deleted"].append(name)
+                continue
+            buffer.setdefault(_asset_depth(name), []).append(name)
+            buffered += 1
+            if buffered >= buffer_size:
+                while buffered > buffer_size // 2:
+                    level = max(buffer)
+                    buffered -= len(buffer[level])
+                    _delete_levels({level: buffer.pop(level)}, final=False)
+
+        for name in deferred:
+            buffer.setdefault(_asset_depth(name), []).append(name)
+        _delete_levels(dict(sorted(buffer.items(), reverse=True)), final=True)
+
+    print(f"Deleted {len(results['deleted'])} items, {len(results['failed'])} items failed to delete")
     return results
 
 
@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Default time to live of a cached listing, in seconds
+DEFAULT_TTL = 3600.0
+
+# Default location of the cache database
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "gee_toolbox", "assets.sqlite"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    parent TEXT PRIMARY KEY,
+    listed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS children (
+    parent TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    update_time TEXT,
+    PRIMARY KEY (parent, position)
+);
+CREATE INDEX IF NOT EXISTS children_name ON children (name);
+CREATE TABLE IF NOT EXISTS types (
+    name TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class AssetCache:
+    """
+    Persistent cache of container listings, stored in SQLite and keyed by parent path.
+
+    Each listing stores the children of one folder or image collection (name, type and updateTime) and expires `ttl`
+    seconds after it was listed, so only expired containers are listed again. Listings are written page by page and
+    only become visible once complete, so an interrupted listing is never served.
+
+    Args:
+        path: Path of the SQLite database. Defaults to ~/.cache/gee_toolbox/assets.sqlite. ":memory:" keeps the cache
+            in memory for the life of the object.
+        ttl: Time to live of a listing in seconds. None never expires listings.
+    """
+
+    def __init__(self, path: str | os.PathLike = DEFAULT_CACHE_PATH, ttl: float | None = DEFAULT_TTL):
+        if str(path) != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        # Shared by the listing threads, every access goes through the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _not_expired(self, timestamp: float) -> bool:
+        return self.ttl is None or time.time() - timestamp < self.ttl
+
+    def _is_fresh(self, parent: str) -> bool:
+        row = self._connection.execute(
+            "SELECT listed_at FROM listings WHERE parent = ?", (parent,)
+        ).fetchone()
+        return row is not None and self._not_expired(row[0])
+
+    def has_children(self, parent: str) -> bool:
+        """Return True if a complete, non expired listing of parent is cached."""
+        with self._lock:
+            return self._is_fresh(parent)
+
+    def get_type(self, name: str) -> str | None:
+        """Return the type of an asset if it is part of a fresh cached listing or was stored with put_type, else None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT parent, type FROM children WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and self._is_fresh(row[0]):
+                return row[1]
+            row = self._connection.execute(
+                "SELECT type, fetched_at FROM types WHERE name = ?", (name,)
+            ).fetchone()
+            if row is not None and self._not_expired(row[1]):
+                return row[0]
+            return None
+
+    def put_type(self, name: str, type: str) -> None:
+        """Cache the type of an asset that is not part of any listing, e.g. the root of a listing."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO types VALUES (?, ?, ?)", (name, type, time.time())
+            )
+
+    def iter_children(self, parent: str, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Yield the cached children of parent in listing order, chunk_size rows at a time."""
+        position = -1
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT position, name, type, update_time FROM children "
+                    "WHERE parent = ? AND position > ? ORDER BY position LIMIT ?",
+                    (parent, position, chunk_size),
+                ).fetchall()
+            for position, name, type, update_time in rows:
+                child = {"name": name, "type": type}
+                if update_time is not None:
+                    child["updateTime"] = update_time
+                yield child
+            if len(rows) < chunk_size:
+                return
+
+    def store_children(self, parent: str, pages: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """
+        Cache the listing of parent while passing it through.
+
+        Args:
+            parent: Container path.
+            pages: Pages of child records as returned by listAssets.
+
+        Yields:
+            The child records of every page. The listing is marked complete once all pages are consumed.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM listings WHERE parent = ?", (parent,))
+            self._connection.execute("DELETE FROM children WHERE parent = ?", (parent,))
+        position = 0
+        for page in pages:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO children VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (parent, position + i, child["name"], child["type"], child.get("updateTime"))
+                        for i, child in enumerate(page)
+                    ],
+                )
+            position += len(page)
+            yield from page
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?)", (parent, time.time())
+            )
+
+    def invalidate(self, name: str) -> None:
+        """Forget an asset: remove it from its parent listing and drop the listings of the asset and its subtree."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM children WHERE name = ?", (name,))
+            self._connection.execute("DELETE FROM types WHERE name = ?", (name,))
+            # parent = name, or parent starts with name + "/" ("0" is the character after "/")
+            for table in ["listings", "children"]:
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE parent = ? OR (parent >= ? AND parent < ?)",
+                    (name, name + "/", name + "0"),
+                )
+
+    def invalidate_listing(self, parent: str) -> None:
+        """Drop the cached listing of parent, e.g. after creating or copying assets into it. It is listed again next."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM listings WHERE parent = ?", (parent,))
+            self._connection.execute("DELETE FROM children WHERE parent = ?", (parent,))
+
+    def clear(self) -> None:
+        """Drop every cached listing."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM listings")
+            self._connection.execute("DELETE FROM children")
+            self._connection.execute("DELETE FROM types")
@@ -0,0 +1,316 @@
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from gee_toolbox.gee.lazy import LazyModule, is_loaded
+
+# Imported on first use, importing ee takes a noticeable part of a second
+ee = LazyModule("ee")
+
+T = TypeVar("T")
+
+# Default sustained request rate (requests per second) shared by all threads
+DEFAULT_QPS = 50.0
+# Default number of retries for transient errors before giving up
+DEFAULT_MAX_RETRIES = 6
+
+# Fragments of error messages returned by Earth Engine when a quota or rate limit is hit
+THROTTLING_ERRORS = [
+    "too many concurrent",
+    "too many requests",
+    "quota exceeded",
+    "rate limit",
+    "resource_exhausted",
+]
+
+# Fragments of error messages for server side or network errors that are worth retrying
+TRANSIENT_ERRORS = [
+    "service unavailable",
+    "internal error",
+    "backend error",
+    "deadline exceeded",
+    "timed out",
+    "connection reset",
+]
+
+# Fragments of error messages returned when an asset does not exist
+NOT_FOUND_ERRORS = [
+    "not found",
+    "does not exist",
+]
+
+# Fragments of error messages returned when creating or copying onto an existing asset
+ALREADY_EXISTS_ERRORS = [
+    "already exists",
+]
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Return True if error is an Earth Engine quota / rate limit error."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in THROTTLING_ERRORS)
+
+
+def is_not_found_error(error: BaseException) -> bool:
+    """Return True if error reports a missing asset."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in NOT_FOUND_ERRORS)
+
+
+def is_already_exists_error(error: BaseException) -> bool:
+    """Return True if error reports that the target asset already exists."""
+    message = str(error).lower()
+    return any(fragment in message for fragment in ALREADY_EXISTS_ERRORS)
+
+
+def error_class(error: BaseException) -> str:
+    """Short class of an Earth Engine call error for metrics: throttled, not_found, already_exists, transient or the
+    exception type name."""
+    if is_throttling_error(error):
+        return "throttled"
+    if is_not_found_error(error):
+        return "not_found"
+    if is_already_exists_error(error):
+        return "already_exists"
+    if is_retryable_error(error):
+        return "transient"
+    return type(error).__name__
+
+
+def endpoint(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator naming the Earth Engine method a wrapper function calls, so metrics report it under that name."""
+
+    def _decorate(fn: Callable[..., T]) -> Callable[..., T]:
+        fn.endpoint = name
+        return fn
+
+    return _decorate
+
+
+def endpoint_name(fn: Callable) -> str:
+    """Name of the Earth Engine method called by fn."""
+    return getattr(fn, "endpoint", None) or getattr(fn, "__name__", repr(fn))
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Return True if error is transient: throttling, server or network errors. Not found or permission errors are not."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # An EEException can only have been raised once ee is imported, no need to import it to check
+    if not is_loaded("ee") or not isinstance(error, ee.EEException):
+        return False
+    message = str(error).lower()
+    return is_throttling_error(error) or any(
+        fragment in message for fragment in TRANSIENT_ERRORS
+    )
+
+
+class RequestGovernor:
+    """
+    Shared throttle for Earth Engine API calls.
+
+    Every call takes a token from a token bucket refilled at `qps` tokens per second, so all threads together never
+    exceed the configured rate. Retryable errors are retried with exponential backoff and full jitter. When Earth
+    Engine reports throttling, the rate is halved (down to `min_qps`) and then recovers additively on every success,
+    converging to the highest rate the quota allows. Concurrent calls throttled in the same episode only halve the rate
+    once: further throttles within `cooldown` seconds of the last decrease are ignored.
+
+    Args:
+        qps: Maximum sustained requests per second. None disables rate limiting (retries still apply).
+        burst: Maximum number of tokens in the bucket. Defaults to qps (one second worth of requests).
+        max_retries: Number of retries for retryable errors before re-raising.
+        base_delay: Backoff delay in seconds for the first retry, doubled on each attempt.
+        max_delay: Upper bound for the backoff delay in seconds.
+        min_qps: Lower bound for the adaptive rate.
+        cooldown: Minimum number of seconds between two rate decreases.
+        clock: Monotonic clock, replaceable for testing.
+        sleep: Sleep function, replaceable for testing.
+    """
+
+    def __init__(
+        self,
+        qps: float | None = DEFAULT_QPS,
+        burst: float | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        min_qps: float = 1.0,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.qps = qps
+        self.burst = burst or qps or 1.0
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_qps = min(min_qps, qps) if qps else min_qps
+        self.cooldown = cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._rate = qps
+        self._tokens = self.burst
+        self._updated = clock()
+        self._last_decrease: float | None = None
+        self.retries = 0
+        self.throttled = 0
+        self.in_flight = 0
+
+    @property
+    def rate(self) -> float | None:
+        """Current (adaptive) request rate in requests per second."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """Block until a request token is available."""
+        if self.qps is None:
+            return
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # Reserve a token, possibly going into debt, and wait outside the lock until the debt is paid
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait:
+            self._sleep(wait)
+
+    def _backoff(self, attempt: int) -> float:
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def _on_success(self) -> None:
+        if self.qps is not None and self._rate < self.qps:
+            with self._lock:
+                self._rate = min(self.qps, self._rate + self.qps * 0.01)
+
+    def _on_throttled(self) -> None:
+        with self._lock:
+            self.throttled += 1
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            if self.qps is not None:
+                self._rate = max(self.min_qps, self._rate / 2)
+                self._tokens = min(self._tokens, 0)
+
+    def _tracked(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Run one attempt, counting it in in_flight while it runs and reporting it to the metrics recorder if any
+        recorder = _recorder
+        with self._lock:
+            self.in_flight += 1
+        if recorder is None:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+
+        error = None
+        started = time.time_ns()
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise e
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.in_flight -= 1
+            recorder.observe(endpoint_name(fn), started, duration, error)
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call fn(*args, **kwargs) under the rate limit, retrying retryable errors.
+
+        Raises:
+            The last error if it is not retryable or max_retries is exhausted.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = self._tracked(fn, *args, **kwargs)
+            except Exception as e:
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise e
+                if is_throttling_error(e):
+                    self._on_throttled()
+                with self._lock:
+                    self.retries += 1
+                if _recorder is not None:
+                    _recorder.retried(endpoint_name(fn), e)
+                delay = self._backoff(attempt)
+                logging.info(
+                    f"Retrying {getattr(fn, '__name__', fn)} in {delay:.2f}s ({attempt + 1}/{self.max_retries}): {e}"
+                )
+                self._sleep(delay)
+                attempt += 1
+            else:
+                self._on_success()
+                return result
+
+
+_governor = RequestGovernor()
+
+# Receives every Earth Engine call made through a governor, see gee_toolbox.gee.metrics. None records nothing
+_recorder = None
+
+# Run once before the first Earth Engine call, see set_initializer
+_initializer: Callable[[], Any] | None = None
+_initializer_lock = threading.Lock()
+
+
+def get_governor() -> RequestGovernor:
+    """Return the governor shared by all gee_toolbox Earth Engine calls."""
+    return _governor
+
+
+def set_governor(governor: RequestGovernor) -> RequestGovernor:
+    """Replace the shared governor, e.g. set_governor(RequestGovernor(qps=20)). Returns the previous one."""
+    global _governor
+    previous, _governor = _governor, governor
+    return previous
+
+
+def set_initializer(initializer: Callable[[], Any] | None) -> None:
+    """
+    Run initializer once, before the first Earth Engine call made through call, e.g.
+    set_initializer(lambda: ee.Initialize(project="my-project")). Work served from the listing cache alone never
+    imports or initializes Earth Engine. If initializer raises, it is run again by the next call.
+    """
+    global _initializer
+    _initializer = initializer
+
+
+def _initialize() -> None:
+    global _initializer
+    if _initializer is None:
+        return
+    with _initializer_lock:
+        if _initializer is not None:
+            _initializer()
+            _initializer = None
+
+
+def call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call an Earth Engine function through the shared governor, e.g. call(ee.data.getAsset, asset_id)."""
+    _initialize()
+    return _governor.call(fn, *args, **kwargs)
+
+
+def set_recorder(recorder: Any) -> Any:
+    """
+    Set the metrics recorder of all governors, e.g. set_recorder(metrics.MetricsRecorder()). None disables recording.
+    Returns the previous one.
+    """
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
@@ -0,0 +1,280 @@
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class AssetInventory:
+    """
+    Compact in-memory listing of assets, e.g. list_assets(parent, recursive=True, as_inventory=True).
+
+    A list of {"name", "type"} dicts costs a few hundred bytes per asset, mostly the full path strings and the dicts.
+    The inventory is stored in columns instead: each parent path is stored once and assets keep an index to it and
+    their last path component, types and depths are single bytes and sizes are packed 64-bit integers. Filtering by
+    type and depth builds byte masks with bytes.translate and selects rows with itertools.compress, without looking at
+    the rows one by one in Python.
+
+    Args:
+        records: Optional asset records to add, with at least name and type. sizeBytes is kept when present.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self._parents: List[str] = []
+        self._parent_index: Dict[str, int] = {}
+        self._types: List[str] = []
+        self._parent = array("I")
+        self._leaf: List[str] = []
+        self._type = bytearray()
+        self._depth = bytearray()
+        # sizeBytes, -1 when unknown
+        self._size = array("q")
+        self.extend(records)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add an asset record with at least name and type."""
+        parent, _, leaf = record["name"].strip("/").rpartition("/")
+        parent_index = self._parent_index.get(parent)
+        if parent_index is None:
+            parent_index = self._parent_index[parent] = len(self._parents)
+            self._parents.append(parent)
+        asset_type = record["type"]
+        if asset_type not in self._types:
+            self._types.append(asset_type)
+
+        self._parent.append(parent_index)
+        self._leaf.append(leaf)
+        self._type.append(self._types.index(asset_type))
+        # Same as assets._asset_depth. Earth Engine limits folder nesting far below 255 levels
+        self._depth.append(min(parent.count("/") + 2 if parent else 1, 255))
+        size = record.get("sizeBytes")
+        self._size.append(int(size) if size is not None else -1)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Add asset records, e.g. from iter_assets."""
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self._leaf)
+
+    def __repr__(self) -> str:
+        return f"<AssetInventory {len(self)} assets>"
+
+    def _name(self, i: int) -> str:
+        parent = self._parents[self._parent[i]]
+        return f"{parent}/{self._leaf[i]}" if parent else self._leaf[i]
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        record = {"name": self._name(i), "type": self._types[self._type[i]]}
+        if self._size[i] >= 0:
+            record["sizeBytes"] = str(self._size[i])
+        return record
+
+    def __getitem__(self, i: int | slice) -> "Dict[str, Any] | AssetInventory":
+        # A slice is a new inventory, like select
+        if isinstance(i, slice):
+            return self._take(range(len(self))[i])
+        return self._record(range(len(self))[i])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return map(self._record, range(len(self)))
+
+    def names(self) -> List[str]:
+        """Full asset paths, in listing order."""
+        return [self._name(i) for i in range(len(self))]
+
+    def types(self) -> List[str]:
+        """Asset types, in listing order."""
+        return [self._types[code] for code in self._type]
+
+    def depths(self) -> List[int]:
+        """Number of path parts of each asset, e.g. 4 for projects/p/assets/folder."""
+        return list(self._depth)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Assets as a list of {"name", "type"} dicts (with sizeBytes when known), as returned by list_assets."""
+        return list(self)
+
+    def _type_mask(self, asset_types: List[str]) -> bytes:
+        table = bytes(1 if code < len(self._types) and self._types[code] in asset_types else 0 for code in range(256))
+        return self._type.translate(table)
+
+    def _depth_mask(self, min_depth: int | None, max_depth: int | None) -> bytes:
+        low, high = min_depth or 0, 255 if max_depth is None else max_depth
+        table = bytes(1 if low <= depth <= high else 0 for depth in range(256))
+        return self._depth.translate(table)
+
+    def _take(self, rows: Iterable[int]) -> "AssetInventory":
+        # New inventory with the given rows. Parent and type tables are shared, they are only ever appended to
+        selected = AssetInventory()
+        selected._parents, selected._parent_index, selected._types = self._parents, self._parent_index, self._types
+        rows = list(rows)
+        selected._parent = array("I", [self._parent[i] for i in rows])
+        selected._leaf = [self._leaf[i] for i in rows]
+        selected._type = bytearray(self._type[i] for i in rows)
+        selected._depth = bytearray(self._depth[i] for i in rows)
+        selected._size = array("q", [self._size[i] for i in rows])
+        return selected
+
+    def select(
+        self,
+        asset_types: str | List[str] | None = None,
+        min_depth: int | None = None,
+        max_depth: int | None = None,
+    ) -> "AssetInventory":
+        """
+        Assets matching all the given conditions, as a new inventory in listing order.
+
+        Args:
+            asset_types: Asset type or types to keep, e.g. "IMAGE".
+            min_depth: Minimum number of path parts, e.g. 4 for projects/p/assets/folder.
+            max_depth: Maximum number of path parts.
+        """
+        masks = []
+        if asset_types is not None:
+            masks.append(self._type_mask([asset_types] if isinstance(asset_types, str) else asset_types))
+        if min_depth is not None or max_depth is not None:
+            masks.append(self._depth_mask(min_depth, max_depth))
+        if not masks:
+            return self._take(range(len(self)))
+        # AND of the 0/1 masks, as integers
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = (int.from_bytes(mask, "little") & int.from_bytes(other, "little")).to_bytes(len(self), "little")
+        return self._take(compress(range(len(self)), mask))
+
+    def _sizes(self) -> List[int | None]:
+        return [size if size >= 0 else None for size in self._size]
+
+    def to_arrow(self) -> Any:
+        """
+        Assets as a pyarrow Table with columns name, type (dictionary encoded), depth and size_bytes (null when
+        unknown). Requires pyarrow.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "AssetInventory.to_arrow requires pyarrow. Install it with pip install gee-toolbox[parquet]"
+            ) from e
+        return pa.table(
+            {
+                "name": pa.array(self.names(), pa.string()),
+                "type": pa.DictionaryArray.from_arrays(
+                    pa.array(list(self._type), pa.int8()), pa.array(self._types, pa.string())
+                ),
+                "depth": pa.array(self.depths(), pa.uint8()),
+                "size_bytes": pa.array(self._sizes(), pa.int64()),
+            }
+        )
+
+    def to_pandas(self) -> Any:
+        """Assets as a pandas DataFrame with the columns of to_arrow, type as a categorical. Requires pandas."""
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("AssetInventory.to_pandas requires pandas") from e
+        return pd.DataFrame(
+            {
+                "name": self.names(),
+                "type": pd.Categorical.from_codes(list(self._type), categories=self._types),
+                "depth": pd.array(self.depths(), dtype="uint8"),
+                "size_bytes": pd.array(self._sizes(), dtype="Int64"),
+            }
+        )
+
+
+class AssetIndex:
+    """
+    Path index over an inventory, answering "everything under X", "children of Y" and "ancestors of Z" without
+    listing again or scanning the whole inventory, e.g. to plan several prunes against the same listing:
+
+        index = AssetIndex(list_assets(root, recursive=True, expand_image_collections=True, as_inventory=True))
+        prune(f"{root}/tmp", index=index, silent=True)
+
+    Rows are kept sorted by path. "/" sorts right after "-" and ".", so the subtree of X is the contiguous range of
+    paths between "X/" and "X0" ("0" follows "/"), found with two bisections: O(log n + k). Children of each
+    container are kept in listing order, so walks over the index return assets in the same order as list_assets.
+
+    Args:
+        inventory: AssetInventory, or asset records with at least name and type.
+    """
+
+    def __init__(self, inventory: AssetInventory | Iterable[Dict[str, Any]]):
+        if not isinstance(inventory, AssetInventory):
+            inventory = AssetInventory(inventory)
+        self.inventory = inventory
+        names = inventory.names()
+        # Rows of the inventory sorted by path, and children rows per parent index
+        self._order = array("I", sorted(range(len(names)), key=names.__getitem__))
+        self._names = [names[row] for row in self._order]
+        self._children: Dict[int, array] = {}
+        for row, parent in enumerate(inventory._parent):
+            self._children.setdefault(parent, array("I")).append(row)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _find(self, name: str) -> int | None:
+        # Inventory row of name, None if not indexed
+        name = name.strip("/")
+        i = bisect_left(self._names, name)
+        if i < len(self._names) and self._names[i] == name:
+            return self._order[i]
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def record(self, name: str) -> Dict[str, Any] | None:
+        """Record of an asset ({"name", "type"}, sizeBytes when known), None if not indexed."""
+        row = self._find(name)
+        return self.inventory._record(row) if row is not None else None
+
+    def type(self, name: str) -> str | None:
+        """Type of an asset, None if not indexed."""
+        row = self._find(name)
+        return self.inventory._types[self.inventory._type[row]] if row is not None else None
+
+    @staticmethod
+    def depth(name: str) -> int:
+        """Number of path parts, e.g. 4 for projects/p/assets/folder, as used to order deletions."""
+        return name.strip("/").count("/") + 1
+
+    def _subtree_range(self, name: str) -> range:
+        name = name.strip("/")
+        return range(bisect_left(self._names, name + "/"), bisect_left(self._names, name + "0"))
+
+    def subtree(self, name: str, inclusive: bool = False) -> List[Dict[str, Any]]:
+        """Records of every indexed asset below name, sorted by path. With inclusive=True name itself comes first."""
+        rows = [self._order[i] for i in self._subtree_range(name)]
+        root = self._find(name) if inclusive else None
+        if root is not None:
+            rows.insert(0, root)
+        return [self.inventory._record(row) for row in rows]
+
+    def children(self, name: str) -> List[Dict[str, Any]]:
+        """Records of the direct children of name, in listing order."""
+        parent = self.inventory._parent_index.get(name.strip("/"))
+        rows = self._children.get(parent, ()) if parent is not None else ()
+        return [self.inventory._record(row) for row in rows]
+
+    def ancestors(self, name: str) -> List[str]:
+        """Indexed ancestors of name, closest first."""
+        parts = name.strip("/").split("/")
+        candidates = ["/".join(parts[:i]) for i in range(len(parts) - 1, 0, -1)]
+        return [ancestor for ancestor in candidates if ancestor in self]
+
+    def levels(self, name: str, inclusive: bool = True) -> Dict[int, List[str]]:
+        """
+        Deletion plan of the whole subtree of name: paths grouped per depth, deepest level first, as used by prune.
+        Depths are read from the inventory, no path is split.
+        """
+        rows = [self._order[i] for i in self._subtree_range(name)]
+        root = self._find(name) if inclusive else None
+        if root is not None:
+            rows.insert(0, root)
+        levels: Dict[int, List[str]] = {}
+        for row in rows:
+            levels.setdefault(self.inventory._depth[row], []).append(self.inventory._name(row))
+        return dict(sorted(levels.items(), reverse=True))
@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+
+
+class PruneJournal:
+    """
+    Append-only JSON lines journal of a prune run.
+
+    The first line records the plan: the target asset, its type and every asset planned for deletion. Each following
+    line records one asset as deleted or failed. Reading the journal back after an interruption tells prune what is
+    left to do without listing the tree again.
+
+    Args:
+        path: Path of the journal file. Created on start, appended to when resuming.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "PruneJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def load(self) -> Dict[str, Any] | None:
+        """
+        Read the journal.
+
+        Returns:
+            None if the file does not exist or holds no plan. Otherwise a dict with keys "asset", "type", "assets"
+            (planned {"name", "type"} records), "deleted" (set of names) and "failed" (set of names that failed and
+            were not deleted afterwards).
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        plan = None
+        deleted, failed = set(), set()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line may be truncated if the run was killed while writing
+                    logging.warning(f"Ignoring unreadable journal line in {self.path}")
+                    continue
+                if entry["event"] == "plan":
+                    plan = entry
+                elif entry["event"] == "deleted":
+                    deleted.add(entry["name"])
+                    failed.discard(entry["name"])
+                elif entry["event"] == "failed":
+                    failed.add(entry["name"])
+
+        if plan is None:
+            return None
+        return {
+            "asset": plan["asset"],
+            "type": plan["type"],
+            "assets": [{"name": name, "type": type} for name, type in plan["assets"]],
+            "deleted": deleted,
+            "failed": failed,
+        }
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def start(self, asset: str, asset_type: str, asset_list: List[Dict[str, str]]) -> None:
+        """Start a new journal, overwriting any previous one, with the plan of a prune run."""
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write(
+            {
+                "event": "plan",
+                "asset": asset,
+                "type": asset_type,
+                "assets": [[item["name"], item["type"]] for item in asset_list],
+            }
+        )
+
+    def resume(self) -> None:
+        """Open an existing journal to append the results of a resumed run."""
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, name: str, deleted: bool) -> None:
+        """Record the outcome of deleting one asset."""
+        self._write({"event": "deleted" if deleted else "failed", "name": name})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
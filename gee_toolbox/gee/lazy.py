@@ -0,0 +1,38 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access, e.g. ee = LazyModule("ee"); ee.data.getAsset.
+
+    Importing ee and geetools takes about a second, most of it spent before any Earth Engine call is made. Modules
+    of gee_toolbox bind heavy dependencies with LazyModule so that importing them, running --help or reading the
+    listing cache does not pay for it.
+
+    Args:
+        name: Name of the module to import.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None or self._name in sys.modules else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def is_loaded(name: str) -> bool:
+    """Return True if module name has been imported."""
+    return name in sys.modules
@@ -0,0 +1,187 @@
+import os
+import threading
+from collections import Counter
+from typing import Any, Dict, List
+
+from gee_toolbox.gee import governor
+
+# Upper bounds in seconds of the latency histogram buckets (Prometheus client defaults)
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class Recorder:
+    """
+    Base metrics recorder, records nothing. Subclasses receive every attempt of every Earth Engine call made through
+    the governor. Install one with enable().
+    """
+
+    def observe(self, method: str, started: int, duration: float, error: BaseException | None) -> None:
+        """
+        Called after each attempt of an Earth Engine call.
+
+        Args:
+            method: ee.data method name, e.g. "listAssets".
+            started: Start time of the attempt in nanoseconds since the epoch.
+            duration: Duration of the attempt in seconds.
+            error: Error raised by the attempt, None if it succeeded.
+        """
+
+    def retried(self, method: str, error: BaseException) -> None:
+        """Called when a failed attempt is going to be retried."""
+
+
+class _MethodStats:
+    def __init__(self, buckets: List[float]):
+        self.count = 0
+        self.retries = 0
+        self.errors: Counter = Counter()
+        self.sum = 0.0
+        self.buckets = [0] * len(buckets)
+
+
+class MetricsRecorder(Recorder):
+    """
+    Recorder keeping, per ee.data method, call counts, a latency histogram, error counts per error class (throttled,
+    not_found, transient, ...) and retry counts. Thread safe. Export with to_prometheus or snapshot.
+
+    Args:
+        buckets: Upper bounds in seconds of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: List[float] = DEFAULT_BUCKETS):
+        self.buckets = sorted(buckets)
+        self._stats: Dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def _method(self, method: str) -> _MethodStats:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = _MethodStats(self.buckets)
+        return stats
+
+    def observe(self, method: str, started: int, duration: float, error: BaseException | None) -> None:
+        with self._lock:
+            stats = self._method(method)
+            stats.count += 1
+            stats.sum += duration
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    stats.buckets[i] += 1
+                    break
+            if error is not None:
+                stats.errors[governor.error_class(error)] += 1
+
+    def retried(self, method: str, error: BaseException) -> None:
+        with self._lock:
+            self._method(method).retries += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Current metrics as a dict per method with "count", "retries", "errors" (dict per error class),
+        "sum" (total seconds) and "buckets" (cumulative count per upper bound, "+Inf" last).
+        """
+        with self._lock:
+            result = {}
+            for method, stats in self._stats.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets, stats.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                buckets["+Inf"] = stats.count
+                result[method] = {
+                    "count": stats.count,
+                    "retries": stats.retries,
+                    "errors": dict(stats.errors),
+                    "sum": stats.sum,
+                    "buckets": buckets,
+                }
+            return result
+
+    def to_prometheus(self, prefix: str = "gee_toolbox_ee") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Earth Engine call attempts.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        lines += [f'{prefix}_calls_total{{method="{m}"}} {s["count"]}' for m, s in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_errors_total Failed Earth Engine call attempts per error class.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [
+            f'{prefix}_errors_total{{method="{m}",error="{error}"}} {count}'
+            for m, s in snapshot.items()
+            for error, count in s["errors"].items()
+        ]
+        lines += [
+            f"# HELP {prefix}_retries_total Retried Earth Engine call attempts.",
+            f"# TYPE {prefix}_retries_total counter",
+        ]
+        lines += [f'{prefix}_retries_total{{method="{m}"}} {s["retries"]}' for m, s in snapshot.items()]
+        lines += [
+            f"# HELP {prefix}_call_duration_seconds Earth Engine call attempt latency.",
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        for m, s in snapshot.items():
+            lines += [
+                f'{prefix}_call_duration_seconds_bucket{{method="{m}",le="{bound}"}} {count}'
+                for bound, count in s["buckets"].items()
+            ]
+            lines.append(f'{prefix}_call_duration_seconds_sum{{method="{m}"}} {s["sum"]}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{method="{m}"}} {s["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | os.PathLike, prefix: str = "gee_toolbox_ee") -> None:
+        """Write to_prometheus to a file, e.g. for the node exporter textfile collector."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+
+
+class OpenTelemetryRecorder(Recorder):
+    """
+    Recorder exporting every Earth Engine call attempt as an OpenTelemetry span named "ee.data.<method>", child of
+    the span current in the calling thread. Requires opentelemetry-api, spans go to the configured tracer provider.
+
+    Args:
+        tracer: Tracer to use. Defaults to the gee_toolbox tracer of the global tracer provider.
+    """
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryRecorder requires opentelemetry-api. Install it with pip install gee-toolbox[otel]"
+            ) from e
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("gee_toolbox")
+
+    def observe(self, method: str, started: int, duration: float, error: BaseException | None) -> None:
+        span = self._tracer.start_span(
+            f"ee.data.{method}", start_time=started, attributes={"ee.method": method}
+        )
+        if error is not None:
+            span.set_attribute("ee.error_class", governor.error_class(error))
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        span.end(end_time=started + int(duration * 1e9))
+
+    def retried(self, method: str, error: BaseException) -> None:
+        span = self._trace.get_current_span()
+        span.add_event("ee.retry", {"ee.method": method, "ee.error_class": governor.error_class(error)})
+
+
+def enable(recorder: Recorder | None = None) -> Recorder:
+    """
+    Start recording Earth Engine calls, with a new MetricsRecorder by default. Returns the recorder, e.g.
+    recorder = metrics.enable(); assets.prune(...); print(recorder.to_prometheus())
+    """
+    recorder = recorder if recorder is not None else MetricsRecorder()
+    governor.set_recorder(recorder)
+    return recorder
+
+
+def disable() -> None:
+    """Stop recording Earth Engine calls. Recording is disabled by default and then costs nothing."""
+    governor.set_recorder(None)
@@ -0,0 +1,185 @@
+import json
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, TextIO
+
+from gee_toolbox.gee import governor
+
+# Minimum number of seconds between two progress events of a stage
+DEFAULT_INTERVAL = 1.0
+
+# A progress callback receives one event dict, see Progress
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class Progress:
+    """
+    Progress tracker of one stage of a long operation, e.g. listing or deleting.
+
+    Workers report finished items with update. At most every `interval` seconds, and once when the stage is closed,
+    callback receives an event dict with keys:
+        - "stage": stage name
+        - "done", "failed": items processed so far, and how many of them failed
+        - "total": expected number of items, None if unknown (listing)
+        - "rate": items per second since the stage started
+        - "eta": estimated seconds left, None if total is unknown
+        - "elapsed": seconds since the stage started
+        - "in_flight", "retries", "throttled": Earth Engine calls running now, and retries / throttling errors of
+          the shared governor since the stage started
+        - "finished": True on the last event of the stage
+        - "time": Unix timestamp of the event
+
+    Use as a context manager to close the stage on exit.
+
+    Args:
+        stage: Name of the stage.
+        callback: Function receiving the events.
+        total: Expected number of items.
+        interval: Minimum number of seconds between two events.
+        clock: Monotonic clock, replaceable for testing.
+    """
+
+    def __init__(
+        self,
+        stage: str,
+        callback: ProgressCallback,
+        total: int | None = None,
+        interval: float = DEFAULT_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.stage = stage
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self._callback = callback
+        self._interval = interval
+        self._clock = clock
+        self._governor = governor.get_governor()
+        self._retries = self._governor.retries
+        self._throttled = self._governor.throttled
+        self._started = clock()
+        self._last_event = self._started
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def event(self, finished: bool = False) -> Dict[str, Any]:
+        """Current state of the stage as an event dict."""
+        elapsed = self._clock() - self._started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None:
+            eta = (self.total - self.done) / rate if rate > 0 else None
+        return {
+            "stage": self.stage,
+            "done": self.done,
+            "failed": self.failed,
+            "total": self.total,
+            "rate": rate,
+            "eta": eta,
+            "elapsed": elapsed,
+            "in_flight": self._governor.in_flight,
+            "retries": self._governor.retries - self._retries,
+            "throttled": self._governor.throttled - self._throttled,
+            "finished": finished,
+            "time": time.time(),
+        }
+
+    def update(self, n: int = 1, failed: int = 0) -> None:
+        """Report n more items processed, failed of which failed. Thread safe."""
+        with self._lock:
+            self.done += n
+            self.failed += failed
+            now = self._clock()
+            if now - self._last_event < self._interval:
+                return
+            self._last_event = now
+            event = self.event()
+        self._callback(event)
+
+    def close(self) -> None:
+        """Send the final event of the stage."""
+        with self._lock:
+            event = self.event(finished=True)
+        self._callback(event)
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return "?" if seconds is None else str(timedelta(seconds=int(seconds)))
+
+
+class TqdmRenderer:
+    """
+    Progress callback drawing one updating status line per stage, tqdm style, e.g.
+    delete: 1200/5000 24% | 51.2/s | ETA 0:01:14 | in flight 8 | retries 3 (throttled 1) | failed 0
+
+    Args:
+        file: Output stream. Defaults to stderr.
+    """
+
+    def __init__(self, file: TextIO | None = None):
+        self.file = file or sys.stderr
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        if event["total"] is not None:
+            percent = 100 * event["done"] // event["total"] if event["total"] else 100
+            count = f"{event['done']}/{event['total']} {percent}%"
+        else:
+            count = str(event["done"])
+        line = (
+            f"{event['stage']}: {count} | {event['rate']:.1f}/s | ETA {_format_seconds(event['eta'])} | "
+            f"in flight {event['in_flight']} | retries {event['retries']} (throttled {event['throttled']}) | "
+            f"failed {event['failed']}"
+        )
+        self.file.write("\r" + line + ("\n" if event["finished"] else ""))
+        self.file.flush()
+
+
+class JsonLinesEmitter:
+    """
+    Progress callback writing every event as a JSON line, for log shipping or dashboards.
+
+    Args:
+        file: Path of a file to append to, or an open text stream.
+    """
+
+    def __init__(self, file: str | os.PathLike | TextIO):
+        if isinstance(file, (str, os.PathLike)):
+            self.file = open(file, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self.file = file
+            self._owned = False
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.file.write(json.dumps(event) + "\n")
+            self.file.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self.file.close()
+
+
+def resolve(progress: bool | ProgressCallback | None) -> ProgressCallback | None:
+    """Callback for a progress argument: None or False disables progress, True renders it on stderr."""
+    if progress is None or progress is False:
+        return None
+    if progress is True:
+        return TqdmRenderer()
+    return progress
+
+
+def stage(
+    name: str, callback: ProgressCallback | None, total: int | None = None
+) -> Progress | None:
+    """Progress tracker for a stage, None if callback is None."""
+    return Progress(name, callback, total=total) if callback is not None else None
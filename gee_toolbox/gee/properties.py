@@ -0,0 +1,107 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, List
+
+from gee_toolbox.gee import assets, governor
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.lazy import LazyModule
+
+# Imported on first use, importing ee takes a noticeable part of a second
+ee = LazyModule("ee")
+
+Properties = Dict[str, Any] | Callable[[Dict[str, Any]], Dict[str, Any] | None]
+
+
+def _update_request(properties: Dict[str, Any]) -> tuple:
+    # updateAsset arguments for a properties dict. A None value removes the property: it is in the update mask but
+    # not in the new value
+    value = {"properties": {key: v for key, v in properties.items() if v is not None}}
+    update_mask = [f"properties.{key}" for key in properties]
+    return value, update_mask
+
+
+def _update_asset(asset: str, properties: Dict[str, Any]) -> bool:
+    # updateAsset sets the listed fields to the same value on every attempt, so retrying it is safe
+    try:
+        governor.call(ee.data.updateAsset, asset, *_update_request(properties))
+        assets._metadata_cache.pop(asset)
+        return True
+    except Exception as e:
+        logging.warning(e)
+        return False
+
+
+def update_properties(
+    parent: str,
+    properties: Properties,
+    asset_types: str | List[str] = "IMAGE",
+    recursive: bool = False,
+    expand_image_collections: bool = True,
+    dry_run: bool = False,
+    workers: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Sets properties on every asset of a folder or image collection, e.g. every image of a collection.
+
+    Assets are streamed from iter_assets in batches of workers x 100 and each batch is updated with concurrent
+    ee.data.updateAsset calls through the shared rate limiter, retrying transient errors. Only the given properties
+    are written, other properties are kept.
+
+    Args:
+        parent: Path of the folder or image collection.
+        properties: Dict of properties to set on every asset, or a function taking the listing record of an asset
+            (name, type, updateTime, ...) and returning its properties dict, or None to leave it untouched.
+            A None property value removes that property.
+        asset_types: Asset types to update. Defaults to 'IMAGE'. If empty, all asset types are updated.
+        recursive: Include assets in sub-folders.
+        expand_image_collections: Include images inside image collections.
+        dry_run: List the assets to update without updating them.
+        workers: Maximum number of concurrent Earth Engine calls.
+        cache: Optional AssetCache used to list the assets.
+
+    Returns:
+        Dict with the assets "updated", that "failed" to update and "skipped" (function returned None, or dry run).
+    """
+
+    records = assets.iter_assets(
+        parent,
+        asset_types=asset_types,
+        recursive=recursive,
+        expand_image_collections=expand_image_collections,
+        workers=workers,
+        cache=cache,
+        full_records=callable(properties),
+    )
+    results = {"updated": [], "failed": [], "skipped": []}
+
+    def _update(item: tuple) -> bool:
+        return _update_asset(*item)
+
+    batch_size = max(1, workers) * 100
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+
+            updates = []
+            for record in batch:
+                new = properties(record) if callable(properties) else properties
+                if new:
+                    updates.append((record["name"], new))
+                else:
+                    results["skipped"].append(record["name"])
+
+            if dry_run:
+                results["skipped"] += [name for name, _ in updates]
+                continue
+            for (name, _), updated in zip(updates, executor.map(_update, updates)):
+                results["updated" if updated else "failed"].append(name)
+
+    if dry_run:
+        print(f"Dry run, {len(results['skipped'])} items would be updated in {parent}")
+    else:
+        print(f"Updated {len(results['updated'])} items, {len(results['failed'])} items failed")
+    return results
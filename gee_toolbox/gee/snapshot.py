@@ -0,0 +1,171 @@
+import os
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict
+
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.cache import AssetCache
+
+# Columns of a snapshot file, one row per asset
+SNAPSHOT_COLUMNS = ["name", "type", "update_time", "size_bytes"]
+
+# Rows per Parquet row group, also the number of listing records held in memory while writing a snapshot
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+        import pyarrow.compute
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Snapshots require pyarrow. Install it with pip install gee-toolbox[parquet]"
+        ) from e
+    return pa
+
+
+def _schema(pa: Any) -> Any:
+    return pa.schema(
+        [
+            ("name", pa.string()),
+            ("type", pa.dictionary(pa.int8(), pa.string())),
+            ("update_time", pa.string()),
+            ("size_bytes", pa.int64()),
+        ]
+    )
+
+
+def snapshot(
+    parent: str,
+    path: str | os.PathLike,
+    recursive: bool = True,
+    expand_image_collections: bool = True,
+    workers: int = assets.DEFAULT_WORKERS,
+    page_size: int = assets.DEFAULT_PAGE_SIZE,
+    cache: AssetCache | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Writes a snapshot of an asset tree to a Parquet file, one row per asset with its name, type, updateTime and
+    sizeBytes (columns SNAPSHOT_COLUMNS). Requires pyarrow.
+
+    The tree is walked once with iter_assets and written one row group at a time, so at most row_group_size listing
+    records are held in memory whatever the size of the tree. The parent and the snapshot time are stored in the file
+    metadata. Compare two snapshots with diff_snapshots.
+
+    Args:
+        parent: Path of the folder or image collection. It is included.
+        path: Output Parquet file.
+        recursive: Include sub-folders.
+        expand_image_collections: Include images inside image collections.
+        workers: Maximum number of concurrent listAssets calls.
+        page_size: Number of assets requested per listAssets call.
+        cache: Optional AssetCache used to list the tree. Cached records have no sizeBytes.
+        row_group_size: Rows per Parquet row group.
+
+    Returns:
+        Number of assets written.
+    """
+
+    pa = _pyarrow()
+    records = assets.iter_assets(
+        parent,
+        recursive=recursive,
+        inclusive=True,
+        expand_image_collections=expand_image_collections,
+        page_size=page_size,
+        workers=workers,
+        cache=cache,
+        full_records=True,
+    )
+    schema = _schema(pa).with_metadata(
+        {
+            "gee_toolbox.parent": parent.strip("/"),
+            "gee_toolbox.snapshot_time": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+
+    count = 0
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        while True:
+            batch = list(islice(records, row_group_size))
+            if not batch:
+                break
+            writer.write_batch(
+                pa.record_batch(
+                    [
+                        pa.array([record["name"] for record in batch], pa.string()),
+                        pa.array([record["type"] for record in batch], pa.string()).dictionary_encode(),
+                        pa.array([record.get("updateTime") for record in batch], pa.string()),
+                        pa.array(
+                            [int(record["sizeBytes"]) if "sizeBytes" in record else None for record in batch],
+                            pa.int64(),
+                        ),
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(batch)
+
+    print(f"Wrote {count} assets of {parent} to {path}")
+    return count
+
+
+def diff_snapshots(a: str | os.PathLike, b: str | os.PathLike) -> Dict[str, Any]:
+    """
+    Compares two snapshots written by snapshot, e.g. yesterday's (a) and today's (b). Requires pyarrow.
+
+    The snapshots are joined on name with a pyarrow hash join and compared with pyarrow compute kernels, no row is
+    looked at in Python. Only the snapshot columns are read, a few hundred bytes per asset of both files.
+
+    Args:
+        a: Older snapshot file.
+        b: Newer snapshot file.
+
+    Returns:
+        Dict of pyarrow Tables:
+            - "added": assets only in b, with the snapshot columns of b.
+            - "removed": assets only in a, with the snapshot columns of a.
+            - "modified": assets in both whose type, update_time or size_bytes changed, with name and the columns of
+              both snapshots suffixed _a and _b.
+    """
+
+    pa = _pyarrow()
+    pc = pa.compute
+    # Dictionary columns cannot be join payloads, compare types as plain strings
+    tables = []
+    for path in [a, b]:
+        table = pa.parquet.read_table(path, columns=SNAPSHOT_COLUMNS)
+        tables.append(table.set_column(1, "type", table.column("type").cast(pa.string())))
+    table_a, table_b = tables
+
+    joined = table_a.join(table_b, keys="name", join_type="full outer", left_suffix="_a", right_suffix="_b")
+    in_a, in_b = pc.is_valid(joined["type_a"]), pc.is_valid(joined["type_b"])
+
+    def _changed(column: str) -> Any:
+        # Not equal, with null on only one side counting as a change
+        left, right = joined[f"{column}_a"], joined[f"{column}_b"]
+        return pc.or_(pc.fill_null(pc.not_equal(left, right), False), pc.xor(pc.is_valid(left), pc.is_valid(right)))
+
+    changed = pc.or_(pc.or_(_changed("type"), _changed("update_time")), _changed("size_bytes"))
+    columns = SNAPSHOT_COLUMNS[1:]
+
+    def _side(mask: Any, suffix: str) -> Any:
+        selected = joined.filter(mask)
+        return pa.table(
+            [selected["name"]] + [selected[f"{column}{suffix}"] for column in columns], names=SNAPSHOT_COLUMNS
+        )
+
+    diff = {
+        "added": _side(pc.invert(in_a), "_b"),
+        "removed": _side(pc.invert(in_b), "_a"),
+        "modified": joined.filter(pc.and_(pc.and_(in_a, in_b), changed)).select(
+            ["name"] + [f"{column}{suffix}" for column in columns for suffix in ["_a", "_b"]]
+        ),
+    }
+    print(
+        f"{diff['added'].num_rows} assets added, {diff['removed'].num_rows} removed, "
+        f"{diff['modified'].num_rows} modified"
+    )
+    return diff
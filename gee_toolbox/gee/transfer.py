@@ -0,0 +1,410 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from gee_toolbox.gee import assets, governor
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.where import _parse_time
+from gee_toolbox.gee.lazy import LazyModule
+
+# Imported on first use, importing ee takes a noticeable part of a second
+ee = LazyModule("ee")
+
+CONTAINER_TYPES = ["FOLDER", "IMAGE_COLLECTION"]
+
+# Outcomes of copying one asset
+COPIED, SKIPPED, FAILED = "copied", "skipped", "failed"
+
+
+def _destination(name: str, src: str, dst: str) -> str:
+    # Path of name once src is copied to dst
+    return dst + name[len(src) :]
+
+
+def _ancestors(name: str, root: str) -> Iterable[str]:
+    # Containers between root (inclusive) and name (exclusive)
+    while name != root and "/" in name:
+        name = name.rsplit("/", 1)[0]
+        yield name
+        if name == root:
+            return
+
+
+def _create_container(path: str, asset_type: str) -> bool:
+    # Create a folder or image collection, return False instead of raising if it fails after retrying transient errors.
+    # An existing container is reused
+    try:
+        governor.call(ee.data.createAsset, {"type": asset_type}, path)
+        return True
+    except ee.EEException as e:
+        if governor.is_already_exists_error(e):
+            return True
+        logging.warning(e)
+        return False
+    except Exception as e:
+        logging.warning(e)
+        return False
+
+
+def _copy_asset(source: str, destination: str, overwrite: bool = False) -> str:
+    # Copy a single asset. Return COPIED, SKIPPED if the destination exists and overwrite=False, or FAILED
+    attempts = 0
+
+    @governor.endpoint("copyAsset")
+    def _copy() -> str:
+        nonlocal attempts
+        attempts += 1
+        try:
+            ee.data.copyAsset(source, destination, overwrite)
+        except ee.EEException as e:
+            if governor.is_already_exists_error(e):
+                # copyAsset is not idempotent: an attempt that timed out may have copied the asset on the server
+                return COPIED if attempts > 1 else SKIPPED
+            raise e
+        return COPIED
+
+    try:
+        outcome = governor.call(_copy)
+        assets._metadata_cache.pop(destination)
+        return outcome
+    except Exception as e:
+        logging.warning(e)
+        return FAILED
+
+
+def _order_top_down(names: Iterable[str]) -> Dict[int, List[str]]:
+    # Group asset names per level of hierarchy, shallowest level first (reverse of prune's order)
+    return dict(reversed(assets._order_by_level(names).items()))
+
+
+def _iter_tree(
+    src: str, src_type: str, workers: int, cache: AssetCache | None, full_records: bool = False
+) -> Iterator[Dict[str, Any]]:
+    # Every asset of a tree, root included, in depth-first pre-order
+    return assets._iter_assets(
+        src,
+        src_type,
+        assets.ALLOWED_ASSET_TYPES,
+        recursive=True,
+        inclusive=True,
+        expand_image_collections=True,
+        image_collections_exclusively=False,
+        workers=workers,
+        cache=cache,
+        full_records=full_records,
+    )
+
+
+def _list_tree(
+    src: str, src_type: str, workers: int, cache: AssetCache | None, full_records: bool = False
+) -> List[Dict[str, Any]]:
+    return list(_iter_tree(src, src_type, workers, cache, full_records))
+
+
+def _copy_records(
+    records: List[Dict[str, Any]],
+    src: str,
+    dst: str,
+    overwrite: bool,
+    workers: int,
+    cache: AssetCache | None = None,
+) -> Dict[str, str]:
+    # Copy listed records from src to dst: containers are created level by level top-down, then leaves are copied
+    # concurrently. Return the outcome of every source name, in input order. The cached listings of the destination
+    # containers that received an asset are dropped
+    outcomes: Dict[str, str] = {record["name"]: FAILED for record in records}
+    containers = {record["name"]: record["type"] for record in records if record["type"] in CONTAINER_TYPES}
+    leaves = [record["name"] for record in records if record["type"] not in CONTAINER_TYPES]
+    failed_containers = set()
+
+    def _blocked(name: str) -> bool:
+        # A container above name could not be created
+        return any(ancestor in failed_containers for ancestor in _ancestors(name, src))
+
+    def _create(name: str) -> str:
+        if _blocked(name):
+            return FAILED
+        return COPIED if _create_container(_destination(name, src, dst), containers[name]) else FAILED
+
+    def _copy(name: str) -> str:
+        if _blocked(name):
+            return FAILED
+        return _copy_asset(name, _destination(name, src, dst), overwrite)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        # executor.map returns once the whole level is processed, a barrier between levels
+        for level in _order_top_down(containers).values():
+            for name, outcome in zip(level, executor.map(_create, level)):
+                outcomes[name] = outcome
+                if outcome == FAILED:
+                    failed_containers.add(name)
+
+        # Submit in chunks so 200k leaves do not become 200k pending futures
+        chunk_size = max(1, workers) * 100
+        for start in range(0, len(leaves), chunk_size):
+            chunk = leaves[start : start + chunk_size]
+            for name, outcome in zip(chunk, executor.map(_copy, chunk)):
+                outcomes[name] = outcome
+
+    if cache is not None:
+        for parent in {_destination(name, src, dst).rsplit("/", 1)[0] for name, o in outcomes.items() if o == COPIED}:
+            cache.invalidate_listing(parent)
+    return outcomes
+
+
+def _prepare(src: str, dst: str, cache: AssetCache | None) -> Tuple[str, str, str]:
+    # Normalized source and destination paths and the source type
+    src = assets._asset_id(src)
+    dst = assets._asset_id(dst)
+    if dst == src or dst.startswith(src + "/"):
+        raise ValueError(f"Destination {dst} is inside source {src}")
+    return src, dst, assets._get_asset_type(src, cache)
+
+
+def copy_tree(
+    src: str,
+    dst: str,
+    overwrite: bool = False,
+    dry_run: bool = False,
+    workers: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Copies a Google Earth Engine asset, folder or image collection with all its contents to a new path.
+
+    The source tree is listed with the concurrent lister. Folders and image collections are created at the destination
+    top-down, one hierarchy level at a time, then images and tables are copied concurrently with ee.data.copyAsset.
+    Every call goes through the shared rate limiter and transient errors are retried. Existing destination containers
+    are reused.
+
+    Args:
+        src: Path of the asset, folder or image collection to copy.
+        dst: Destination path. Its parent must exist. Can be in another cloud project.
+        overwrite: Replace existing destination images and tables. If False they are left untouched and reported as
+            skipped.
+        dry_run: List all assets to copy without copying them.
+        workers: Maximum number of concurrent Earth Engine calls, for listing and copying.
+        cache: Optional AssetCache used to list the source. Listings of the destination containers copied into are
+            dropped from it.
+
+    Returns:
+        Dict with the source paths of the assets "copied", that "failed" to copy (including everything below a
+        container that could not be created) and "skipped" (existing destination or dry run).
+
+    Raises:
+        ValueError: If src does not exist or dst is inside src.
+    """
+
+    src, dst, src_type = _prepare(src, dst, cache)
+    results = {"copied": [], "failed": [], "skipped": []}
+
+    if src_type in CONTAINER_TYPES:
+        records = _list_tree(src, src_type, workers, cache)
+    else:
+        records = [{"name": src, "type": src_type}]
+
+    if dry_run:
+        results["skipped"] = assets.get_asset_names(records)
+        print(f"Dry run, {len(records)} items would be copied from {src} to {dst}")
+        return results
+
+    print(f"Copying {len(records)} items from {src} to {dst}")
+    for name, outcome in _copy_records(records, src, dst, overwrite, workers, cache).items():
+        results[outcome].append(name)
+
+    print(
+        f"Copied {len(results['copied'])} items, {len(results['failed'])} items failed, "
+        f"{len(results['skipped'])} items skipped"
+    )
+    return results
+
+
+def move_tree(
+    src: str,
+    dst: str,
+    overwrite: bool = False,
+    dry_run: bool = False,
+    workers: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Moves a Google Earth Engine asset, folder or image collection with all its contents to a new path.
+
+    Works as copy_tree followed by a prune of the source: only assets copied successfully are deleted from the source,
+    deepest first, and a source container is only deleted once everything below it has been moved. Moving within or
+    across cloud projects works the same way.
+
+    Args:
+        src: Path of the asset, folder or image collection to move.
+        dst: Destination path. Its parent must exist.
+        overwrite: Replace existing destination images and tables. If False they are not moved and reported as
+            skipped, the source is kept.
+        dry_run: List all assets to move without moving them.
+        workers: Maximum number of concurrent Earth Engine calls, for listing, copying and deleting.
+        cache: Optional AssetCache used to list the source. Moved assets and the listings of the destination
+            containers moved into are invalidated in it.
+
+    Returns:
+        Dict with the source paths of the assets "moved", that "failed" to copy or to be deleted from the source and
+        "skipped" (existing destination, containers kept because something below them was not moved, or dry run).
+
+    Raises:
+        ValueError: If src does not exist or dst is inside src.
+    """
+
+    src, dst, src_type = _prepare(src, dst, cache)
+    results = {"moved": [], "failed": [], "skipped": []}
+
+    if src_type in CONTAINER_TYPES:
+        records = _list_tree(src, src_type, workers, cache)
+    else:
+        records = [{"name": src, "type": src_type}]
+
+    if dry_run:
+        results["skipped"] = assets.get_asset_names(records)
+        print(f"Dry run, {len(records)} items would be moved from {src} to {dst}")
+        return results
+
+    print(f"Moving {len(records)} items from {src} to {dst}")
+    outcomes = _copy_records(records, src, dst, overwrite, workers, cache)
+
+    # Containers holding anything that was not copied must stay
+    kept = set()
+    for name, outcome in outcomes.items():
+        if outcome != COPIED:
+            kept.update(_ancestors(name, src))
+
+    to_delete = []
+    for name, outcome in outcomes.items():
+        if outcome == FAILED:
+            results["failed"].append(name)
+        elif outcome == SKIPPED or name in kept:
+            results["skipped"].append(name)
+        else:
+            to_delete.append(name)
+
+    deleted = {"deleted": [], "failed": []}
+
+    def _on_result(name: str, is_deleted: bool) -> None:
+        if cache is not None and is_deleted:
+            cache.invalidate(name)
+
+    assets._delete_ordered(assets._order_by_level(to_delete), deleted, workers, on_result=_on_result)
+    results["moved"] = deleted["deleted"]
+    results["failed"].extend(deleted["failed"])
+
+    print(
+        f"Moved {len(results['moved'])} items, {len(results['failed'])} items failed, "
+        f"{len(results['skipped'])} items skipped"
+    )
+    return results
+
+
+def _changed(src_record: Dict[str, Any], dst_record: Dict[str, Any]) -> bool:
+    # Whether a destination image or table is out of date: other type, other size, or source updated after it
+    if src_record["type"] != dst_record["type"]:
+        return True
+    if "sizeBytes" in src_record and "sizeBytes" in dst_record and src_record["sizeBytes"] != dst_record["sizeBytes"]:
+        return True
+    if "updateTime" in src_record and "updateTime" in dst_record:
+        return _parse_time(src_record["updateTime"]) > _parse_time(dst_record["updateTime"])
+    return False
+
+
+def sync_tree(
+    src: str,
+    dst: str,
+    delete_extraneous: bool = False,
+    dry_run: bool = False,
+    workers: int = assets.DEFAULT_WORKERS,
+    cache: AssetCache | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Makes dst a mirror of the folder or image collection src, copying only what changed.
+
+    Both trees are listed concurrently (a few listAssets calls per thousand assets) and diffed by relative path using
+    the type, sizeBytes and updateTime of the listing records. Only assets missing from dst or updated in src since
+    they were copied are copied, so the number of copy calls is proportional to the change set, not to the tree size.
+
+    Args:
+        src: Folder or image collection to mirror.
+        dst: Destination path. Created if it does not exist, its parent must exist.
+        delete_extraneous: Delete assets of dst that are not in src, deepest first. Assets of dst whose type differs
+            from the source, and their contents, are always deleted and copied again.
+        dry_run: Compute the changes without applying them.
+        workers: Maximum number of concurrent Earth Engine calls, for listing, copying and deleting.
+        cache: Optional AssetCache used to list both trees. Cached listings are trusted until they expire, use it only
+            if nothing else writes to the trees. Changed paths are invalidated in it.
+
+    Returns:
+        Dict with the source paths "copied", the destination paths "deleted", the paths that "failed" to copy or
+        delete, and the source paths "skipped" because they are up to date (all planned changes on a dry run).
+
+    Raises:
+        ValueError: If src is not a folder or image collection, or dst is inside src.
+    """
+
+    src, dst, src_type = _prepare(src, dst, cache)
+    if src_type not in CONTAINER_TYPES:
+        raise ValueError("sync_tree requires a Folder or Image Collection, use copy_tree to copy a single asset")
+    results = {"copied": [], "deleted": [], "failed": [], "skipped": []}
+
+    # Index the destination by relative path. A missing destination is an empty one
+    try:
+        dst_type = assets._get_asset_type(dst, cache)
+    except ValueError:
+        dst_type = None
+    dst_index: Dict[str, Dict[str, Any]] = {}
+    if dst_type in CONTAINER_TYPES:
+        for record in _iter_tree(dst, dst_type, workers, cache, full_records=True):
+            dst_index[record["name"][len(dst) :]] = record
+
+    # Stream the source against the index, keeping only what must be copied
+    to_copy = []
+    # Destination assets of another type than their source, e.g. a table where src has a folder. They cannot be
+    # overwritten or reused and are deleted before copying
+    to_replace = []
+    for record in _iter_tree(src, src_type, workers, cache, full_records=True):
+        dst_record = dst_index.pop(record["name"][len(src) :], None)
+        if dst_record is not None and dst_record["type"] != record["type"]:
+            to_replace.append(dst_record["name"])
+            to_copy.append({"name": record["name"], "type": record["type"]})
+        elif dst_record is None or (record["type"] not in CONTAINER_TYPES and _changed(record, dst_record)):
+            to_copy.append({"name": record["name"], "type": record["type"]})
+        else:
+            results["skipped"].append(record["name"])
+
+    # Contents of a replaced destination container go with it
+    for name in list(to_replace):
+        below = [path for path, record in dst_index.items() if record["name"].startswith(name + "/")]
+        to_replace += [dst_index.pop(path)["name"] for path in below]
+
+    # What is left in the index is not in the source
+    to_delete = [record["name"] for record in dst_index.values()] if delete_extraneous else []
+
+    if dry_run:
+        results["skipped"] = assets.get_asset_names(to_copy) + to_replace + to_delete
+        print(
+            f"Dry run, {len(to_copy)} items would be copied and {len(to_replace) + len(to_delete)} deleted in {dst}"
+        )
+        return results
+
+    print(f"Syncing {src} to {dst}: copying {len(to_copy)} items, deleting {len(to_replace) + len(to_delete)}")
+
+    def _on_result(name: str, is_deleted: bool) -> None:
+        if cache is not None and is_deleted:
+            cache.invalidate(name)
+
+    deleted = {"deleted": [], "failed": []}
+    assets._delete_ordered(assets._order_by_level(to_replace), deleted, workers, on_result=_on_result)
+    for name, outcome in _copy_records(to_copy, src, dst, True, workers, cache).items():
+        results[outcome].append(name)
+    assets._delete_ordered(assets._order_by_level(to_delete), deleted, workers, on_result=_on_result)
+    results["deleted"] = deleted["deleted"]
+    results["failed"].extend(deleted["failed"])
+
+    print(
+        f"Copied {len(results['copied'])} items, deleted {len(results['deleted'])}, "
+        f"{len(results['failed'])} items failed"
+    )
+    return results
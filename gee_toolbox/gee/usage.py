@@ -0,0 +1,145 @@
+import csv
+import os
+from typing import Any, Dict, Iterable, List
+
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.cache import AssetCache
+
+# Asset types whose size is stored by Earth Engine. Containers have no size of their own
+SIZED_ASSET_TYPES = ["IMAGE", "TABLE"]
+
+# Columns of a usage report row, after the container path
+USAGE_COLUMNS = ["assets", "bytes"] + assets.ALLOWED_ASSET_TYPES
+
+
+def _empty_usage() -> Dict[str, int]:
+    return {column: 0 for column in USAGE_COLUMNS}
+
+
+def size_bytes(record: Dict[str, Any]) -> int:
+    """Return the sizeBytes of an asset record (listAssets or getAsset) as an int, 0 if unknown."""
+    return int(record.get("sizeBytes") or 0)
+
+
+class UsageAggregator:
+    """
+    Streaming aggregation of asset counts and sizes per container.
+
+    Every added asset is counted, with its size, in each of its ancestor containers up to `root` (inclusive). Only one
+    entry per container is kept, never the assets themselves.
+
+    Args:
+        root: Path of the top container. Assets outside of it are ignored.
+    """
+
+    def __init__(self, root: str):
+        self.root = root.strip("/")
+        self.report: Dict[str, Dict[str, int]] = {self.root: _empty_usage()}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Add an asset record with at least name and type. sizeBytes is used when present."""
+        name, asset_type = record["name"], record["type"]
+        if asset_type in ["FOLDER", "IMAGE_COLLECTION"]:
+            self.report.setdefault(name, _empty_usage())
+        if name == self.root or not name.startswith(self.root + "/"):
+            return
+
+        size = size_bytes(record)
+        ancestor = name
+        while ancestor != self.root:
+            ancestor = ancestor.rsplit("/", 1)[0]
+            usage = self.report.setdefault(ancestor, _empty_usage())
+            usage["assets"] += 1
+            usage["bytes"] += size
+            usage[asset_type] = usage.get(asset_type, 0) + 1
+
+    @property
+    def total(self) -> Dict[str, int]:
+        """Usage of the root container."""
+        return self.report[self.root]
+
+
+def _write_report(report: Dict[str, Dict[str, int]], path: str | os.PathLike) -> None:
+    rows = [{"container": container, **usage} for container, usage in report.items()]
+    columns = ["container"] + USAGE_COLUMNS
+    if str(path).endswith(".parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Writing Parquet requires pyarrow. Install it with pip install gee-toolbox[parquet]"
+            ) from e
+        pq.write_table(pa.Table.from_pylist(rows), path)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def usage_report(
+    parent: str,
+    recursive: bool = True,
+    workers: int = assets.DEFAULT_WORKERS,
+    page_size: int = assets.DEFAULT_PAGE_SIZE,
+    cache: AssetCache | None = None,
+    path: str | os.PathLike | None = None,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Storage usage of a folder or image collection, aggregated per container up the hierarchy.
+
+    The tree is walked once with iter_assets, keeping full listing records. Images and tables whose listing record
+    carries no sizeBytes are fetched in batches with get_assets_metadata. Only one entry per container is held in
+    memory.
+
+    Args:
+        parent: path to the folder or image collection
+        recursive: Include sub-folders. Image collections are always expanded
+        workers: Maximum number of concurrent listAssets / getAsset calls
+        page_size: Number of assets requested per listAssets call
+        cache: Optional AssetCache consulted before calling listAssets
+        path: Optional output file. Written as Parquet if it ends with .parquet (requires pyarrow), CSV otherwise
+
+    Returns:
+        Dict mapping each container path (parent first) to a dict with the total number of assets below it ("assets"),
+        their size in bytes ("bytes") and a count per asset type.
+    """
+
+    records = assets.iter_assets(
+        parent,
+        recursive=recursive,
+        expand_image_collections=True,
+        page_size=page_size,
+        workers=workers,
+        cache=cache,
+        full_records=True,
+    )
+    aggregator = UsageAggregator(parent.strip("/"))
+
+    # Sizes missing from the listing are fetched in batches, concurrently
+    batch_size = max(1, workers) * 50
+    unsized: List[Dict[str, Any]] = []
+
+    def _flush(batch: Iterable[Dict[str, Any]]) -> None:
+        batch = list(batch)
+        metadata = assets.get_assets_metadata(
+            [record["name"] for record in batch], workers=workers
+        )
+        for record in batch:
+            aggregator.add(metadata[record["name"]] or record)
+
+    for record in records:
+        if record["type"] in SIZED_ASSET_TYPES and "sizeBytes" not in record:
+            unsized.append({"name": record["name"], "type": record["type"]})
+            if len(unsized) >= batch_size:
+                _flush(unsized)
+                unsized = []
+        else:
+            aggregator.add(record)
+    if unsized:
+        _flush(unsized)
+
+    if path is not None:
+        _write_report(aggregator.report, path)
+    return aggregator.report
@@ -0,0 +1,194 @@
+import fnmatch
+import json
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.usage import size_bytes
+
+# Keys of a where spec
+WHERE_KEYS = ["name", "regex", "updated_before", "properties", "min_bytes"]
+
+Where = Dict[str, Any] | Callable[[Dict[str, Any]], bool]
+
+
+def _parse_time(value: str | date | datetime) -> datetime:
+    # Timezone aware datetime from an RFC 3339 string, a date or a datetime. Naive values are taken as UTC
+    if isinstance(value, str):
+        # Earth Engine may return nanoseconds, datetime only parses up to microseconds
+        value = re.sub(r"(\.\d{6})\d+", r"\1", value.replace("Z", "+00:00"))
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def check_where(where: Where) -> None:
+    """Raise ValueError if where is neither a function nor a spec with known keys."""
+    if callable(where):
+        return
+    if not isinstance(where, dict):
+        raise ValueError("where must be a function or a dict spec")
+    unknown = [key for key in where if key not in WHERE_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown where keys {unknown}. Allowed keys are {WHERE_KEYS}")
+
+
+def predicate(where: Where) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Build the function selecting asset records for a where spec.
+
+    Args:
+        where: Either a function taking an asset record and returning True to select it, or a dict spec. All keys of a
+            spec must match:
+            - "name": glob matched against the full asset path, e.g. "*/tmp_*"
+            - "regex": regular expression searched in the full asset path
+            - "updated_before": updateTime cutoff, as an RFC 3339 string, date or datetime (UTC if naive), or a
+              timedelta for a maximum age, e.g. timedelta(days=30)
+            - "properties": dict of property values the asset must have
+            - "min_bytes": minimum sizeBytes
+
+    Raises:
+        ValueError: If the spec has unknown keys.
+    """
+    check_where(where)
+    if callable(where):
+        return where
+
+    checks: List[Callable[[Dict[str, Any]], bool]] = []
+    if "name" in where:
+        checks.append(lambda record: fnmatch.fnmatchcase(record["name"], where["name"]))
+    if "regex" in where:
+        pattern = re.compile(where["regex"])
+        checks.append(lambda record: pattern.search(record["name"]) is not None)
+    if "updated_before" in where:
+        cutoff = where["updated_before"]
+        if isinstance(cutoff, timedelta):
+            cutoff = datetime.now(timezone.utc) - cutoff
+        cutoff = _parse_time(cutoff)
+        checks.append(
+            lambda record: "updateTime" in record and _parse_time(record["updateTime"]) < cutoff
+        )
+    if "properties" in where:
+        properties = where["properties"]
+        checks.append(
+            lambda record: all(
+                key in record.get("properties", {}) and record["properties"][key] == value
+                for key, value in properties.items()
+            )
+        )
+    if "min_bytes" in where:
+        checks.append(lambda record: size_bytes(record) >= where["min_bytes"])
+
+    return lambda record: all(check(record) for check in checks)
+
+
+def needs_metadata(where: Where, record: Dict[str, Any]) -> bool:
+    """Return True if a listing record lacks a field the where spec reads, so its full metadata must be fetched."""
+    if callable(where):
+        return False
+    return (
+        ("properties" in where and "properties" not in record)
+        or ("min_bytes" in where and "sizeBytes" not in record and record["type"] in ["IMAGE", "TABLE"])
+        or ("updated_before" in where and "updateTime" not in record)
+    )
+
+
+def server_filter(where: Where) -> str | None:
+    """
+    listAssets filter expression for the part of a where spec Earth Engine can evaluate (property equality), None if
+    there is none. Only valid for the images of image collections.
+    """
+    if callable(where) or not where.get("properties"):
+        return None
+    return " AND ".join(
+        f"properties.{key} = {json.dumps(value)}" for key, value in where["properties"].items()
+    )
+
+
+class _Selection:
+    # Selection state of a pre-order stream of completed records, shared by iter_matching and aio.aprune: containers
+    # whose contents are still being read, innermost last, with whether they and everything read below them so far
+    # are selected
+
+    def __init__(self, where: Where):
+        self._select = predicate(where)
+        self._open: List[list] = []
+
+    def _close(self, name: str) -> Iterator[Dict[str, Any]]:
+        # Yield the open containers that name is not part of: their contents are complete
+        while self._open and not name.startswith(self._open[-1][0]["name"] + "/"):
+            record, selected = self._open.pop()
+            if selected:
+                yield record
+            elif self._open:
+                self._open[-1][1] = False
+
+    def add(self, record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Evaluate a record, yield the records it completes the selection of."""
+        yield from self._close(record["name"])
+        selected = self._select(record)
+        if record["type"] in ["FOLDER", "IMAGE_COLLECTION"]:
+            self._open.append([record, selected])
+        elif selected:
+            yield record
+        elif self._open:
+            self._open[-1][1] = False
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        """End of the stream, yield the selected containers still open."""
+        yield from self._close("")
+
+
+def _complete(batch: List[Dict[str, Any]], where: Where, workers: int) -> List[Dict[str, Any]]:
+    # Records of batch with their metadata when they lack a field the spec reads. Blocking, fetched with
+    # get_assets_metadata
+    metadata = assets.get_assets_metadata(
+        [record["name"] for record in batch if needs_metadata(where, record)], workers=workers
+    )
+    return [metadata.get(record["name"]) or record for record in batch]
+
+
+def iter_matching(
+    records: Iterable[Dict[str, Any]],
+    where: Where,
+    workers: int = assets.DEFAULT_WORKERS,
+    batch_size: int | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Filter a depth-first pre-order stream of asset records (as yielded by iter_assets) with a where spec.
+
+    The spec is evaluated on every record. A folder or image collection is only selected if it matches and all of its
+    listed contents are selected, since a container can only be deleted once empty: an old folder holding a fresh
+    image is kept along with the image. Containers are therefore yielded after their contents, other records in input
+    order. Records lacking a field the spec reads are completed with get_assets_metadata, in batches of batch_size
+    records (default workers x 50) so memory stays bounded.
+
+    Args:
+        records: Asset records, containers before their contents.
+        where: Function or dict spec, see predicate.
+        workers: Maximum number of concurrent getAsset calls.
+        batch_size: Number of records buffered per metadata batch.
+
+    Yields:
+        The selected records, completed with their metadata when it was fetched.
+    """
+    selection = _Selection(where)
+    batch_size = batch_size or max(1, workers) * 50
+
+    def _flush(batch: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for record in _complete(batch, where, workers):
+            yield from selection.add(record)
+
+    batch: List[Dict[str, Any]] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield from _flush(batch)
+            batch = []
+    if batch:
+        yield from _flush(batch)
+    yield from selection.close()
@@ -0,0 +1,93 @@
+"""
+Listing and deletion throughput against the in-process fake Earth Engine.
+
+Run with: pytest tests/benchmarks (add -m slow for the 100k assets cases, --benchmark-disable to only check them)
+"""
+import pytest
+
+from ..context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee import governor as _governor
+from ..fake_ee import FakeEarthEngine
+
+# Tree shapes of about 1k, 10k and 100k assets: folders x collections x images
+SHAPES = {
+    "1k": dict(folders=4, depth=1, collections=2, images=124, tables=2),
+    "10k": dict(folders=10, depth=1, collections=4, images=249, tables=5),
+    "100k": dict(folders=10, depth=2, collections=4, images=249, tables=5),
+}
+SIZES = [
+    "1k",
+    "10k",
+    pytest.param("100k", marks=pytest.mark.slow),
+]
+
+
+def _fake(monkeypatch, shape: str, **kwargs) -> tuple:
+    fake_ee = FakeEarthEngine(max_page_size=1000, **kwargs).install(monkeypatch)
+    root = fake_ee.build_tree(**SHAPES[shape])
+    return fake_ee, root
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("workers", [1, 8])
+def test_list_assets_throughput(benchmark, monkeypatch, size, workers):
+    fake_ee, root = _fake(monkeypatch, size)
+    listed = benchmark(
+        assets.list_assets,
+        root,
+        recursive=True,
+        expand_image_collections=True,
+        workers=workers,
+    )
+    assert len(listed) == fake_ee.size - 1
+    benchmark.extra_info["assets"] = len(listed)
+
+
+@pytest.mark.parametrize("size", ["1k", "10k"])
+def test_list_assets_with_latency(benchmark, monkeypatch, size):
+    # 2ms per call: concurrency hides the per-container round-trip
+    fake_ee, root = _fake(monkeypatch, size, latency=0.002)
+    listed = benchmark.pedantic(
+        assets.list_assets,
+        args=(root,),
+        kwargs=dict(recursive=True, expand_image_collections=True, workers=8),
+        rounds=3,
+    )
+    assert len(listed) == fake_ee.size - 1
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("workers", [1, 8])
+def test_prune_throughput(benchmark, monkeypatch, size, workers):
+    def _setup():
+        fake_ee, root = _fake(monkeypatch, size)
+        return (root,), dict(
+            recursive=True, expand_image_collections=True, silent=True, workers=workers
+        )
+
+    results = benchmark.pedantic(assets.prune, setup=_setup, rounds=3)
+    assert results["failed"] == []
+    benchmark.extra_info["assets"] = len(results["deleted"])
+
+
+@pytest.mark.parametrize("size", ["1k", "10k"])
+def test_prune_under_quota(benchmark, monkeypatch, size):
+    # Real (short) backoff sleeps, the default test governor does not wait between retries
+    _governor.set_governor(_governor.RequestGovernor(qps=None, base_delay=0.001, max_delay=0.05))
+
+    # More workers than the concurrency quota and 1% random throttling: retried, never reported as failed
+    def _setup():
+        fake_ee, root = _fake(monkeypatch, size, max_concurrent=4, throttle_rate=0.01)
+        return (root,), dict(
+            recursive=True, expand_image_collections=True, silent=True, workers=8
+        )
+
+    results = benchmark.pedantic(assets.prune, setup=_setup, rounds=2)
+    assert results["failed"] == []
+
+
+def test_planning_throughput(benchmark):
+    names = [f"projects/p/assets/f{i % 100}/ic{i % 7}/img{i}" for i in range(100_000)]
+    ordered = benchmark(assets._order_by_level, names)
+    assert sum(len(level) for level in ordered.values()) == len(names)
@@ -0,0 +1,38 @@
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from gee_toolbox.gee import governor as _governor
+from .fake_ee import FakeEarthEngine
+
+
+@pytest.fixture(autouse=True)
+def governor():
+    # No rate limit and no backoff delays in tests
+    test_governor = _governor.RequestGovernor(qps=None, sleep=lambda seconds: None)
+    previous = _governor.set_governor(test_governor)
+    yield test_governor
+    _governor.set_governor(previous)
+
+
+@pytest.fixture
+def fake_ee(monkeypatch) -> FakeEarthEngine:
+    return FakeEarthEngine().install(monkeypatch)
+
+
+class _Timer:
+    seconds: float = 0.0
+
+
+@pytest.fixture
+def benchmark_timer():
+    # Wall clock timer for coarse micro-benchmarks: with benchmark_timer() as t: ...; t.seconds
+    @contextmanager
+    def _timer():
+        timer = _Timer()
+        start = time.perf_counter()
+        yield timer
+        timer.seconds = time.perf_counter() - start
+
+    return _timer
@@ -0,0 +1,293 @@
+import ee
+import json
+import operator
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, List, Any
+
+
+def _parent_of(name: str) -> str:
+    return name.rsplit("/", 1)[0]
+
+
+_COMPARISONS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    "=": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+_TERM = re.compile(r"^([\w.]+)\s*(>=|<=|!=|=|>|<)\s*(.+)$")
+
+
+def _matches(record: Dict[str, Any], filter: str) -> bool:
+    # Evaluate the subset of the listAssets filter syntax built by gee_toolbox: comparisons on startTime, endTime or
+    # properties.<name> joined with AND. intersects() terms match every image
+    for term in filter.split(" AND "):
+        term = term.strip().removeprefix("(").removesuffix(")")
+        if term.startswith("intersects("):
+            continue
+        field, op, value = _TERM.match(term).groups()
+        if field.startswith("properties."):
+            actual = record.get("properties", {}).get(field.removeprefix("properties."))
+        else:
+            actual = record.get(field)
+        if actual is None or not _COMPARISONS[op](actual, json.loads(value)):
+            return False
+    return True
+
+
+class FakeEarthEngine:
+    """
+    In-process stand-in for the ee.data asset endpoints used by gee_toolbox.
+
+    Assets are kept as name -> record dicts indexed by parent, so listing a container only touches its own children.
+    Install it with pytest's monkeypatch (see the fake_ee fixture in conftest.py).
+    Every call sleeps `latency` seconds and the maximum number of concurrent calls is kept in `max_in_flight`.
+    Errors can be injected per endpoint with `inject`. When `list_fields` is set, listAssets records only carry
+    those fields (like the BASIC view), getAsset always returns the full record. listAssets evaluates simple `filter`
+    expressions (see _matches) and, like Earth Engine, only accepts them on image collections.
+
+    Quotas: listAssets never returns more than `max_page_size` records per page, calls beyond `max_concurrent`
+    in flight fail with "Too many concurrent requests", and a fraction `throttle_rate` of calls fail the same way at
+    random (seeded with `seed`).
+    """
+
+    def __init__(
+        self,
+        project: str = "projects/fake-project/assets",
+        latency: float = 0.0,
+        max_page_size: int | None = None,
+        max_concurrent: int | None = None,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.project = project
+        self.latency = latency
+        self.max_page_size = max_page_size
+        self.max_concurrent = max_concurrent
+        self.throttle_rate = throttle_rate
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, Dict[str, None]] = {}
+        self.calls: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.undeletable: set = set()
+        self.errors: Dict[str, List[tuple]] = {}
+        self.list_fields: set | None = None
+        self.acls: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self.add(project, "FOLDER")
+
+    @contextmanager
+    def _call(self, endpoint: str):
+        with self._lock:
+            self.calls[endpoint] += 1
+            over_quota = (
+                self.max_concurrent is not None and self.in_flight >= self.max_concurrent
+            ) or (self.throttle_rate and self._random.random() < self.throttle_rate)
+            if over_quota:
+                self.throttled += 1
+                raise ee.EEException("Too many concurrent requests.")
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            with self._lock:
+                after_effect, error = self._next_error(endpoint)
+                if error is not None and not after_effect:
+                    raise error
+                yield
+                if error is not None:
+                    raise error
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _next_error(self, endpoint: str) -> tuple:
+        pending = self.errors.get(endpoint)
+        return pending.pop(0) if pending else (False, None)
+
+    def inject(
+        self, endpoint: str, error: BaseException, times: int = 1, after_effect: bool = False
+    ) -> None:
+        """
+        Make the next `times` calls to endpoint raise error. With after_effect=True the call takes effect before
+        raising, like a request that times out after the server processed it.
+        """
+        with self._lock:
+            self.errors.setdefault(endpoint, []).extend([(after_effect, error)] * times)
+
+    def add(self, name: str, asset_type: str, **fields) -> str:
+        record = {"name": name, "id": name, "type": asset_type, **fields}
+        self.records[name] = record
+        self.children.setdefault(name, {})
+        if name != self.project:
+            self.children.setdefault(_parent_of(name), {})[name] = None
+        return name
+
+    def build_tree(
+        self,
+        root: str = "tree",
+        folders: int = 1,
+        depth: int = 1,
+        collections: int = 1,
+        images: int = 10,
+        tables: int = 0,
+    ) -> str:
+        """
+        Add a synthetic tree under project/root and return its path.
+
+        Every folder holds `folders` sub-folders down to `depth` levels, plus in the leaf folders `collections` image
+        collections of `images` images each and `tables` tables. The number of assets is returned by `size`.
+        """
+        root = self.add(self.path(root), "FOLDER")
+        level = [root]
+        for _ in range(depth):
+            level = [
+                self.add(f"{folder}/folder{i}", "FOLDER") for folder in level for i in range(folders)
+            ]
+        for folder in level:
+            for t in range(tables):
+                self.add(f"{folder}/table{t}", "TABLE", sizeBytes="1024")
+            for c in range(collections):
+                collection = self.add(f"{folder}/collection{c}", "IMAGE_COLLECTION")
+                for i in range(images):
+                    self.add(f"{collection}/image{i}", "IMAGE", sizeBytes="4096")
+        return root
+
+    @property
+    def size(self) -> int:
+        return len(self.records) - 1
+
+    def path(self, *parts: str) -> str:
+        return "/".join([self.project, *parts])
+
+    def names(self) -> List[str]:
+        return [name for name in self.records if name != self.project]
+
+    # ee.data endpoints
+    def getAsset(self, asset_id: str) -> Dict[str, Any]:
+        with self._call("getAsset"):
+            if asset_id not in self.records:
+                raise ee.EEException(f"Asset '{asset_id}' not found.")
+            return dict(self.records[asset_id])
+
+    def listAssets(self, params: str | dict) -> Dict[str, Any]:
+        if isinstance(params, str):
+            params = {"parent": params}
+        with self._call("listAssets"):
+            parent = params["parent"]
+            if parent == self.project:
+                # Like ee.data.listAssets, project roots are rewritten in place without their /assets suffix.
+                # A caller re-sending the same dict gets a path that does not exist
+                params["parent"] = parent.removesuffix("/assets")
+            elif parent == self.project.removesuffix("/assets"):
+                raise ee.EEException(f"Asset 'projects/earthengine-legacy/assets/{parent}' not found.")
+            if parent not in self.records:
+                raise ee.EEException(f"Asset '{parent}' not found.")
+            children = self.children[parent]
+            if params.get("filter"):
+                if self.records[parent]["type"] != "IMAGE_COLLECTION":
+                    raise ee.EEException("Filtering is only supported on image collections.")
+                children = [name for name in children if _matches(self.records[name], params["filter"])]
+            offset = int(params.get("pageToken") or 0)
+            page_size = int(params.get("pageSize") or len(children) or 1)
+            if self.max_page_size is not None:
+                page_size = min(page_size, self.max_page_size)
+            page = [dict(self.records[name]) for name in islice(children, offset, offset + page_size)]
+            if self.list_fields is not None:
+                page = [{k: v for k, v in record.items() if k in self.list_fields} for record in page]
+            response: Dict[str, Any] = {"assets": page}
+            if offset + page_size < len(children):
+                response["nextPageToken"] = str(offset + page_size)
+            return response
+
+    def createAsset(self, value: Dict[str, Any], opt_path: str | None = None) -> Dict[str, Any]:
+        with self._call("createAsset"):
+            if opt_path in self.records:
+                raise ee.EEException(f"Cannot overwrite asset '{opt_path}': asset already exists.")
+            if _parent_of(opt_path) not in self.records:
+                raise ee.EEException(f"Asset '{_parent_of(opt_path)}' not found.")
+            self.add(opt_path, value["type"])
+            return dict(self.records[opt_path])
+
+    def copyAsset(self, sourceId: str, destinationId: str, allowOverwrite: bool = False) -> None:
+        with self._call("copyAsset"):
+            if sourceId not in self.records:
+                raise ee.EEException(f"Asset '{sourceId}' not found.")
+            if destinationId in self.records and not allowOverwrite:
+                raise ee.EEException(f"Cannot overwrite asset '{destinationId}': asset already exists.")
+            if _parent_of(destinationId) not in self.records:
+                raise ee.EEException(f"Asset '{_parent_of(destinationId)}' not found.")
+            fields = {
+                k: v for k, v in self.records[sourceId].items() if k not in ["name", "id", "type"]
+            }
+            self.add(destinationId, self.records[sourceId]["type"], **fields)
+
+    def getAssetAcl(self, asset_id: str) -> Dict[str, Any]:
+        with self._call("getAssetAcl"):
+            if asset_id not in self.records:
+                raise ee.EEException(f"Asset '{asset_id}' not found.")
+            acl = self.acls.get(asset_id, {})
+            return {
+                "owners": list(acl.get("owners", [])),
+                "writers": list(acl.get("writers", [])),
+                "readers": list(acl.get("readers", [])),
+                "all_users_can_read": acl.get("all_users_can_read", False),
+            }
+
+    def setAssetAcl(self, asset_id: str, acl_update: Dict[str, Any]) -> None:
+        with self._call("setAssetAcl"):
+            if asset_id not in self.records:
+                raise ee.EEException(f"Asset '{asset_id}' not found.")
+            self.acls[asset_id] = dict(acl_update)
+
+    def updateAsset(self, asset_id: str, asset: Dict[str, Any], update_mask: List[str]) -> None:
+        with self._call("updateAsset"):
+            if asset_id not in self.records:
+                raise ee.EEException(f"Asset '{asset_id}' not found.")
+            record = self.records[asset_id]
+            properties = dict(record.get("properties", {}))
+            for field in update_mask:
+                key = field.removeprefix("properties.")
+                if key in asset.get("properties", {}):
+                    properties[key] = asset["properties"][key]
+                else:
+                    properties.pop(key, None)
+            record["properties"] = properties
+
+    def deleteAsset(self, asset_id: str) -> None:
+        with self._call("deleteAsset"):
+            if asset_id not in self.records:
+                raise ee.EEException(f"Asset '{asset_id}' not found.")
+            if self.children.get(asset_id):
+                raise ee.EEException(f"Asset '{asset_id}' is not empty.")
+            if asset_id in self.undeletable:
+                raise ee.EEException(f"Caller does not have permission to delete '{asset_id}'.")
+            del self.records[asset_id]
+            del self.children[asset_id]
+            self.children[_parent_of(asset_id)].pop(asset_id, None)
+
+    def install(self, monkeypatch) -> "FakeEarthEngine":
+        for endpoint in [
+            "getAsset",
+            "listAssets",
+            "deleteAsset",
+            "createAsset",
+            "copyAsset",
+            "getAssetAcl",
+            "setAssetAcl",
+            "updateAsset",
+        ]:
+            monkeypatch.setattr(ee.data, endpoint, getattr(self, endpoint))
+        return self
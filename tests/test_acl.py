@@ -0,0 +1,58 @@
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import acl
+from .test_prune import _build_tree
+
+GROUP = "group:team@example.com"
+
+
+@pytest.fixture
+def tree(fake_ee):
+    root = _build_tree(fake_ee)
+    fake_ee.acls[root] = {"owners": ["user:me@example.com"], "readers": [GROUP]}
+    return root
+
+
+def test_apply_acl_modes():
+    current = {"owners": ["user:a"], "readers": ["user:b"], "all_users_can_read": True}
+    merged = acl._apply_acl(current, {"readers": ["user:c"]}, "merge")
+    assert merged["readers"] == ["user:b", "user:c"] and merged["owners"] == ["user:a"]
+    assert merged["all_users_can_read"] is True
+    replaced = acl._apply_acl(current, {"readers": ["user:c"]}, "replace")
+    assert replaced["readers"] == ["user:c"] and replaced["owners"] == ["user:a"]
+
+
+def test_set_acl_tree_only_updates_changes(fake_ee, tree):
+    results = acl.set_acl_tree(tree, {"readers": [GROUP]}, workers=4)
+    # Folders, tables and image collections (images follow their collection)
+    assert len(results["updated"]) == 4 * 3
+    assert results["unchanged"] == [tree]
+    assert fake_ee.acls[fake_ee.path("root", "f0", "table")]["readers"] == [GROUP]
+    assert fake_ee.acls[tree]["owners"] == ["user:me@example.com"]
+
+    fake_ee.calls.clear()
+    again = acl.set_acl_tree(tree, {"readers": [GROUP]}, workers=4)
+    assert again["updated"] == [] and len(again["unchanged"]) == 1 + 4 * 3
+    assert fake_ee.calls["setAssetAcl"] == 0
+
+
+def test_set_acl_tree_dry_run(fake_ee, tree):
+    results = acl.set_acl_tree(tree, {"all_users_can_read": True}, expand_image_collections=True, dry_run=True)
+    assert len(results["skipped"]) == 1 + 4 * 8
+    assert fake_ee.calls["setAssetAcl"] == 0
+
+
+def test_set_acl_tree_reports_failures(fake_ee, tree):
+    fake_ee.inject("setAssetAcl", ee.EEException("Permission denied."), times=1)
+    results = acl.set_acl_tree(tree, {"readers": [GROUP]}, workers=1)
+    assert len(results["failed"]) == 1
+    assert len(results["updated"]) == 4 * 3 - 1
+
+
+def test_set_acl_tree_validates(fake_ee, tree):
+    with pytest.raises(ValueError):
+        acl.set_acl_tree(tree, {"viewers": [GROUP]})
+    with pytest.raises(ValueError):
+        acl.set_acl_tree(tree, {"readers": [GROUP]}, mode="append")
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import aio, assets
+from .test_prune import _build_tree
+
+
+@pytest.fixture
+def tree(fake_ee):
+    return _build_tree(fake_ee)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_alist_assets_matches_list_assets(fake_ee, tree, concurrency):
+    kwargs = dict(recursive=True, inclusive=True, expand_image_collections=True)
+    expected = assets.list_assets(tree, workers=1, **kwargs)
+    result = asyncio.run(aio.alist_assets(tree, concurrency=concurrency, **kwargs))
+    assert result == expected
+
+
+def test_alist_assets_filters_types(fake_ee, tree):
+    result = asyncio.run(
+        aio.alist_assets(tree, asset_types="IMAGE", recursive=True, expand_image_collections=True)
+    )
+    assert len(result) == 4 * 5
+    assert set(assets.get_asset_types(result)) == {"IMAGE"}
+
+
+def test_aiter_assets_stops_early(fake_ee, tree):
+    async def _first_two():
+        items = []
+        async for item in aio.aiter_assets(tree, recursive=True, concurrency=4):
+            items.append(item)
+            if len(items) == 2:
+                break
+        return items
+
+    assert len(asyncio.run(_first_two())) == 2
+
+
+def test_aprune_matches_prune(monkeypatch):
+    from .fake_ee import FakeEarthEngine
+
+    results = {}
+    for api in ["sync", "async"]:
+        fake_ee = FakeEarthEngine().install(monkeypatch)
+        tree = _build_tree(fake_ee)
+        fake_ee.undeletable.add(fake_ee.path("root", "f2", "ic", "img3"))
+        options = dict(recursive=True, expand_image_collections=True)
+        if api == "sync":
+            results[api] = assets.prune(tree, silent=True, workers=4, **options)
+        else:
+            results[api] = asyncio.run(aio.aprune(tree, concurrency=4, **options))
+    assert results["async"] == results["sync"]
+
+
+def test_aprune_dry_run(fake_ee, tree):
+    results = asyncio.run(
+        aio.aprune(tree, recursive=True, expand_image_collections=True, dry_run=True)
+    )
+    assert len(results["skipped"]) == 1 + 4 * 8
+    assert fake_ee.calls["deleteAsset"] == 0
+
+
+def test_aprune_validates_options(fake_ee, tree):
+    with pytest.raises(ValueError):
+        asyncio.run(aio.aprune(tree))
+
+
+def test_aprune_cancelled(fake_ee, tree):
+    async def _cancel():
+        task = asyncio.ensure_future(
+            aio.aprune(tree, recursive=True, expand_image_collections=True, concurrency=2)
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_cancel())
+    # The tree was not (fully) deleted: the root is deleted last
+    assert tree in fake_ee.names()
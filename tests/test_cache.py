@@ -0,0 +1,71 @@
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.cache import AssetCache
+
+
+@pytest.fixture
+def tree(fake_ee):
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "table"), "TABLE", updateTime="2024-01-01T00:00:00Z")
+    fake_ee.add(fake_ee.path("root", "ic"), "IMAGE_COLLECTION")
+    for i in range(7):
+        fake_ee.add(fake_ee.path("root", "ic", f"img{i}"), "IMAGE")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AssetCache(tmp_path / "assets.sqlite")
+    yield cache
+    cache.close()
+
+
+def _list(root, cache, **kwargs):
+    return assets.list_assets(
+        root, recursive=True, expand_image_collections=True, cache=cache, page_size=3, **kwargs
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_second_listing_is_served_from_cache(fake_ee, tree, cache, workers):
+    first = _list(tree, cache, workers=workers)
+    fake_ee.calls.clear()
+    second = _list(tree, cache, workers=workers)
+    assert second == first
+    assert fake_ee.calls["listAssets"] == 0
+    assert fake_ee.calls["getAsset"] == 0
+
+
+def test_cache_keeps_update_time(fake_ee, tree, cache):
+    _list(tree, cache)
+    children = list(cache.iter_children(tree))
+    assert children[0]["updateTime"] == "2024-01-01T00:00:00Z"
+
+
+def test_expired_listings_are_refreshed(fake_ee, tree, cache):
+    _list(tree, cache)
+    cache.ttl = 0
+    fake_ee.calls.clear()
+    _list(tree, cache)
+    assert fake_ee.calls["listAssets"] == 4  # root + 3 pages of the collection
+
+
+def test_incomplete_listing_is_not_served(fake_ee, tree, cache):
+    ic = fake_ee.path("root", "ic")
+    iterator = assets.iter_assets(ic, cache=cache, page_size=3)
+    next(iterator)
+    iterator.close()
+    assert not cache.has_children(ic)
+
+
+def test_prune_invalidates_deleted_assets(fake_ee, tree, cache):
+    _list(tree, cache)
+    ic = fake_ee.path("root", "ic")
+    assets.prune(
+        ic, recursive=True, expand_image_collections=True, silent=True, cache=cache
+    )
+    assert not cache.has_children(ic)
+    listed = assets.get_asset_names(_list(tree, cache))
+    assert listed == [fake_ee.path("root", "table")]
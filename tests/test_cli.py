@@ -0,0 +1,89 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox import cli
+from .test_prune import _build_tree
+
+
+@pytest.fixture
+def tree(fake_ee, monkeypatch):
+    monkeypatch.setattr(ee, "Initialize", lambda project=None: None)
+    return _build_tree(fake_ee)
+
+
+def test_ls_json_lines(fake_ee, tree, capsys):
+    assert cli.main(["ls", tree, "-r", "-e", "--json"]) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 4 * 8
+    assert {"name", "type"} <= set(lines[0])
+
+
+def test_prune_requires_confirmation_when_not_interactive(fake_ee, tree, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", open("/dev/null"))
+    assert cli.main(["prune", tree, "-r", "-e"]) == 2
+    assert tree in fake_ee.names()
+
+
+def test_prune_json(fake_ee, tree, capsys):
+    status = cli.main(["--workers", "4", "prune", tree, "-r", "-e", "--yes", "--json", "--qps", "1000"])
+    assert status == 0
+    captured = capsys.readouterr()
+    # Only the results on stdout, summaries go to stderr
+    results = json.loads(captured.out)
+    assert len(results["deleted"]) == 1 + 4 * 8
+    assert "Deleted" in captured.err
+    assert fake_ee.names() == []
+
+
+def test_prune_failure_exit_status(fake_ee, tree, capsys):
+    fake_ee.undeletable.add(fake_ee.path("root", "f0", "table"))
+    assert cli.main(["prune", tree, "-r", "-e", "-y"]) == 1
+
+
+def test_resume_requires_journal(fake_ee, tree, capsys):
+    assert cli.main(["prune", tree, "-y", "--resume"]) == 2
+
+
+def test_cp_and_du(fake_ee, tree, capsys):
+    dst = fake_ee.path("copy")
+    assert cli.main(["cp", tree, dst, "--json"]) == 0
+    assert len(json.loads(capsys.readouterr().out)["copied"]) == 1 + 4 * 8
+    assert cli.main(["du", dst, "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)[dst]["assets"] == 4 * 8
+
+
+def test_help_does_not_import_earth_engine():
+    code = (
+        "import sys\n"
+        "from gee_toolbox import cli\n"
+        "cli.build_parser().parse_args(['ls', 'x'])\n"
+        "assert 'ee' not in sys.modules and 'geetools' not in sys.modules, sorted(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[1])
+
+
+def test_ls_from_cache_does_not_initialize_earth_engine(fake_ee, tree, tmp_path, capsys, monkeypatch):
+    cache = str(tmp_path / "assets.sqlite")
+    initialized = []
+    monkeypatch.setattr(ee, "Initialize", lambda project=None: initialized.append(project))
+    assert cli.main(["--project", "p", "ls", tree, "-r", "--cache", cache]) == 0
+    assert initialized == ["p"]
+    listed = capsys.readouterr().out
+
+    fake_ee.calls.clear()
+    assert cli.main(["ls", tree, "-r", "--cache", cache]) == 0
+    assert initialized == ["p"]
+    assert sum(fake_ee.calls.values()) == 0
+    assert capsys.readouterr().out == listed
+
+
+def test_earth_engine_error_exit_status(fake_ee, tree, capsys):
+    fake_ee.inject("listAssets", ee.EEException("Permission denied."))
+    assert cli.main(["ls", tree]) == 1
+    assert capsys.readouterr().err == "gee-toolbox: error: Permission denied.\n"
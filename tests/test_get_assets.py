@@ -1 +1,271 @@
+import time
+
+import pytest
+
 from .context import gee_toolbox
+from gee_toolbox.gee import assets
+
+
+@pytest.fixture
+def tree(fake_ee):
+    # folder1/
+    #   table
+    #   folder2/
+    #     image_a
+    #   collection/ (12 images)
+    folder1 = fake_ee.add(fake_ee.path("folder1"), "FOLDER")
+    fake_ee.add(fake_ee.path("folder1", "table"), "TABLE")
+    fake_ee.add(fake_ee.path("folder1", "folder2"), "FOLDER")
+    fake_ee.add(fake_ee.path("folder1", "folder2", "image_a"), "IMAGE")
+    fake_ee.add(fake_ee.path("folder1", "collection"), "IMAGE_COLLECTION")
+    for i in range(12):
+        fake_ee.add(fake_ee.path("folder1", "collection", f"img_{i:02d}"), "IMAGE")
+    return folder1
+
+
+def test_iter_assets_follows_page_tokens(fake_ee, tree):
+    collection = fake_ee.path("folder1", "collection")
+    names = assets.get_asset_names(assets.iter_assets(collection, page_size=5))
+    assert len(names) == 12
+    assert fake_ee.calls["listAssets"] == 3
+
+
+def test_iter_assets_is_lazy(fake_ee, tree):
+    collection = fake_ee.path("folder1", "collection")
+    iterator = assets.iter_assets(collection, page_size=5)
+    next(iterator)
+    assert fake_ee.calls["listAssets"] == 1
+
+
+def test_list_assets_recursive_preorder(fake_ee, tree):
+    listed = assets.list_assets(
+        tree, recursive=True, inclusive=True, expand_image_collections=True, page_size=4
+    )
+    names = assets.get_asset_names(listed)
+    assert names[:5] == [
+        tree,
+        fake_ee.path("folder1", "table"),
+        fake_ee.path("folder1", "folder2"),
+        fake_ee.path("folder1", "folder2", "image_a"),
+        fake_ee.path("folder1", "collection"),
+    ]
+    assert len(names) == 17
+
+
+def test_list_assets_filters_types(fake_ee, tree):
+    listed = assets.list_assets(
+        tree, asset_types="image", recursive=True, expand_image_collections=True
+    )
+    assert set(assets.get_asset_types(listed)) == {"IMAGE"}
+    assert len(listed) == 13
+
+
+def test_list_assets_image_collections_exclusively(fake_ee, tree):
+    listed = assets.list_assets(
+        tree,
+        asset_types=["IMAGE"],
+        recursive=True,
+        expand_image_collections=True,
+        image_collections_exclusively=True,
+    )
+    assert len(listed) == 12
+    assert fake_ee.path("folder1", "folder2", "image_a") not in assets.get_asset_names(listed)
+
+
+def test_iter_assets_rejects_non_containers(fake_ee, tree):
+    with pytest.raises(ValueError):
+        assets.iter_assets(fake_ee.path("folder1", "table"))
+
+
+@pytest.fixture
+def wide_tree(fake_ee):
+    # 6 folders, each with a sub-folder, a table and an image collection of 7 images
+    root = fake_ee.add(fake_ee.path("wide"), "FOLDER")
+    for f in range(6):
+        fake_ee.add(fake_ee.path("wide", f"f{f}"), "FOLDER")
+        fake_ee.add(fake_ee.path("wide", f"f{f}", "sub"), "FOLDER")
+        fake_ee.add(fake_ee.path("wide", f"f{f}", "sub", "image"), "IMAGE")
+        fake_ee.add(fake_ee.path("wide", f"f{f}", "table"), "TABLE")
+        fake_ee.add(fake_ee.path("wide", f"f{f}", "ic"), "IMAGE_COLLECTION")
+        for i in range(7):
+            fake_ee.add(fake_ee.path("wide", f"f{f}", "ic", f"img{i}"), "IMAGE")
+    return root
+
+
+@pytest.mark.parametrize("image_collections_exclusively", [False, True])
+def test_concurrent_walk_matches_serial_walk(fake_ee, wide_tree, image_collections_exclusively):
+    kwargs = dict(
+        recursive=True,
+        inclusive=True,
+        expand_image_collections=True,
+        image_collections_exclusively=image_collections_exclusively,
+        page_size=3,
+    )
+    serial = list(assets.iter_assets(wide_tree, workers=1, **kwargs))
+    concurrent = list(assets.iter_assets(wide_tree, workers=4, **kwargs))
+    assert concurrent == serial
+
+
+def test_concurrent_walk_bounds_in_flight_calls(fake_ee, wide_tree):
+    fake_ee.latency = 0.01
+    listed = assets.list_assets(
+        wide_tree, recursive=True, expand_image_collections=True, workers=3
+    )
+    assert len(listed) == 6 * 12
+    assert 1 < fake_ee.max_in_flight <= 3
+
+
+def test_concurrent_walk_can_be_abandoned(fake_ee, wide_tree):
+    iterator = assets.iter_assets(
+        wide_tree, recursive=True, expand_image_collections=True, workers=2
+    )
+    next(iterator)
+    iterator.close()
+    assert fake_ee.in_flight == 0
+
+
+def test_concurrent_lister_bounds_lookahead(fake_ee, wide_tree):
+    # A consumer that never reads past the first container must not cause the whole tree to be listed
+    iterator = assets.iter_assets(
+        wide_tree, recursive=True, expand_image_collections=True, workers=2
+    )
+    next(iterator)
+    time.sleep(0.2)
+    # root + at most 4 x workers look-ahead listings
+    assert fake_ee.calls["listAssets"] <= 1 + 4 * 2
+    iterator.close()
+
+
+def test_concurrent_lister_drops_consumed_listings(fake_ee, wide_tree):
+    lister = assets._ConcurrentLister(3, 2, lambda asset_type: asset_type != "IMAGE")
+    with lister:
+        walk = assets._walk_assets(
+            wide_tree,
+            "FOLDER",
+            assets.ALLOWED_ASSET_TYPES,
+            False,
+            lister._expands,
+            lister.children,
+        )
+        assert len(list(walk)) == 6 * 12
+        assert lister._listings == {}
+        assert lister._queued == {}
+
+
+@pytest.fixture
+def metadata_cache():
+    assets._metadata_cache.clear()
+    yield assets._metadata_cache
+    assets._metadata_cache.clear()
+
+
+def test_get_assets_metadata_deduplicates_and_caches(fake_ee, tree, metadata_cache):
+    table = fake_ee.path("folder1", "table")
+    image = fake_ee.path("folder1", "folder2", "image_a")
+    missing = fake_ee.path("missing")
+
+    metadata = assets.get_assets_metadata([table, image, table, missing], workers=3)
+    assert list(metadata) == [table, image, missing]
+    assert metadata[table]["type"] == "TABLE"
+    assert metadata[missing] is None
+    assert fake_ee.calls["getAsset"] == 3
+
+    assets.get_assets_metadata([table, image])
+    assert fake_ee.calls["getAsset"] == 3
+    assets.get_assets_metadata([table], use_cache=False)
+    assert fake_ee.calls["getAsset"] == 4
+
+
+def test_metadata_cache_is_bounded():
+    cache = assets._LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+
+def test_list_assets_full_records(fake_ee, tree):
+    fake_ee.records[fake_ee.path("folder1", "table")]["sizeBytes"] = "42"
+    listed = assets.list_assets(tree, inclusive=True, full_records=True)
+    assert listed[0]["id"] == tree
+    assert listed[1]["sizeBytes"] == "42"
+
+
+@pytest.fixture
+def dated_collection(fake_ee):
+    # 2 folders, each with a collection of one image per year 2017-2022 and a loose image
+    root = fake_ee.add(fake_ee.path("dated"), "FOLDER")
+    for f in range(2):
+        folder = fake_ee.add(f"{root}/folder{f}", "FOLDER")
+        fake_ee.add(f"{folder}/loose", "IMAGE", startTime="2010-01-01T00:00:00.000Z")
+        collection = fake_ee.add(f"{folder}/collection", "IMAGE_COLLECTION")
+        for year in range(2017, 2023):
+            fake_ee.add(
+                f"{collection}/img_{year}",
+                "IMAGE",
+                startTime=f"{year}-06-01T00:00:00.000Z",
+                properties={"cloud_cover": year - 2010},
+            )
+    return root
+
+
+def test_image_filter_expression():
+    from datetime import date, datetime, timezone
+
+    assert assets._image_filter() is None
+    expression = assets._image_filter(
+        filter="properties.cloud_cover < 10",
+        start_time=date(2019, 1, 1),
+        end_time=datetime(2020, 1, 1, 1, tzinfo=timezone.utc),
+        region={"type": "Point", "coordinates": [0, 0]},
+    )
+    assert expression == (
+        '(properties.cloud_cover < 10) AND startTime >= "2019-01-01T00:00:00.000Z" '
+        'AND startTime < "2020-01-01T01:00:00.000Z" '
+        'AND intersects("{\\"type\\":\\"Point\\",\\"coordinates\\":[0,0]}")'
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_list_assets_filters_images_server_side(fake_ee, dated_collection, workers):
+    listed = assets.list_assets(
+        dated_collection,
+        asset_types="IMAGE",
+        recursive=True,
+        expand_image_collections=True,
+        start_time="2019-01-01",
+        end_time="2021-01-01",
+        filter="properties.cloud_cover != 10",
+        workers=workers,
+    )
+    # Loose images cannot be filtered and are left out
+    assert sorted(assets.get_asset_names(listed)) == [
+        fake_ee.path("dated", f"folder{f}", "collection", "img_2019") for f in range(2)
+    ]
+
+
+def test_prune_filter_requires_images(fake_ee, dated_collection):
+    with pytest.raises(ValueError):
+        assets.prune(
+            dated_collection,
+            recursive=True,
+            expand_image_collections=True,
+            end_time="2020-01-01",
+            silent=True,
+        )
+
+
+def test_prune_images_older_than(fake_ee, dated_collection):
+    results = assets.prune(
+        dated_collection,
+        asset_types="IMAGE",
+        recursive=True,
+        expand_image_collections=True,
+        end_time="2020-01-01",
+        silent=True,
+    )
+    assert len(results["deleted"]) == 2 * 3
+    assert all(int(name[-4:]) < 2020 for name in results["deleted"])
+    assert fake_ee.path("dated", "folder0", "loose") in fake_ee.names()
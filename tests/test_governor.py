@@ -0,0 +1,152 @@
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.governor import (
+    RequestGovernor,
+    is_retryable_error,
+    is_throttling_error,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _flaky(errors):
+    # Raise the given errors in order, then succeed
+    errors = list(errors)
+
+    def _fn():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return _fn
+
+
+def test_error_classification():
+    assert is_throttling_error(ee.EEException("Too many concurrent aggregations."))
+    assert is_retryable_error(ee.EEException("Quota exceeded for quota metric"))
+    assert is_retryable_error(ee.EEException("Service unavailable."))
+    assert is_retryable_error(ConnectionError())
+    assert not is_retryable_error(ee.EEException("Asset 'x' not found."))
+    assert not is_retryable_error(ValueError("Too many concurrent"))
+
+
+def test_retries_transient_errors():
+    clock = FakeClock()
+    governor = RequestGovernor(qps=None, clock=clock, sleep=clock.sleep)
+    fn = _flaky([ee.EEException("Service unavailable.")] * 3)
+    assert governor.call(fn) == "ok"
+    assert governor.retries == 3
+
+
+def test_gives_up_after_max_retries():
+    clock = FakeClock()
+    governor = RequestGovernor(qps=None, max_retries=2, clock=clock, sleep=clock.sleep)
+    with pytest.raises(ee.EEException):
+        governor.call(_flaky([ee.EEException("Service unavailable.")] * 3))
+
+
+def test_does_not_retry_permanent_errors():
+    governor = RequestGovernor(qps=None, sleep=lambda seconds: None)
+    with pytest.raises(ee.EEException):
+        governor.call(_flaky([ee.EEException("Asset 'x' not found."), None]))
+    assert governor.retries == 0
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    governor = RequestGovernor(qps=10, burst=1, clock=clock, sleep=clock.sleep)
+    for _ in range(21):
+        governor.call(lambda: None)
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_throttling_halves_rate_then_recovers():
+    clock = FakeClock()
+    governor = RequestGovernor(qps=40, clock=clock, sleep=clock.sleep)
+    governor.call(_flaky([ee.EEException("Too many concurrent aggregations.")]))
+    assert governor.throttled == 1
+    assert governor.rate < 40
+    for _ in range(200):
+        governor.call(lambda: None)
+    assert governor.rate == 40
+
+
+def test_prune_retries_throttled_deletes(fake_ee, monkeypatch):
+    image = fake_ee.add(fake_ee.path("image"), "IMAGE")
+    delete = fake_ee.deleteAsset
+    errors = [ee.EEException("Too many concurrent requests.")] * 2
+
+    def _delete(asset_id):
+        if errors:
+            raise errors.pop(0)
+        delete(asset_id)
+
+    monkeypatch.setattr(ee.data, "deleteAsset", _delete)
+    results = assets.prune(image, asset_types="IMAGE", silent=True)
+    assert results["deleted"] == [image]
+    assert results["failed"] == []
+
+
+def test_concurrent_throttles_halve_rate_once():
+    clock = FakeClock()
+    governor = RequestGovernor(qps=40, clock=clock, sleep=lambda seconds: None)
+    # Eight calls in flight throttled in the same episode
+    for _ in range(8):
+        governor._on_throttled()
+    assert governor.throttled == 8
+    assert governor.rate == 20
+    clock.now += governor.cooldown
+    governor._on_throttled()
+    assert governor.rate == 10
+
+
+def test_concurrent_throttled_calls_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    governor = RequestGovernor(qps=40, sleep=lambda seconds: None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fns = [_flaky([ee.EEException("Too many concurrent requests.")]) for _ in range(8)]
+        assert list(executor.map(governor.call, fns)) == ["ok"] * 8
+    assert governor.throttled == 8
+    assert governor.rate >= 20
+
+
+def test_throttled_project_root_listing_is_retried(fake_ee):
+    fake_ee.add(fake_ee.path("image"), "IMAGE")
+    fake_ee.inject(
+        "listAssets", ee.EEException("Too many concurrent requests."), after_effect=True
+    )
+    listed = assets.list_assets(fake_ee.project)
+    assert assets.get_asset_names(listed) == [fake_ee.path("image")]
+
+
+def test_prune_retries_throttled_root_metadata(fake_ee):
+    image = fake_ee.add(fake_ee.path("image"), "IMAGE")
+    fake_ee.inject("getAsset", ee.EEException("Too many concurrent requests."))
+    results = assets.prune(image, asset_types="IMAGE", silent=True)
+    assert results["deleted"] == [image]
+
+
+def test_delete_timed_out_after_success_is_reported_deleted(fake_ee):
+    image = fake_ee.add(fake_ee.path("image"), "IMAGE")
+    fake_ee.inject("deleteAsset", ee.EEException("Deadline exceeded."), after_effect=True)
+    results = assets.prune(image, asset_types="IMAGE", silent=True)
+    assert results["deleted"] == [image]
+    assert results["failed"] == []
+    assert fake_ee.calls["deleteAsset"] == 2
+
+
+def test_delete_of_missing_asset_fails(fake_ee):
+    assert not assets._delete_asset(fake_ee.path("missing"))
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.lazy import LazyModule
+
+# Cumulative import time budget of the gee_toolbox modules, in microseconds. About 75 ms here, importing ee and
+# geetools took over a second
+IMPORT_BUDGET_US = 300_000
+
+
+def _import_times(modules: str) -> dict:
+    # Cumulative import time of the top-level imports from python -X importtime, which writes
+    # "import time: self | cumulative | name" lines to stderr, the name indented by two spaces per nesting level
+    # Fails if ee or geetools were imported, directly or by any nested import
+    code = f"import sys\nimport {modules}\nassert 'ee' not in sys.modules and 'geetools' not in sys.modules"
+    run = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parents[1],
+    )
+    assert run.returncode == 0, run.stderr
+    times = {}
+    for line in run.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def test_import_does_not_load_earth_engine():
+    times = _import_times(
+        "gee_toolbox.gee.assets, gee_toolbox.gee.aio, gee_toolbox.gee.transfer, gee_toolbox.gee.acl, "
+        "gee_toolbox.gee.properties, gee_toolbox.gee.metrics, gee_toolbox.gee.snapshot, gee_toolbox.cli"
+    )
+    # Each top-level entry includes everything it imported, e.g. gee_toolbox.gee.assets includes governor and cache
+    total = sum(us for name, us in times.items() if name.startswith("gee_toolbox"))
+    assert total > times["gee_toolbox.gee.assets"]
+    assert total < IMPORT_BUDGET_US, f"import took {total / 1000:.0f} ms"
+
+
+def test_lazy_module():
+    json = LazyModule("json")
+    assert json.dumps([1]) == "[1]"
+    assert "loaded" in repr(json)
+    with pytest.raises(ModuleNotFoundError):
+        LazyModule("not_a_module_name").anything
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "projects/p/assets/folder",
+        "/projects/p/assets/folder/",
+        "projects//p/assets/./folder",
+        "projects/p/assets",
+        "users/me/folder",
+    ],
+)
+def test_asset_path_helpers_match_geetools(path):
+    from geetools.Asset import Asset
+
+    assert assets._asset_id(path) == Asset(path).as_posix()
+    assert assets._is_project(path) == Asset(path).is_project()
+    assert assets.Asset is Asset
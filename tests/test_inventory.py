@@ -0,0 +1,155 @@
+import asyncio
+import sys
+
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import aio, assets
+from gee_toolbox.gee.inventory import AssetIndex, AssetInventory
+
+
+@pytest.fixture
+def tree(fake_ee):
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "table"), "TABLE", sizeBytes="100")
+    fake_ee.add(fake_ee.path("root", "sub"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "sub", "ic"), "IMAGE_COLLECTION")
+    for i in range(5):
+        fake_ee.add(fake_ee.path("root", "sub", "ic", f"img{i}"), "IMAGE", sizeBytes="10")
+    return root
+
+
+def test_list_assets_as_inventory_matches_list(fake_ee, tree):
+    options = dict(recursive=True, inclusive=True, expand_image_collections=True)
+    inventory = assets.list_assets(tree, as_inventory=True, **options)
+    assert isinstance(inventory, AssetInventory)
+    assert len(inventory) == 9
+    assert inventory.to_records() == assets.list_assets(tree, **options)
+    assert inventory[0] == {"name": tree, "type": "FOLDER"}
+    assert inventory[-1]["name"] == fake_ee.path("root", "sub", "ic", "img4")
+    assert inventory[1:3].to_records() == inventory.to_records()[1:3]
+    assert len(inventory[::-1]) == 9 and inventory[::-1][0] == inventory[-1]
+
+
+def test_inventory_keeps_sizes(fake_ee, tree):
+    inventory = assets.list_assets(
+        tree, recursive=True, expand_image_collections=True, full_records=True, as_inventory=True
+    )
+    assert {record["name"]: record.get("sizeBytes") for record in inventory}[fake_ee.path("root", "table")] == "100"
+
+
+def test_inventory_select(fake_ee, tree):
+    inventory = assets.list_assets(tree, recursive=True, expand_image_collections=True, as_inventory=True)
+    depth = assets._asset_depth(tree)
+    assert inventory.depths() == [assets._asset_depth(name) for name in inventory.names()]
+
+    images = inventory.select("IMAGE")
+    assert len(images) == 5 and set(images.types()) == {"IMAGE"}
+    assert inventory.select(["FOLDER", "TABLE"]).names() == [fake_ee.path("root", "table"), fake_ee.path("root", "sub")]
+    assert len(inventory.select(max_depth=depth + 1)) == 2
+    assert inventory.select("IMAGE_COLLECTION", min_depth=depth + 2).names() == [fake_ee.path("root", "sub", "ic")]
+    assert len(inventory.select("IMAGE", max_depth=depth + 2)) == 0
+    assert len(inventory.select()) == len(inventory)
+
+
+def test_inventory_is_smaller_than_dicts():
+    records = [
+        {"name": f"projects/p/assets/folder/collection/image_{i:06d}", "type": "IMAGE"} for i in range(10_000)
+    ]
+    inventory = AssetInventory(records)
+
+    def _size(values):
+        return sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+
+    dicts = _size(records) + sum(_size(list(record.values())) - sys.getsizeof([]) for record in records)
+    compact = _size(inventory._leaf) + sum(
+        sys.getsizeof(column) for column in [inventory._parent, inventory._type, inventory._depth, inventory._size]
+    )
+    assert compact * 3 < dicts
+
+
+def test_inventory_to_arrow_and_pandas(fake_ee, tree):
+    inventory = assets.list_assets(
+        tree, recursive=True, expand_image_collections=True, full_records=True, as_inventory=True
+    )
+    pytest.importorskip("pyarrow")
+    table = inventory.to_arrow()
+    assert table.column_names == ["name", "type", "depth", "size_bytes"]
+    assert table.column("size_bytes").to_pylist().count(None) == 2
+
+    pytest.importorskip("pandas")
+    frame = inventory.to_pandas()
+    assert frame["size_bytes"].sum() == 150
+    assert (frame["type"] == "IMAGE").sum() == 5
+
+
+def test_index_queries(fake_ee, tree):
+    index = AssetIndex(assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True))
+    sub, ic = fake_ee.path("root", "sub"), fake_ee.path("root", "sub", "ic")
+    # A sibling sharing the prefix of sub must not be part of its subtree
+    index = AssetIndex(index.inventory.to_records() + [{"name": sub + "-old", "type": "TABLE"}])
+
+    assert [record["name"] for record in index.subtree(sub)] == [ic] + [f"{ic}/img{i}" for i in range(5)]
+    assert index.subtree(sub, inclusive=True)[0] == {"name": sub, "type": "FOLDER"}
+    assert [record["name"] for record in index.children(tree)] == [
+        fake_ee.path("root", "table"),
+        sub,
+        sub + "-old",
+    ]
+    assert index.children(f"{ic}/img0") == []
+    assert index.ancestors(f"{ic}/img0") == [ic, sub, tree]
+    assert index.type(ic) == "IMAGE_COLLECTION" and index.type(tree + "/missing") is None
+    assert f"/{ic}/" in index
+    assert index.depth(ic) == assets._asset_depth(ic)
+    assert index.levels(sub) == assets._order_by_level([sub, ic] + [f"{ic}/img{i}" for i in range(5)])
+
+
+def test_prune_from_index_does_not_list(fake_ee, tree):
+    index = AssetIndex(
+        assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True, full_records=True)
+    )
+    listed = fake_ee.calls["listAssets"]
+    sub = fake_ee.path("root", "sub")
+
+    dry_run = assets.prune(sub, recursive=True, expand_image_collections=True, dry_run=True, index=index)
+    assert len(dry_run["skipped"]) == 7
+    images = assets.prune(tree, "IMAGE", recursive=True, expand_image_collections=True, silent=True, index=index)
+    assert len(images["deleted"]) == 5
+    results = assets.prune(tree, recursive=True, expand_image_collections=True, silent=True, index=index)
+    assert fake_ee.calls["listAssets"] == listed
+    # Images deleted by the previous prune are gone but still in the index, they count as deleted
+    assert len(results["deleted"]) == 9 and not results["failed"]
+    assert results["deleted"][-1] == tree
+    assert list(fake_ee.records) == [fake_ee.project]
+
+
+def test_prune_from_index_rejects_server_filters(fake_ee, tree):
+    index = AssetIndex(assets.list_assets(tree, recursive=True, expand_image_collections=True))
+    with pytest.raises(ValueError):
+        assets.prune(tree, "IMAGE", recursive=True, expand_image_collections=True, filter="x > 1", index=index)
+    with pytest.raises(ValueError):
+        asyncio.run(
+            aio.aprune(tree, "IMAGE", recursive=True, expand_image_collections=True, filter="x > 1", index=index)
+        )
+
+
+def test_aprune_from_index_does_not_list(fake_ee, tree):
+    index = AssetIndex(assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True))
+    listed = fake_ee.calls["listAssets"]
+    options = dict(recursive=True, expand_image_collections=True)
+    images = asyncio.run(aio.aprune(tree, "IMAGE", index=index, **options))
+    assert len(images["deleted"]) == 5
+    # Images deleted by the previous prune are gone but still in the index, they count as deleted
+    results = asyncio.run(aio.aprune(tree, index=index, **options))
+    assert fake_ee.calls["listAssets"] == listed
+    assert len(results["deleted"]) == 9 and not results["failed"]
+    assert list(fake_ee.records) == [fake_ee.project]
+
+
+def test_prune_from_index_with_duplicate_asset_types(fake_ee, tree):
+    index = AssetIndex(assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True))
+    asset_types = ["IMAGE", "IMAGE", "TABLE", "IMAGE_COLLECTION"]
+    options = dict(recursive=True, expand_image_collections=True, dry_run=True)
+    planned = assets.prune(tree, asset_types, index=index, **options)["skipped"]
+    assert sorted(planned) == sorted(assets.prune(tree, asset_types, **options)["skipped"])
+    assert tree not in planned and fake_ee.path("root", "sub") not in planned
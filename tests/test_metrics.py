@@ -0,0 +1,57 @@
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets, governor as _governor, metrics
+from .test_prune import _build_tree
+
+
+@pytest.fixture
+def recorder():
+    recorder = metrics.enable()
+    yield recorder
+    metrics.disable()
+
+
+def test_metrics_per_method(fake_ee, recorder):
+    tree = _build_tree(fake_ee)
+    fake_ee.inject("deleteAsset", ee.EEException("Too many requests"), times=2)
+    # The table fails, then its non-empty folder and the root
+    fake_ee.undeletable.add(fake_ee.path("root", "f0", "table"))
+    assets.prune(tree, recursive=True, expand_image_collections=True, silent=True, workers=1)
+
+    snapshot = recorder.snapshot()
+    assert snapshot["listAssets"]["count"] == fake_ee.calls["listAssets"]
+    assert snapshot["getAsset"]["count"] == 1
+    delete = snapshot["deleteAsset"]
+    assert delete["count"] == fake_ee.calls["deleteAsset"]
+    assert delete["retries"] == 2
+    assert delete["errors"]["throttled"] == 2 and delete["errors"]["EEException"] == 3
+    assert delete["buckets"]["+Inf"] == delete["count"]
+
+
+def test_prometheus_text(fake_ee, recorder):
+    assets.list_assets(_build_tree(fake_ee), recursive=True)
+    text = recorder.to_prometheus()
+    assert "# TYPE gee_toolbox_ee_call_duration_seconds histogram" in text
+    assert f'gee_toolbox_ee_calls_total{{method="listAssets"}} {fake_ee.calls["listAssets"]}' in text
+    assert 'gee_toolbox_ee_call_duration_seconds_bucket{method="listAssets",le="+Inf"}' in text
+
+
+def test_disabled_by_default(fake_ee):
+    assert _governor._recorder is None
+
+
+def test_opentelemetry_spans(fake_ee, recorder):
+    sdk = pytest.importorskip("opentelemetry.sdk.trace")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    metrics.enable(metrics.OpenTelemetryRecorder(provider.get_tracer("test")))
+
+    assets.list_assets(_build_tree(fake_ee))
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert names == ["ee.data.getAsset", "ee.data.listAssets"]
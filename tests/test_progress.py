@@ -0,0 +1,80 @@
+import io
+import json
+
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets, progress
+from .test_prune import _build_tree
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_progress_events_throttled_by_interval():
+    clock, events = _Clock(), []
+    tracker = progress.Progress("delete", events.append, total=100, interval=1.0, clock=clock)
+    for _ in range(10):
+        clock.now += 0.25
+        tracker.update()
+    tracker.close()
+    # One event per second of clock, plus the final one
+    assert [event["done"] for event in events] == [4, 8, 10]
+    last = events[-1]
+    assert last["finished"] and last["rate"] == pytest.approx(4.0)
+    assert last["eta"] == pytest.approx(90 / 4.0)
+
+
+def test_progress_counts_governor_retries(governor):
+    events = []
+    with progress.Progress("list", events.append) as tracker:
+        calls = iter([ee.EEException("Too many requests"), None])
+
+        def _flaky():
+            error = next(calls)
+            if error:
+                raise error
+
+        governor.call(_flaky)
+        tracker.update()
+    assert events[-1]["retries"] == 1 and events[-1]["throttled"] == 1
+    assert events[-1]["in_flight"] == 0 and events[-1]["total"] is None
+
+
+def test_renderers():
+    event = progress.Progress("delete", lambda e: None, total=8).event(finished=True)
+    stream = io.StringIO()
+    progress.TqdmRenderer(stream)(event)
+    assert stream.getvalue().startswith("\rdelete: 0/8 0% |") and stream.getvalue().endswith("\n")
+
+    stream = io.StringIO()
+    progress.JsonLinesEmitter(stream)(event)
+    assert json.loads(stream.getvalue())["stage"] == "delete"
+
+
+def test_prune_reports_progress(fake_ee):
+    tree = _build_tree(fake_ee)
+    events = []
+    results = assets.prune(
+        tree, recursive=True, expand_image_collections=True, silent=True, progress=events.append
+    )
+    finals = [event for event in events if event["finished"]]
+    assert [event["stage"] for event in finals] == ["list", "delete"]
+    assert finals[0]["done"] == len(results["deleted"])
+    assert finals[1]["done"] == finals[1]["total"] == len(results["deleted"])
+
+
+def test_list_assets_progress_jsonl(fake_ee, tmp_path):
+    tree = _build_tree(fake_ee)
+    path = tmp_path / "progress.jsonl"
+    emitter = progress.JsonLinesEmitter(path)
+    listed = assets.list_assets(tree, recursive=True, progress=emitter)
+    emitter.close()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[-1]["finished"] and lines[-1]["done"] == len(listed)
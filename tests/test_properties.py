@@ -0,0 +1,42 @@
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import properties
+
+
+@pytest.fixture
+def collection(fake_ee):
+    collection = fake_ee.add(fake_ee.path("ic"), "IMAGE_COLLECTION")
+    for i in range(30):
+        fake_ee.add(f"{collection}/img_{i:02d}", "IMAGE", properties={"index": i, "old": True})
+    return collection
+
+
+def test_update_properties_dict(fake_ee, collection):
+    results = properties.update_properties(
+        collection, {"processing_version": 2, "old": None}, workers=4
+    )
+    assert len(results["updated"]) == 30 and results["failed"] == []
+    record = fake_ee.records[f"{collection}/img_07"]
+    assert record["properties"] == {"index": 7, "processing_version": 2}
+
+
+def test_update_properties_function(fake_ee, collection):
+    def _stamp(record):
+        index = record["properties"]["index"]
+        return {"even": True} if index % 2 == 0 else None
+
+    results = properties.update_properties(collection, _stamp)
+    assert len(results["updated"]) == 15 and len(results["skipped"]) == 15
+    assert fake_ee.records[f"{collection}/img_04"]["properties"]["even"] is True
+    assert "even" not in fake_ee.records[f"{collection}/img_05"]["properties"]
+
+
+def test_update_properties_dry_run_and_failures(fake_ee, collection):
+    dry = properties.update_properties(collection, {"a": 1}, dry_run=True)
+    assert len(dry["skipped"]) == 30 and fake_ee.calls["updateAsset"] == 0
+
+    fake_ee.inject("updateAsset", ee.EEException("Permission denied."), times=2)
+    results = properties.update_properties(collection, {"a": 1}, workers=1)
+    assert len(results["failed"]) == 2 and len(results["updated"]) == 28
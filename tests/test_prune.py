@@ -0,0 +1,180 @@
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.journal import PruneJournal
+from .fake_ee import FakeEarthEngine
+
+
+def _build_tree(fake_ee):
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    for f in range(4):
+        fake_ee.add(fake_ee.path("root", f"f{f}"), "FOLDER")
+        fake_ee.add(fake_ee.path("root", f"f{f}", "table"), "TABLE")
+        fake_ee.add(fake_ee.path("root", f"f{f}", "ic"), "IMAGE_COLLECTION")
+        for i in range(5):
+            fake_ee.add(fake_ee.path("root", f"f{f}", "ic", f"img{i}"), "IMAGE")
+    return root
+
+
+@pytest.fixture
+def tree(fake_ee):
+    return _build_tree(fake_ee)
+
+
+def _prune(root, **kwargs):
+    return assets.prune(
+        root, recursive=True, expand_image_collections=True, silent=True, **kwargs
+    )
+
+
+def test_prune_dry_run_deletes_nothing(fake_ee, tree):
+    results = _prune(tree, dry_run=True)
+    assert len(results["skipped"]) == 1 + 4 * 8
+    assert fake_ee.calls["deleteAsset"] == 0
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_prune_deletes_deepest_first(fake_ee, tree, workers):
+    results = _prune(tree, workers=workers)
+    assert results["failed"] == []
+    assert len(results["deleted"]) == 1 + 4 * 8
+    assert fake_ee.names() == []
+    depths = [name.count("/") for name in results["deleted"]]
+    assert depths == sorted(depths, reverse=True)
+
+
+def test_prune_parallel_results_match_serial(monkeypatch):
+    results = {}
+    for workers in [1, 4]:
+        fake_ee = FakeEarthEngine().install(monkeypatch)
+        tree = _build_tree(fake_ee)
+        # Fail one image so both paths report the same partial failure
+        broken = fake_ee.path("root", "f2", "ic", "img3")
+        fake_ee.undeletable.add(broken)
+        results[workers] = _prune(tree, workers=workers)
+
+    assert results[4] == results[1]
+    assert broken in results[1]["failed"]
+
+
+def test_prune_single_asset(fake_ee, tree):
+    table = fake_ee.path("root", "f0", "table")
+    results = assets.prune(table, asset_types="TABLE", silent=True)
+    assert results["deleted"] == [table]
+
+
+def test_prune_resume_from_journal(fake_ee, tree, tmp_path):
+    journal = tmp_path / "prune.jsonl"
+    broken = fake_ee.path("root", "f1", "ic", "img0")
+    fake_ee.undeletable.add(broken)
+    first = _prune(tree, journal=journal)
+    assert broken in first["failed"]
+    assert fake_ee.names()
+
+    # Second run: no listing at all, only the failed assets and their parents are deleted again
+    fake_ee.undeletable.clear()
+    fake_ee.calls.clear()
+    second = _prune(tree, journal=journal, resume=True)
+    assert fake_ee.calls["listAssets"] == 0
+    assert fake_ee.calls["getAsset"] == 0
+    assert fake_ee.calls["deleteAsset"] == len(first["failed"])
+    assert second["failed"] == []
+    assert sorted(second["deleted"]) == sorted(first["deleted"] + first["failed"])
+    assert fake_ee.names() == []
+
+
+def test_prune_resume_counts_unrecorded_deletions(fake_ee, tree, tmp_path):
+    journal = tmp_path / "prune.jsonl"
+    plan = assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True)
+    with PruneJournal(journal) as _journal:
+        _journal.start(tree, "FOLDER", plan)
+    # Interrupted after deleting an image but before recording it
+    fake_ee.deleteAsset(fake_ee.path("root", "f0", "ic", "img0"))
+
+    results = _prune(tree, journal=journal, resume=True)
+    assert results["failed"] == []
+    assert fake_ee.names() == []
+
+
+def test_prune_resume_requires_matching_journal(fake_ee, tree, tmp_path):
+    journal = tmp_path / "prune.jsonl"
+    with pytest.raises(ValueError):
+        _prune(tree, resume=True)
+    _prune(tree, journal=journal, dry_run=True)
+    with PruneJournal(journal) as _journal:
+        _journal.start(fake_ee.path("other"), "FOLDER", [])
+    with pytest.raises(ValueError):
+        _prune(tree, journal=journal, resume=True)
+
+
+def test_prune_fetches_root_metadata_once(fake_ee, tree):
+    _prune(tree, dry_run=True)
+    assert fake_ee.calls["getAsset"] == 1
+
+
+def test_order_by_level_matches_asset_parts():
+    from geetools.Asset import Asset
+
+    names = ["projects/p/assets/a", "projects/p/assets/a/b/c", "projects/p/assets/a/b"]
+    ordered = assets._order_by_level(names)
+    assert list(ordered) == [6, 5, 4]
+    assert all(len(Asset(name).parts) == lvl for lvl in ordered for name in ordered[lvl])
+
+
+def test_planning_100k_assets(benchmark_timer):
+    # Micro-benchmark: planning cost for 100k listed assets, string depth vs geetools Asset parts
+    from geetools.Asset import Asset
+
+    names = [f"projects/p/assets/f{i % 100}/ic{i % 7}/img{i}" for i in range(100_000)]
+    with benchmark_timer() as strings:
+        assets._order_by_level(names)
+    with benchmark_timer() as asset_objects:
+        for name in names:
+            len(Asset(name).parts)
+    print(f"planning 100k assets: {strings.seconds:.3f}s (paths) vs {asset_objects.seconds:.3f}s (Asset)")
+    assert strings.seconds < asset_objects.seconds
+
+
+def test_prune_names_without_listing(fake_ee, tree, tmp_path):
+    plan = assets.get_asset_names(
+        assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True)
+    )
+    manifest = tmp_path / "manifest.txt"
+    # Listing order: every container comes before its children
+    manifest.write_text("\n".join(plan) + "\n")
+    fake_ee.calls.clear()
+
+    assert assets.prune_names(manifest, dry_run=True)["skipped"] == plan
+    # A small buffer deletes containers before all their children are read, they are retried at the end
+    results = assets.prune_names(manifest, silent=True, workers=4, buffer_size=4)
+    assert fake_ee.calls["listAssets"] == 0 and fake_ee.calls["getAsset"] == 0
+    assert results["failed"] == []
+    assert sorted(results["deleted"]) == sorted(plan)
+    assert results["deleted"][-1] == tree
+    assert fake_ee.names() == []
+
+
+def test_prune_names_deletes_deepest_first_in_buffer(fake_ee, tree):
+    images = [fake_ee.path("root", "f0", "ic", f"img{i}") for i in range(5)]
+    results = assets.prune_names(
+        [fake_ee.path("root", "f0", "ic")] + images + [{"name": fake_ee.path("root", "f0", "table")}], silent=True
+    )
+    assert results["deleted"][:5] == images and results["failed"] == []
+    assert fake_ee.calls["deleteAsset"] == 7
+
+
+def test_prune_names_resume_from_journal(fake_ee, tree, tmp_path):
+    journal = tmp_path / "prune.jsonl"
+    names = [fake_ee.path("root", "f1", "ic", f"img{i}") for i in range(5)] + [fake_ee.path("root", "f1", "ic")]
+    fake_ee.undeletable.add(names[2])
+    first = assets.prune_names(names, silent=True, journal=journal)
+    assert first["failed"] == [names[2], names[5]]
+
+    fake_ee.undeletable.clear()
+    fake_ee.calls.clear()
+    second = assets.prune_names(names, silent=True, journal=journal, resume=True)
+    assert fake_ee.calls["deleteAsset"] == 2
+    assert second["failed"] == [] and sorted(second["deleted"]) == sorted(names)
+    with pytest.raises(ValueError):
+        _prune(tree, journal=journal, resume=True)
@@ -0,0 +1,57 @@
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.snapshot import SNAPSHOT_COLUMNS, diff_snapshots, snapshot
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def tree(fake_ee):
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "table"), "TABLE", sizeBytes="100", updateTime="2024-01-01T00:00:00Z")
+    fake_ee.add(fake_ee.path("root", "ic"), "IMAGE_COLLECTION")
+    for i in range(5):
+        fake_ee.add(fake_ee.path("root", "ic", f"img{i}"), "IMAGE", sizeBytes="10")
+    return root
+
+
+def test_snapshot_writes_row_groups(fake_ee, tree, tmp_path):
+    path = tmp_path / "snapshot.parquet"
+    assert snapshot(tree, path, row_group_size=3) == 8
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.schema_arrow.metadata[b"gee_toolbox.parent"] == tree.encode()
+    table = parquet.read()
+    assert table.column_names == SNAPSHOT_COLUMNS
+    assert table.column("name").to_pylist() == assets.get_asset_names(
+        assets.list_assets(tree, recursive=True, inclusive=True, expand_image_collections=True)
+    )
+    assert table.column("size_bytes").to_pylist().count(10) == 5
+
+
+def test_diff_snapshots(fake_ee, tree, tmp_path):
+    a, b = tmp_path / "a.parquet", tmp_path / "b.parquet"
+    snapshot(tree, a)
+    fake_ee.add(fake_ee.path("root", "ic", "img5"), "IMAGE", sizeBytes="10")
+    fake_ee.deleteAsset(fake_ee.path("root", "ic", "img0"))
+    fake_ee.add(fake_ee.path("root", "table"), "TABLE", sizeBytes="200", updateTime="2024-02-01T00:00:00Z")
+    snapshot(tree, b)
+
+    diff = diff_snapshots(a, b)
+    assert diff["added"].column("name").to_pylist() == [fake_ee.path("root", "ic", "img5")]
+    assert diff["added"].column_names == SNAPSHOT_COLUMNS
+    assert diff["removed"].column("name").to_pylist() == [fake_ee.path("root", "ic", "img0")]
+    assert diff["modified"].to_pylist() == [
+        {
+            "name": fake_ee.path("root", "table"),
+            "type_a": "TABLE",
+            "type_b": "TABLE",
+            "update_time_a": "2024-01-01T00:00:00Z",
+            "update_time_b": "2024-02-01T00:00:00Z",
+            "size_bytes_a": 100,
+            "size_bytes_b": 200,
+        }
+    ]
+    assert diff_snapshots(a, a)["modified"].num_rows == 0
@@ -0,0 +1,162 @@
+import ee
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets, transfer
+from gee_toolbox.gee.cache import AssetCache
+from .test_prune import _build_tree
+
+
+@pytest.fixture
+def tree(fake_ee):
+    return _build_tree(fake_ee)
+
+
+def _subtree(fake_ee, root):
+    return sorted(name[len(root) :] for name in fake_ee.names() if name.startswith(root + "/"))
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_copy_tree(fake_ee, tree, workers):
+    dst = fake_ee.path("copy")
+    results = transfer.copy_tree(tree, dst, workers=workers)
+    assert results["failed"] == [] and results["skipped"] == []
+    assert len(results["copied"]) == 1 + 4 * 8
+    assert _subtree(fake_ee, dst) == _subtree(fake_ee, tree)
+    assert fake_ee.records[fake_ee.path("copy", "f0", "ic")]["type"] == "IMAGE_COLLECTION"
+
+
+def test_copy_tree_skips_existing_unless_overwrite(fake_ee, tree):
+    dst = fake_ee.path("copy")
+    transfer.copy_tree(tree, dst)
+    fake_ee.calls.clear()
+    again = transfer.copy_tree(tree, dst)
+    assert again["failed"] == []
+    assert len(again["skipped"]) == 4 * 6
+    overwritten = transfer.copy_tree(tree, dst, overwrite=True)
+    assert len(overwritten["copied"]) == 1 + 4 * 8
+
+
+def test_copy_tree_failed_container_blocks_contents(fake_ee, tree):
+    fake_ee.inject("createAsset", ee.EEException("Permission denied."), times=1)
+    results = transfer.copy_tree(tree, fake_ee.path("copy"), workers=1)
+    # The destination root could not be created, nothing below it is attempted
+    assert len(results["failed"]) == 1 + 4 * 8
+    assert fake_ee.calls["copyAsset"] == 0
+
+
+def test_copy_tree_rejects_destination_inside_source(fake_ee, tree):
+    with pytest.raises(ValueError):
+        transfer.copy_tree(tree, fake_ee.path("root", "f0", "copy"))
+
+
+def test_copy_and_move_tree_drop_destination_listings(fake_ee, tree, tmp_path):
+    cache = AssetCache(tmp_path / "assets.sqlite")
+    dst = fake_ee.path("copy")
+    assert assets.get_asset_names(assets.list_assets(fake_ee.project, cache=cache)) == [tree]
+    transfer.copy_tree(tree, dst, cache=cache)
+    assert assets.get_asset_names(assets.list_assets(fake_ee.project, cache=cache)) == [tree, dst]
+
+    # An existing destination container listed before receiving assets
+    assert assets.list_assets(dst, cache=cache, recursive=True) == assets.list_assets(dst, recursive=True)
+    transfer.move_tree(fake_ee.path("root", "f0", "table"), fake_ee.path("copy", "moved"), cache=cache)
+    assert fake_ee.path("copy", "moved") in assets.get_asset_names(assets.list_assets(dst, cache=cache))
+
+
+def test_move_tree(fake_ee, tree):
+    before = _subtree(fake_ee, tree)
+    dst = fake_ee.path("moved")
+    results = transfer.move_tree(tree, dst, workers=4)
+    assert results["failed"] == [] and results["skipped"] == []
+    assert len(results["moved"]) == 1 + 4 * 8
+    assert _subtree(fake_ee, dst) == before
+    assert tree not in fake_ee.names()
+
+
+def test_move_tree_keeps_sources_not_copied(fake_ee, tree):
+    dst = fake_ee.path("moved")
+    fake_ee.add(dst, "FOLDER")
+    fake_ee.add(fake_ee.path("moved", "f1"), "FOLDER")
+    fake_ee.add(fake_ee.path("moved", "f1", "table"), "TABLE")
+    results = transfer.move_tree(tree, dst)
+    table = fake_ee.path("root", "f1", "table")
+    assert table in results["skipped"]
+    # The table and the folders above it stay in place
+    assert {table, fake_ee.path("root", "f1"), tree} <= set(fake_ee.names())
+    assert fake_ee.path("root", "f0") not in fake_ee.names()
+
+
+def _stamp(fake_ee, when="2024-01-01T00:00:00Z"):
+    for record in fake_ee.records.values():
+        record["updateTime"] = when
+
+
+def test_sync_tree_copies_only_changes(fake_ee, tree):
+    _stamp(fake_ee)
+    dst = fake_ee.path("mirror")
+    first = transfer.sync_tree(tree, dst, workers=4)
+    assert len(first["copied"]) == 1 + 4 * 8
+    assert _subtree(fake_ee, dst) == _subtree(fake_ee, tree)
+
+    # One image updated, one table added
+    image = fake_ee.path("root", "f2", "ic", "img1")
+    fake_ee.records[image]["updateTime"] = "2024-06-01T00:00:00Z"
+    fake_ee.add(fake_ee.path("root", "f3", "new_table"), "TABLE", updateTime="2024-06-01T00:00:00Z")
+    fake_ee.calls.clear()
+    second = transfer.sync_tree(tree, dst, workers=4)
+    assert sorted(second["copied"]) == sorted([image, fake_ee.path("root", "f3", "new_table")])
+    assert second["failed"] == [] and second["deleted"] == []
+    assert fake_ee.calls["copyAsset"] == 2
+    assert fake_ee.calls["createAsset"] == 0
+
+
+def test_sync_tree_deletes_extraneous(fake_ee, tree):
+    _stamp(fake_ee)
+    dst = fake_ee.path("mirror")
+    transfer.sync_tree(tree, dst)
+    extra = fake_ee.add(fake_ee.path("mirror", "f0", "extra"), "FOLDER")
+    fake_ee.add(f"{extra}/table", "TABLE")
+
+    kept = transfer.sync_tree(tree, dst)
+    assert kept["deleted"] == [] and extra in fake_ee.names()
+
+    dry = transfer.sync_tree(tree, dst, delete_extraneous=True, dry_run=True)
+    assert sorted(dry["skipped"]) == [extra, f"{extra}/table"]
+    assert extra in fake_ee.names()
+
+    pruned = transfer.sync_tree(tree, dst, delete_extraneous=True)
+    assert pruned["deleted"] == [f"{extra}/table", extra]
+    assert _subtree(fake_ee, dst) == _subtree(fake_ee, tree)
+
+
+def test_sync_tree_drops_destination_listings(fake_ee, tree, tmp_path):
+    _stamp(fake_ee)
+    cache = AssetCache(tmp_path / "assets.sqlite")
+    dst = fake_ee.path("mirror")
+    assets.list_assets(fake_ee.project, cache=cache)
+    transfer.sync_tree(tree, dst, cache=cache)
+    assert dst in assets.get_asset_names(assets.list_assets(fake_ee.project, cache=cache))
+    assert assets.list_assets(dst, recursive=True, cache=cache) == assets.list_assets(dst, recursive=True)
+
+
+def test_sync_tree_replaces_destination_of_another_type(fake_ee, tree):
+    _stamp(fake_ee)
+    dst = fake_ee.path("mirror")
+    transfer.sync_tree(tree, dst)
+    # A table where the source has a folder, and a folder where the source has a table
+    fake_ee.deleteAsset(fake_ee.path("mirror", "f0", "table"))
+    fake_ee.add(fake_ee.path("mirror", "f0", "table"), "FOLDER")
+    fake_ee.add(fake_ee.path("mirror", "f0", "table", "inner"), "TABLE")
+    transfer.move_tree(fake_ee.path("mirror", "f1"), fake_ee.path("mirror", "moved"))
+    fake_ee.add(fake_ee.path("mirror", "f1"), "TABLE")
+
+    results = transfer.sync_tree(tree, dst)
+    assert results["failed"] == []
+    assert sorted(results["copied"]) == sorted(
+        [fake_ee.path("root", "f0", "table")] + [name for name in fake_ee.names() if "/root/f1" in name]
+    )
+    assert fake_ee.path("mirror", "f1") in results["deleted"]
+    assert fake_ee.path("mirror", "f0", "table", "inner") in results["deleted"]
+    assert [name for name in _subtree(fake_ee, dst) if not name.startswith("/moved")] == _subtree(fake_ee, tree)
+    assert fake_ee.records[fake_ee.path("mirror", "f1")]["type"] == "FOLDER"
+    assert fake_ee.records[fake_ee.path("mirror", "f0", "table")]["type"] == "TABLE"
@@ -0,0 +1,68 @@
+import csv
+
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import assets
+from gee_toolbox.gee.cache import AssetCache
+from gee_toolbox.gee.usage import usage_report
+
+
+@pytest.fixture
+def tree(fake_ee):
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "table"), "TABLE", sizeBytes="100")
+    fake_ee.add(fake_ee.path("root", "sub"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "sub", "ic"), "IMAGE_COLLECTION")
+    for i in range(5):
+        fake_ee.add(fake_ee.path("root", "sub", "ic", f"img{i}"), "IMAGE", sizeBytes="10")
+    fake_ee.add(fake_ee.path("root", "empty"), "FOLDER")
+    assets._metadata_cache.clear()
+    return root
+
+
+def test_usage_report_aggregates_up_the_hierarchy(fake_ee, tree):
+    report = usage_report(tree, workers=2)
+    assert report[tree]["assets"] == 9
+    assert report[tree]["bytes"] == 150
+    assert report[tree]["IMAGE"] == 5
+    assert report[fake_ee.path("root", "sub")]["bytes"] == 50
+    assert report[fake_ee.path("root", "sub", "ic")]["IMAGE"] == 5
+    assert report[fake_ee.path("root", "empty")]["assets"] == 0
+
+
+def test_usage_report_fetches_missing_sizes(fake_ee, tree):
+    fake_ee.list_fields = {"name", "id", "type"}
+    report = usage_report(tree, workers=2)
+    assert report[tree]["bytes"] == 150
+    assert fake_ee.calls["getAsset"] == 1 + 6
+
+
+def test_usage_report_to_csv(fake_ee, tree, tmp_path):
+    path = tmp_path / "usage.csv"
+    usage_report(tree, path=path)
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["container"] == tree
+    assert rows[0]["bytes"] == "150"
+
+
+def test_usage_report_to_parquet(fake_ee, tree, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "usage.parquet"
+    usage_report(tree, path=path)
+    assert pq.read_table(path).num_rows == 4
+
+
+def test_prune_warning_shows_bytes_to_free(fake_ee, tree, capsys):
+    assets.prune(tree, recursive=True, expand_image_collections=True, dry_run=True)
+    assert "-Storage to be freed: 150 B" in capsys.readouterr().out
+
+
+def test_prune_warning_omits_unknown_storage(fake_ee, tree, tmp_path, capsys):
+    cache = AssetCache(tmp_path / "assets.sqlite")
+    assets.list_assets(tree, recursive=True, expand_image_collections=True, cache=cache)
+    capsys.readouterr()
+    # Cached listings have no sizeBytes, the size to free is not known rather than 0 B
+    assets.prune(tree, recursive=True, expand_image_collections=True, dry_run=True, cache=cache)
+    assert "Storage to be freed" not in capsys.readouterr().out
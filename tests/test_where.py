@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+
+import asyncio
+
+import pytest
+
+from .context import gee_toolbox
+from gee_toolbox.gee import aio, assets, where
+
+
+@pytest.fixture
+def tree(fake_ee):
+    # root/
+    #   tmp_a/ (folder with a table)
+    #   keep/ (folder with a collection of 4 images, updated 2019-2022, tagged by parity)
+    root = fake_ee.add(fake_ee.path("root"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "tmp_a"), "FOLDER")
+    fake_ee.add(fake_ee.path("root", "tmp_a", "table"), "TABLE")
+    fake_ee.add(fake_ee.path("root", "keep"), "FOLDER")
+    collection = fake_ee.add(fake_ee.path("root", "keep", "ic"), "IMAGE_COLLECTION")
+    for i, year in enumerate(range(2019, 2023)):
+        fake_ee.add(
+            f"{collection}/img_{year}",
+            "IMAGE",
+            updateTime=f"{year}-01-01T00:00:00.123456789Z",
+            sizeBytes=str(1000 * (i + 1)),
+            properties={"even": year % 2 == 0},
+        )
+    # listAssets records carry no properties, like the default view
+    fake_ee.list_fields = {"name", "id", "type", "updateTime", "sizeBytes"}
+    return root
+
+
+def _prune(root, **kwargs):
+    return assets.prune(root, recursive=True, expand_image_collections=True, silent=True, **kwargs)
+
+
+def test_predicate_spec():
+    select = where.predicate(
+        {"regex": r"img_\d+$", "updated_before": "2021-01-01", "min_bytes": 100}
+    )
+    assert select({"name": "a/img_1", "updateTime": "2020-05-01T00:00:00Z", "sizeBytes": "200"})
+    assert not select({"name": "a/img_1", "updateTime": "2021-05-01T00:00:00Z", "sizeBytes": "200"})
+    assert not select({"name": "a/img_1", "sizeBytes": "200"})
+
+
+def test_predicate_age():
+    select = where.predicate({"updated_before": timedelta(days=30)})
+    old = datetime.now(timezone.utc) - timedelta(days=31)
+    assert select({"name": "a", "updateTime": old.isoformat()})
+    assert not select({"name": "a", "updateTime": datetime.now(timezone.utc).isoformat()})
+
+
+def test_predicate_rejects_unknown_keys():
+    with pytest.raises(ValueError):
+        where.predicate({"older_than": 3})
+
+
+def test_prune_where_selects_container_with_all_contents(fake_ee, tree):
+    # The glob matches tmp_a and its table
+    results = _prune(tree, where={"name": "*/tmp_*"})
+    assert results["deleted"] == [fake_ee.path("root", "tmp_a", "table"), fake_ee.path("root", "tmp_a")]
+    assert fake_ee.path("root", "keep", "ic", "img_2019") in fake_ee.names()
+
+
+def test_prune_where_keeps_container_with_unselected_contents(fake_ee, tree):
+    # The regex matches the folder but not the table in it
+    results = _prune(tree, where={"regex": "tmp_a$"})
+    assert results["deleted"] == [] and fake_ee.path("root", "tmp_a", "table") in fake_ee.names()
+
+
+def test_prune_where_keeps_old_folder_with_fresh_contents(fake_ee, tree):
+    fresh = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    old = fake_ee.add(fake_ee.path("root", "old"), "FOLDER", updateTime="2019-01-01T00:00:00Z")
+    collection = fake_ee.add(f"{old}/ic", "IMAGE_COLLECTION", updateTime="2019-01-01T00:00:00Z")
+    fake_ee.add(f"{collection}/fresh", "IMAGE", updateTime=fresh)
+    fake_ee.add(f"{collection}/stale", "IMAGE", updateTime="2019-01-01T00:00:00Z")
+    fake_ee.add(f"{old}/table", "TABLE", updateTime=fresh)
+    fake_ee.records[tree]["updateTime"] = fresh
+
+    results = _prune(tree, where={"updated_before": timedelta(days=30)})
+    assert f"{collection}/stale" in results["deleted"]
+    assert {f"{collection}/fresh", f"{old}/table", collection, old} <= set(fake_ee.names())
+    assert not {collection, old} & set(results["deleted"])
+
+
+def test_prune_where_updated_before(fake_ee, tree):
+    results = _prune(tree, asset_types="IMAGE", where={"updated_before": datetime(2021, 6, 1)})
+    assert sorted(name[-4:] for name in results["deleted"]) == ["2019", "2020", "2021"]
+
+
+def test_prune_where_properties_fetches_metadata(fake_ee, tree):
+    results = _prune(tree, asset_types="IMAGE", where={"properties": {"even": True}})
+    assert sorted(name[-4:] for name in results["deleted"]) == ["2020", "2022"]
+    # Properties are not in the listing, each image is fetched once
+    assert fake_ee.calls["getAsset"] == 1 + 4
+
+
+def test_prune_where_properties_pushed_to_server(fake_ee, tree):
+    results = _prune(
+        tree, asset_types="IMAGE", start_time="2000-01-01", where={"properties": {"even": True}}
+    )
+    assert results["deleted"] == []
+    # Images have no startTime: the server filter matches nothing, so no metadata is fetched
+    assert fake_ee.calls["getAsset"] == 1
+
+
+def test_prune_where_function(fake_ee, tree):
+    results = _prune(
+        tree, asset_types=["IMAGE", "TABLE"], where=lambda record: int(record.get("sizeBytes") or 0) >= 3000
+    )
+    assert sorted(name[-4:] for name in results["deleted"]) == ["2021", "2022"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(where={"name": "*/tmp_*"}),
+        dict(where={"regex": "tmp_a$"}),
+        dict(asset_types="IMAGE", where={"updated_before": datetime(2021, 6, 1)}),
+        dict(asset_types="IMAGE", where={"properties": {"even": True}}),
+        dict(asset_types="IMAGE", start_time="2000-01-01", where={"properties": {"even": True}}),
+    ],
+)
+def test_aprune_where_matches_prune(fake_ee, tree, options):
+    planned = _prune(tree, dry_run=True, **options)["skipped"]
+    results = asyncio.run(aio.aprune(tree, recursive=True, expand_image_collections=True, dry_run=True, **options))
+    assert results["skipped"] == planned
+
+
+def test_aprune_where_properties_pushed_to_server(fake_ee, tree):
+    results = asyncio.run(
+        aio.aprune(
+            tree,
+            "IMAGE",
+            recursive=True,
+            expand_image_collections=True,
+            start_time="2000-01-01",
+            where={"properties": {"even": True}},
+        )
+    )
+    assert results["deleted"] == []
+    assert fake_ee.calls["getAsset"] == 1